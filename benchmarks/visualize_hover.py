@@ -0,0 +1,41 @@
+"""Times the build of evaluation scatter plots on large datasets.
+
+Usage: python benchmarks/visualize_hover.py [n_points]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from streamlit_prophet.lib.exposition.visualize import plot_truth_vs_actual_scatter
+
+STYLE = {"colors": ["#002244", "#ff0066", "#66cccc", "#ff9933", "#337788"], "color_axis": "#000000"}
+
+
+def make_eval_df(n_points: int, n_folds: int) -> pd.DataFrame:
+    """Returns a random evaluation dataframe with hourly dates."""
+    rng = np.random.default_rng(42)
+    eval_df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2000-01-01", periods=n_points, freq="H"),
+            "truth": rng.normal(size=n_points),
+            "forecast": rng.normal(size=n_points),
+        }
+    )
+    eval_df["Fold"] = [f"Fold {i + 1}" for i in np.arange(n_points) * n_folds // n_points]
+    return eval_df
+
+
+def time_chart_build(eval_df: pd.DataFrame, use_cv: bool) -> float:
+    """Returns the time needed to build and serialize the scatter plot, in seconds."""
+    start = time.perf_counter()
+    fig = plot_truth_vs_actual_scatter(eval_df.copy(), use_cv, STYLE)
+    fig.to_json()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for cv in [False, True]:
+        duration = time_chart_build(make_eval_df(n, 5), cv)
+        print(f"Scatter plot on {n} points (use_cv={cv}): {duration:.2f}s")
@@ -1,5 +1,7 @@
 from typing import Any, Dict, List
 
+import time
+
 import streamlit as st
 from streamlit_prophet.lib.dataprep.clean import clean_df
 from streamlit_prophet.lib.dataprep.format import (
@@ -14,13 +16,20 @@ from streamlit_prophet.lib.dataprep.format import (
     resample_df,
 )
 from streamlit_prophet.lib.dataprep.split import get_train_set, get_train_val_sets
-from streamlit_prophet.lib.exposition.export import display_links, display_save_experiment_button
-from streamlit_prophet.lib.exposition.visualize import (
-    plot_components,
-    plot_future,
-    plot_overview,
-    plot_performance,
+from streamlit_prophet.lib.exposition.admin import display_admin_view
+from streamlit_prophet.lib.exposition.experiments import (
+    display_experiment,
+    display_experiments_leaderboard,
+    display_store_experiment_button,
+)
+from streamlit_prophet.lib.exposition.export import (
+    display_dataframe_download_link,
+    display_links,
+    display_save_experiment_button,
+    get_available_data_formats,
+    get_experiment_specs,
 )
+from streamlit_prophet.lib.exposition.tuning import display_tuning
 from streamlit_prophet.lib.inputs.dataprep import input_cleaning, input_dimensions, input_resampling
 from streamlit_prophet.lib.inputs.dataset import (
     input_columns,
@@ -29,6 +38,7 @@ from streamlit_prophet.lib.inputs.dataset import (
 )
 from streamlit_prophet.lib.inputs.dates import (
     input_cv,
+    input_cv_early_stopping,
     input_forecast_dates,
     input_train_dates,
     input_val_dates,
@@ -41,7 +51,10 @@ from streamlit_prophet.lib.inputs.params import (
     input_regressors,
     input_seasonality_params,
 )
-from streamlit_prophet.lib.models.prophet import forecast_workflow
+from streamlit_prophet.lib.inputs.tuning import input_tuning
+from streamlit_prophet.lib.models.screening import screen_regressors
+from streamlit_prophet.lib.models.tuning import set_tuned_defaults
+from streamlit_prophet.lib.utils.cache import get_shared_cache
 from streamlit_prophet.lib.utils.load import load_config, load_image
 
 # Page config
@@ -51,11 +64,17 @@ st.set_page_config(page_title="Prophet", layout="wide")
 config, instructions, readme = load_config(
     "config_streamlit.toml", "config_instructions.toml", "config_readme.toml"
 )
+config = set_tuned_defaults(config, st.session_state.get("tuned_params", dict()))
+get_shared_cache().set_max_memory(config["cache"]["max_memory_mb"])
 
 # Initialization
 dates: Dict[Any, Any] = dict()
 report: List[Dict[str, Any]] = []
 
+# Admin view, displayed with ?admin=true in the app url
+if config["cache"]["admin_view"] and st.experimental_get_query_params().get("admin") == ["true"]:
+    display_admin_view(config, readme)
+
 # Info
 with st.expander(
     "Streamlit app to build a time series forecasting model in a few clicks", expanded=False
@@ -75,6 +94,11 @@ with st.sidebar.expander("Dataset", expanded=True):
     df, empty_cols = remove_empty_cols(df)
     print_empty_cols(empty_cols)
 
+# Saved experiments are displayed without any data preparation or model fitting
+if "experiment" in load_options:
+    display_experiment(load_options["experiment"], config, readme, report)
+    st.stop()
+
 # Column names
 with st.sidebar.expander("Columns", expanded=True):
     date_col, target_col = input_columns(config, readme, df, load_options)
@@ -139,11 +163,17 @@ if evaluate:
         dates = input_train_dates(df, use_cv, config, resampling, dates)
         if use_cv:
             dates = input_cv(dates, resampling, config, readme)
+            dates = input_cv_early_stopping(dates, config, readme)
             datasets = get_train_set(df, dates, datasets)
         else:
             dates = input_val_dates(df, dates, config)
             datasets = get_train_val_sets(df, dates, config, datasets)
 
+    # Hyperparameters tuning
+    if use_cv:
+        with st.sidebar.expander("Tuning", expanded=False):
+            tuning = input_tuning(config, params, readme)
+
     # Performance metrics
     with st.sidebar.expander("Metrics", expanded=False):
         eval = input_metrics(readme, config)
@@ -155,6 +185,12 @@ if evaluate:
 else:
     use_cv = False
 
+# Regressors pre-screening on training data
+if 0 < params["screening"]["budget"] < len(params["regressors"]):
+    params, screening_ranking = screen_regressors(params, datasets["train"] if evaluate else df)
+    with st.sidebar.expander("Regressors screening", expanded=False):
+        st.dataframe(screening_ranking)
+
 st.sidebar.title("4. Forecast")
 
 # Choose whether or not to do future forecasts
@@ -169,12 +205,32 @@ if make_future_forecast:
             datasets, dates, params, dimensions, load_options, date_col
         )
 
+# Hyperparameters tuning
+if evaluate and use_cv:
+    display_tuning(tuning, params, config, dates, resampling, datasets, readme)
+
+# Stored experiments
+experiment = display_experiments_leaderboard(config, readme)
+
+# Modelling and visualization modules import prophet and plotly, so they are only imported
+# once the user reaches the stage that needs them, to speed up the first display of the app
+if experiment is not None:
+    # Stored results are displayed without any model fitting
+    report = display_experiment(experiment, config, readme, report)
+
 # Launch training & forecast
-if st.checkbox(
+elif st.checkbox(
     "Launch forecast",
     value=False,
     help=readme["tooltips"]["launch_forecast"],
 ):
+    from streamlit_prophet.lib.exposition.jobs import run_forecast_job
+    from streamlit_prophet.lib.exposition.visualize import plot_results
+    from streamlit_prophet.lib.models.prophet import (
+        FUTURE_FIT_DESCRIPTIONS,
+        forecast_workflow,
+        get_future_fit_path,
+    )
 
     if not (evaluate | make_future_forecast):
         st.error("Please check at least 'Evaluation' or 'Forecast' in the sidebar.")
@@ -182,9 +238,18 @@ if st.checkbox(
     track_experiments = st.checkbox(
         "Track experiments", value=False, help=readme["tooltips"]["track_experiments"]
     )
+    if track_experiments:
+        data_formats = get_available_data_formats()
+        data_format = st.selectbox(
+            "Format of exported datasets",
+            data_formats,
+            index=data_formats.index(config["export"]["data_format"])
+            if config["export"]["data_format"] in data_formats
+            else 0,
+            help=readme["tooltips"]["export_data_format"],
+        )
 
-    datasets, models, forecasts = forecast_workflow(
-        config,
+    workflow_args = (
         use_cv,
         make_future_forecast,
         evaluate,
@@ -199,49 +264,51 @@ if st.checkbox(
         dimensions,
         load_options,
     )
+    if config["jobs"]["background"]:
+        (datasets, models, forecasts), duration = run_forecast_job(config, readme, *workflow_args)
+    else:
+        start_time = time.perf_counter()
+        datasets, models, forecasts = forecast_workflow(config, *workflow_args)
+        duration = round(time.perf_counter() - start_time, 3)
+    timings = {"training_and_forecast": duration}
+    if make_future_forecast:
+        st.caption(FUTURE_FIT_DESCRIPTIONS[get_future_fit_path(models)])
 
     # Visualizations
+    report = plot_results(
+        use_cv,
+        make_future_forecast,
+        evaluate,
+        track_experiments,
+        target_col,
+        datasets,
+        models,
+        forecasts,
+        dates,
+        eval if evaluate else dict(),
+        resampling,
+        cleaning,
+        df,
+        config,
+        readme,
+        report,
+    )
 
-    if evaluate | make_future_forecast:
-        st.write("# 1. Overview")
-        report = plot_overview(
-            make_future_forecast, use_cv, models, forecasts, target_col, cleaning, readme, report
-        )
-
-    if evaluate:
-        st.write(
-            f'# 2. Evaluation on {"CV" if use_cv else ""} {eval["set"].lower()} set{"s" if use_cv else ""}'
-        )
-        report = plot_performance(
-            use_cv, target_col, datasets, forecasts, dates, eval, resampling, config, readme, report
-        )
-
-    if evaluate | make_future_forecast:
-        st.write(
-            "# 3. Impact of components and regressors"
-            if evaluate
-            else "# 2. Impact of components and regressors"
-        )
-        report = plot_components(
+    # Save experiment
+    if track_experiments:
+        specs = get_experiment_specs(
             use_cv,
             make_future_forecast,
-            target_col,
-            models,
-            forecasts,
+            evaluate,
             cleaning,
             resampling,
-            config,
-            readme,
-            df,
-            report,
+            params,
+            dates,
+            date_col,
+            target_col,
+            dimensions,
         )
-
-    if make_future_forecast:
-        st.write("# 4. Future forecast" if evaluate else "# 3. Future forecast")
-        report = plot_future(models, forecasts, dates, target_col, cleaning, readme, report)
-
-    # Save experiment
-    if track_experiments:
+        specs["evaluation"] = eval if evaluate else dict()
         display_save_experiment_button(
             report,
             config,
@@ -255,4 +322,23 @@ if st.checkbox(
             date_col,
             target_col,
             dimensions,
+            data_format,
+            {
+                "specs": specs,
+                "models": models,
+                "datasets": datasets,
+                "forecasts": forecasts,
+                "df": df,
+            },
+        )
+        display_store_experiment_button(
+            specs, datasets, models, forecasts, df, timings, load_options, config, readme
         )
+        for x in report:
+            if x["type"] == "dataset" and x["name"] in ["eval_data", "future_forecast"]:
+                display_dataframe_download_link(
+                    x["object"],
+                    x["name"],
+                    f"Download {x['name'].replace('_', ' ')}",
+                    data_format=data_format,
+                )
@@ -3,7 +3,7 @@
 import typer
 from rich.console import Console
 from streamlit_prophet import __version__
-from streamlit_prophet.cli import deploy
+from streamlit_prophet.cli import deploy, serve
 
 app = typer.Typer(
     name="streamlit_prophet",
@@ -11,6 +11,7 @@ app = typer.Typer(
     add_completion=True,
 )
 app.add_typer(deploy.app, name="deploy")
+app.command(name="serve")(serve.serve)
 console = Console()
 
 
@@ -19,3 +20,17 @@ def version_callback(value: bool):
     if value:
         console.print(f"[yellow]streamlit_prophet[/] version: [bold blue]{__version__}[/]")
         raise typer.Exit()
+
+
+@app.callback()
+def main(
+    print_version: bool = typer.Option(
+        False,
+        "-v",
+        "--version",
+        callback=version_callback,
+        is_eager=True,
+        help="Prints the version of the streamlit_prophet package.",
+    ),
+) -> None:
+    """`streamlit_prophet` is a Python cli/package"""
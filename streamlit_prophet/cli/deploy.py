@@ -1,17 +1,50 @@
+import time
+
 import typer
 from rich.console import Console
-from streamlit_prophet.app import deploy_streamlit, deploy_streamlit_with_base_path
 
 app = typer.Typer()
 console = Console()
 
 
+def run_warm_up() -> None:
+    """Warms up heavy modules and Stan backend before the server starts, and logs timings."""
+    from streamlit_prophet.lib.utils.warmup import warm_up
+
+    console.print("[yellow]Warming up[/] Prophet backend and heavy modules...")
+    start = time.perf_counter()
+    try:
+        timings = warm_up()
+    except Exception as e:  # The dashboard can still be deployed, first fit will just be slower
+        console.print(f"[red]Warm-up failed[/]: {e}")
+        return
+    for step, duration in timings.items():
+        console.print(f"  {step}: [bold blue]{duration:.2f}s[/]")
+    console.print(f"[yellow]Warm-up done[/] in [bold blue]{time.perf_counter() - start:.2f}s[/]")
+
+
 @app.command()
-def dashboard() -> None:
+def dashboard(
+    warm_up: bool = typer.Option(
+        True, help="Preload Prophet Stan backend and heavy modules before starting the server."
+    )
+) -> None:
     """Deploys the streamlit dashboard."""
+    from streamlit_prophet.app import deploy_streamlit
+
+    if warm_up:
+        run_warm_up()
     deploy_streamlit()
 
 @app.command()
-def dashboard_with_base_path() -> None:
+def dashboard_with_base_path(
+    warm_up: bool = typer.Option(
+        True, help="Preload Prophet Stan backend and heavy modules before starting the server."
+    )
+) -> None:
     """Deploys the streamlit dashboard with a base path."""
-    deploy_streamlit_with_base_path()
\ No newline at end of file
+    from streamlit_prophet.app import deploy_streamlit_with_base_path
+
+    if warm_up:
+        run_warm_up()
+    deploy_streamlit_with_base_path()
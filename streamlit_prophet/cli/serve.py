@@ -0,0 +1,44 @@
+from typing import List, Optional
+
+from pathlib import Path
+
+import toml
+import typer
+from rich.console import Console
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "config_streamlit.toml"
+
+console = Console()
+
+
+def serve(
+    zip_files: List[Path] = typer.Option(
+        [], "--zip", help="Experiment zip file exported from the dashboard (can be repeated)."
+    ),
+    store: Optional[Path] = typer.Option(
+        None, help="Experiment store directory, the one of the config by default."
+    ),
+    host: Optional[str] = typer.Option(
+        None, help="Host to bind, the one of the config by default."
+    ),
+    port: Optional[int] = typer.Option(
+        None, help="Port to bind, the one of the config by default."
+    ),
+) -> None:
+    """Serves forecasts of stored or exported models over HTTP."""
+    from streamlit_prophet.lib.models.serving import ModelPool, make_server
+
+    config = toml.load(CONFIG_PATH)
+    store_path = Path(config["experiments"]["store_path"] if store is None else store).expanduser()
+    pool = ModelPool(store_path, zip_files, config["serving"]["max_models"])
+    server = make_server(pool, config["serving"], host, port)
+    console.print(
+        f"[yellow]Serving[/] {len(pool.list_models())} models on "
+        f"[bold blue]http://{server.server_address[0]}:{server.server_address[1]}[/]"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
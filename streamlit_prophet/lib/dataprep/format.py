@@ -276,7 +276,9 @@ def _format_regressors(df: pd.DataFrame, config: Dict[Any, Any]) -> Tuple[pd.Dat
         if df[col].nunique(dropna=False) < 2:
             cols_to_drop.append(col)
         elif df[col].nunique(dropna=False) == 2:
-            df[col] = df[col].map(dict(zip(df[col].unique(), [0, 1])))
+            df[col] = pd.to_numeric(
+                df[col].map(dict(zip(df[col].unique(), [0, 1]))), downcast="integer"
+            )
         elif df[col].nunique() <= config["validity"]["max_cat_reg_cardinality"]:
             df = __one_hot_encoding(df, col)
         else:
@@ -289,6 +291,7 @@ def _format_regressors(df: pd.DataFrame, config: Dict[Any, Any]) -> Tuple[pd.Dat
 
 def __one_hot_encoding(df: pd.DataFrame, col: str) -> pd.DataFrame:
     """Applies one-hot encoding to some columns of input dataframe.
+    Dummies are stored as int8, and only converted to float by Prophet when fitting the model.
 
     Parameters
     ----------
@@ -302,7 +305,7 @@ def __one_hot_encoding(df: pd.DataFrame, col: str) -> pd.DataFrame:
     pd.DataFrame
         One-hot encoded dataframe.
     """
-    df = pd.concat([df, pd.get_dummies(df[col], prefix=col)], axis=1)
+    df = pd.concat([df, pd.get_dummies(df[col], prefix=col, dtype=np.int8)], axis=1)
     return df.drop(col, axis=1)
 
 
@@ -388,7 +391,30 @@ def resample_df(df_input: pd.DataFrame, resampling: Dict[Any, Any]) -> pd.DataFr
         cols_to_agg = set(df.columns) - {"ds", "y"}
         agg_dict = {col: "mean" if df[col].nunique() > 2 else "max" for col in cols_to_agg}
         agg_dict["y"] = resampling["agg"].lower()
+        int8_cols = [col for col in cols_to_agg if df[col].dtype == np.int8]
         df = df.set_index("ds").resample(resampling["freq"][-1]).agg(agg_dict).reset_index()
+        df = _restore_int8_cols(df, int8_cols)
+    return df
+
+
+def _restore_int8_cols(df: pd.DataFrame, cols: List[Any]) -> pd.DataFrame:
+    """Converts back to int8 the indicator columns that were turned into float by resampling.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Resampled dataframe.
+    cols : list
+        Indicator columns that were stored as int8 before resampling.
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with indicator columns stored as int8 when they have no missing value.
+    """
+    for col in cols:
+        if df[col].notnull().all():
+            df[col] = df[col].astype(np.int8)
     return df
 
 
@@ -168,6 +168,45 @@ def get_perf_metrics(
     return metrics_df, metrics_dict
 
 
+def get_global_metrics(
+    evaluation_df: pd.DataFrame,
+    eval: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    resampling: Dict[Any, Any],
+    use_cv: bool,
+    config: Dict[Any, Any],
+) -> Dict[str, float]:
+    """Computes all metrics on the whole evaluation period, averaged over folds if cross-validation is used.
+
+    Parameters
+    ----------
+    evaluation_df : pd.DataFrame
+        Evaluation dataframe.
+    eval : Dict
+        Evaluation specifications.
+    dates : Dict
+        Dictionary containing all dates information.
+    resampling : Dict
+        Resampling specifications.
+    use_cv : bool
+        Whether or note cross-validation is used.
+    config : Dict
+        Lib configuration dictionary.
+
+    Returns
+    -------
+    dict
+        Value of each metric.
+    """
+    eval_all = {
+        "granularity": "cutoff" if use_cv else "Global",
+        "metrics": ["RMSE", "MAPE", "MAE", "MSE", "SMAPE"],
+        "get_perf_on_agg_forecast": eval["get_perf_on_agg_forecast"],
+    }
+    _, metrics_dict = get_perf_metrics(evaluation_df, eval_all, dates, resampling, use_cv, config)
+    return {m: float(metrics_dict[m][m].mean()) for m in eval_all["metrics"]}
+
+
 def _preprocess_eval_df(evaluation_df: pd.DataFrame, use_cv: bool) -> pd.DataFrame:
     """Preprocesses evaluation dataframe.
 
@@ -0,0 +1,58 @@
+from typing import Any, Dict
+
+import pandas as pd
+import streamlit as st
+from streamlit_prophet.lib.utils.cache import get_shared_cache
+from streamlit_prophet.lib.utils.jobs import get_job_runner
+from streamlit_prophet.lib.utils.logging import get_fit_reports
+
+
+def display_admin_view(config: Dict[Any, Any], readme: Dict[Any, Any]) -> None:
+    """Displays server-wide cache statistics, background jobs and model fits, shared by all sessions.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+    """
+    cache = get_shared_cache()
+    with st.expander("Admin", expanded=True):
+        st.write("### Shared cache")
+        st.write(
+            f"{cache.memory / 1024 ** 2:.1f} MB used out of {cache.max_memory / 1024 ** 2:.0f} MB"
+        )
+        st.dataframe(cache.get_stats())
+        if st.button("Clear shared cache", help=readme["tooltips"]["clear_shared_cache"]):
+            cache.clear()
+            st.success("Shared cache cleared")
+        st.write("### Background jobs")
+        jobs = get_job_runner(config).list_jobs()
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "name": job.name,
+                        "key": job.key[:8],
+                        "status": job.status,
+                        "progress": job.progress,
+                        "duration (s)": round(job.duration, 1),
+                    }
+                    for job in jobs
+                ],
+                columns=["name", "key", "status", "progress", "duration (s)"],
+            )
+        )
+        st.write("### Model fits")
+        reports = get_fit_reports(config).list_reports()
+        columns = ["time", "model", "thread", "duration (s)", "iterations"]
+        st.dataframe(pd.DataFrame(reports, columns=columns))
+        if len(reports) > 0:
+            index = st.selectbox(
+                "Fit output",
+                range(len(reports)),
+                format_func=lambda i: f"{reports[i]['time']} - {reports[i]['model']}",
+                help=readme["tooltips"]["fit_output"],
+            )
+            st.text(reports[index]["output"])
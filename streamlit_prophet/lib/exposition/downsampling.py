@@ -0,0 +1,221 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+TRACE_ARRAY_ATTRIBUTES = ["x", "y", "customdata", "text", "hovertext", "ids"]
+MARKER_ARRAY_ATTRIBUTES = ["color", "size", "symbol", "opacity"]
+
+
+def downsample_figure(fig: go.Figure, max_points: Any) -> go.Figure:
+    """Returns a copy of a plotly figure whose large scatter traces are downsampled for display.
+
+    Line traces with increasing x values are downsampled with Largest-Triangle-Three-Buckets,
+    other traces keep the min and max y values of each bucket of consecutive points.
+    The input figure is left untouched, so it can still be exported at full resolution.
+
+    Parameters
+    ----------
+    fig : go.Figure
+        Plotly figure to downsample.
+    max_points : Any
+        Maximum number of points per trace, or false to disable downsampling.
+
+    Returns
+    -------
+    go.Figure
+        Downsampled copy of the figure, or the input figure if no trace has to be downsampled.
+    """
+    if max_points in ["false", False, None]:
+        return fig
+    traces = [trace.to_plotly_json() for trace in fig.data]
+    if not any(_is_downsampling_needed(trace, max_points) for trace in traces):
+        return fig
+    # Traces are rebuilt from downsampled dicts so that plotly only validates the points kept
+    data = [
+        _downsample_trace(trace, int(max_points))
+        if _is_downsampling_needed(trace, max_points)
+        else trace
+        for trace in traces
+    ]
+    return go.Figure(data=data, layout=fig.layout)
+
+
+def _is_downsampling_needed(trace: Dict[Any, Any], max_points: Any) -> bool:
+    """Checks whether a trace is a scatter trace with numerical y values and more points than allowed.
+
+    Parameters
+    ----------
+    trace : Dict
+        Plotly trace as a dictionary.
+    max_points : Any
+        Maximum number of points per trace.
+
+    Returns
+    -------
+    bool
+        True if the trace has to be downsampled, False otherwise.
+    """
+    if trace.get("type") not in ["scatter", "scattergl"] or trace.get("y") is None:
+        return False
+    if len(trace["y"]) <= max(int(max_points), 3):
+        return False
+    return bool(pd.api.types.is_numeric_dtype(np.asarray(trace["y"])))
+
+
+def _downsample_trace(trace: Dict[Any, Any], max_points: int) -> Dict[Any, Any]:
+    """Keeps a subset of the points of a scatter trace.
+
+    Parameters
+    ----------
+    trace : Dict
+        Plotly scatter trace as a dictionary.
+    max_points : int
+        Maximum number of points to keep.
+
+    Returns
+    -------
+    dict
+        Downsampled trace.
+    """
+    y = np.asarray(trace["y"], dtype=float)
+    x = _get_numeric_x(trace.get("x"), len(y))
+    is_line = trace.get("mode") is None or "lines" in trace["mode"]
+    if is_line and x is not None and bool(np.all(np.diff(x) >= 0)):
+        indices = lttb_indices(x, y, max_points)
+    else:
+        indices = minmax_indices(y, max_points)
+    trace = _subset_array_attributes(trace, TRACE_ARRAY_ATTRIBUTES, indices, len(y))
+    if isinstance(trace.get("marker"), dict):
+        trace["marker"] = _subset_array_attributes(
+            trace["marker"], MARKER_ARRAY_ATTRIBUTES, indices, len(y)
+        )
+    return trace
+
+
+def _get_numeric_x(x: Any, n_points: int) -> Optional[np.ndarray]:
+    """Converts x values of a trace into floats, if they are numbers or dates.
+
+    Parameters
+    ----------
+    x : Any
+        X values of a plotly trace.
+    n_points : int
+        Number of points of the trace.
+
+    Returns
+    -------
+    np.ndarray or None
+        Numerical x values, or None if they can't be converted.
+    """
+    if x is None:
+        return np.arange(n_points, dtype=float)
+    x_array = np.asarray(x)
+    if len(x_array) != n_points:
+        return None
+    if pd.api.types.is_numeric_dtype(x_array):
+        return x_array.astype(float)
+    try:
+        return np.asarray(pd.to_datetime(x_array).asi8, dtype=float)
+    except (ValueError, TypeError):
+        return None
+
+
+def _subset_array_attributes(
+    obj: Dict[Any, Any], attributes: List[str], indices: np.ndarray, n_points: int
+) -> Dict[Any, Any]:
+    """Keeps only the selected indices of the array attributes of a plotly object.
+
+    Parameters
+    ----------
+    obj : Dict
+        Plotly trace or marker as a dictionary.
+    attributes : List[str]
+        Names of the attributes to subset.
+    indices : np.ndarray
+        Indices of the points to keep.
+    n_points : int
+        Number of points of the trace, attributes of other lengths are left as is.
+
+    Returns
+    -------
+    dict
+        Copy of the plotly object with subset attributes.
+    """
+    obj = dict(obj)
+    for attribute in attributes:
+        values = obj.get(attribute)
+        if values is None or isinstance(values, str) or np.ndim(values) == 0:
+            continue
+        if len(values) == n_points:
+            obj[attribute] = np.asarray(values)[indices]
+    return obj
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Selects points with the Largest-Triangle-Three-Buckets algorithm.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Increasing x values.
+    y : np.ndarray
+        Y values.
+    n_out : int
+        Number of points to keep, including first and last points.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the points to keep.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    y = np.where(np.isnan(y), np.nanmean(y) if np.isfinite(y).any() else 0, y)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.zeros(n_out, dtype=int)
+    indices[-1] = n - 1
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = end, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        a = indices[i]
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        indices[i + 1] = start + int(np.argmax(areas))
+    return indices
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Selects the points with min and max y values in buckets of consecutive points.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Y values.
+    n_out : int
+        Maximum number of points to keep.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the points to keep.
+    """
+    n = len(y)
+    n_buckets = n_out // 2
+    if n <= n_out or n_buckets < 1:
+        return np.arange(n)
+    bucket_size = int(np.ceil(n / n_buckets))
+    padded = np.full(n_buckets * bucket_size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_buckets, bucket_size)
+    all_nan = np.isnan(buckets).all(axis=1)
+    buckets[all_nan, 0] = 0
+    offsets = np.arange(n_buckets) * bucket_size
+    argmin = np.nanargmin(buckets, axis=1) + offsets
+    argmax = np.nanargmax(buckets, axis=1) + offsets
+    indices = np.unique(np.concatenate([argmin, argmax]))
+    return indices[indices < n]
@@ -0,0 +1,180 @@
+from typing import Any, Dict, List, Optional
+
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+from streamlit_prophet.lib.evaluation.metrics import get_global_metrics
+from streamlit_prophet.lib.evaluation.preparation import get_evaluation_df
+from streamlit_prophet.lib.utils.experiments import (
+    get_store_path,
+    load_experiment,
+    load_experiments_index,
+    save_experiment,
+)
+
+
+def display_store_experiment_button(
+    specs: Dict[Any, Any],
+    datasets: Dict[Any, Any],
+    models: Dict[Any, Any],
+    forecasts: Dict[Any, Any],
+    df: pd.DataFrame,
+    timings: Dict[str, float],
+    load_options: Dict[Any, Any],
+    config: Dict[Any, Any],
+    readme: Dict[Any, Any],
+) -> None:
+    """Displays a button to save the experiment in the local experiment store.
+
+    Parameters
+    ----------
+    specs : Dict
+        User specifications, including evaluation specifications.
+    datasets : Dict
+        Dictionary containing all datasets used for training and evaluation.
+    models : Dict
+        Dictionary containing fitted models.
+    forecasts : Dict
+        Dictionary containing all forecasts.
+    df : pd.DataFrame
+        Model input data.
+    timings : Dict
+        Durations of the experiment steps, in seconds.
+    load_options : Dict
+        Loading options selected by user, including dataset name.
+    config : Dict
+        Lib configuration dictionary.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+    """
+    if st.button("Save in experiment store", help=readme["tooltips"]["store_experiment"]):
+        with st.spinner("Saving experiment..."):
+            actions, dates = specs["actions"], specs["dates"]
+            metrics = dict()
+            if actions["evaluate"]:
+                evaluation_df = get_evaluation_df(
+                    datasets, forecasts, dates, specs["evaluation"], actions["use_cv"]
+                )
+                metrics = get_global_metrics(
+                    evaluation_df,
+                    specs["evaluation"],
+                    dates,
+                    specs["resampling"],
+                    actions["use_cv"],
+                    config,
+                )
+            store_path = get_store_path(config)
+            experiment_id = save_experiment(
+                store_path,
+                specs,
+                metrics,
+                timings,
+                datasets,
+                models,
+                forecasts,
+                df,
+                load_options.get("dataset"),
+            )
+        st.success(f"Experiment {experiment_id} saved in {store_path}")
+
+
+def display_experiments_leaderboard(
+    config: Dict[Any, Any], readme: Dict[Any, Any]
+) -> Optional[Dict[str, Any]]:
+    """Displays stored experiments and lets the user open one of them.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+
+    Returns
+    -------
+    dict or None
+        Artifacts of the opened experiment, None if no experiment is opened.
+    """
+    store_path = get_store_path(config)
+    index = load_experiments_index(store_path)
+    if len(index) == 0:
+        return None
+    with st.expander("Experiments leaderboard", expanded=False):
+        st.dataframe(index)
+        experiment_id = st.selectbox(
+            "Open a stored experiment",
+            ["None"] + list(index["id"]),
+            help=readme["tooltips"]["open_experiment"],
+        )
+    if experiment_id == "None":
+        return None
+    return load_stored_experiment(str(store_path), experiment_id)
+
+
+@st.cache(allow_output_mutation=True, ttl=300)
+def load_stored_experiment(store_path: str, experiment_id: str) -> Dict[str, Any]:
+    """Loads a stored experiment once, so that it is not read again from disk at each rerun.
+
+    Parameters
+    ----------
+    store_path : str
+        Directory of the experiment store.
+    experiment_id : str
+        Experiment id.
+
+    Returns
+    -------
+    dict
+        Specs, metrics, timings, models, datasets, forecasts and model input data of the experiment.
+    """
+    return load_experiment(Path(store_path), experiment_id)
+
+
+def display_experiment(
+    experiment: Dict[str, Any],
+    config: Dict[Any, Any],
+    readme: Dict[Any, Any],
+    report: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Displays the results of a stored or saved experiment from its models and forecasts,
+    without fitting any model.
+
+    Parameters
+    ----------
+    experiment : Dict
+        Specs, models, datasets, forecasts and model input data of the experiment.
+    config : Dict
+        Lib configuration dictionary.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+    report: List[Dict[str, Any]]
+        List of all report components.
+
+    Returns
+    -------
+    list
+        List of all report components.
+    """
+    from streamlit_prophet.lib.exposition.visualize import plot_results
+
+    specs = experiment["specs"]
+    st.write(f"Experiment {experiment['id']}")
+    return plot_results(
+        specs["actions"]["use_cv"],
+        specs["actions"]["make_future_forecast"],
+        specs["actions"]["evaluate"],
+        False,
+        specs["columns"]["target"],
+        experiment["datasets"],
+        experiment["models"],
+        experiment["forecasts"],
+        specs["dates"],
+        specs["evaluation"],
+        specs["resampling"],
+        specs["cleaning"],
+        experiment["df"],
+        config,
+        readme,
+        report,
+    )
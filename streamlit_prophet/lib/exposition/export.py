@@ -1,23 +1,146 @@
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TextIO, Tuple
 
 import base64
+import importlib.util
 import io
-import re
-import uuid
 from base64 import b64encode
 from datetime import datetime
-from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pandas as pd
-import plotly.graph_objects as go
 import streamlit as st
 import toml
-from streamlit_prophet.lib.utils.load import get_project_root
+from streamlit_prophet.lib.utils.experiments import write_experiment_to_zip
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+REPORT_HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8" />
+<title>{title}</title>
+<style>
+    body {{ font-family: sans-serif; margin: 2em; }}
+    .plot {{ min-height: 450px; }}
+</style>
+<script type="text/javascript">
+"""
+REPORT_HTML_FOOTER = """<script type="text/javascript">
+    function renderPlot(div) {
+        var fig = JSON.parse(document.getElementById(div.id + "-data").textContent);
+        Plotly.newPlot(div, fig.data, fig.layout, {responsive: true});
+    }
+    var plots = document.querySelectorAll(".plot");
+    if ("IntersectionObserver" in window) {
+        var observer = new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    renderPlot(entry.target);
+                }
+            });
+        }, {rootMargin: "200px"});
+        plots.forEach(function (div) { observer.observe(div); });
+    } else {
+        plots.forEach(renderPlot);
+    }
+</script>
+</body>
+</html>
+"""
+
+DATA_FORMATS = {
+    "csv": {"extension": "csv", "mime": "text/csv", "compression": None},
+    "csv.gz": {"extension": "csv.gz", "mime": "application/gzip", "compression": "gzip"},
+    "csv.zst": {"extension": "csv.zst", "mime": "application/zstd", "compression": "zstd"},
+    "parquet": {"extension": "parquet", "mime": "application/octet-stream", "compression": None},
+    "feather": {"extension": "feather", "mime": "application/octet-stream", "compression": None},
+}
+
+
+# Columns of actual values and point forecasts, never downcasted when exporting datasets
+FULL_PRECISION_COLS = ["y", "yhat", "truth", "forecast"]
+
+
+def get_available_data_formats() -> List[str]:
+    """Returns the formats that can be used to export datasets, given installed packages.
+
+    Returns
+    -------
+    list
+        Available export formats.
+    """
+    formats = list(DATA_FORMATS.keys())
+    if importlib.util.find_spec("zstandard") is None:
+        formats.remove("csv.zst")
+    if importlib.util.find_spec("pyarrow") is None:
+        formats.remove("parquet")
+        formats.remove("feather")
+    return formats
 
 
-def get_dataframe_download_link(df: pd.DataFrame, filename: str, linkname: str) -> str:
-    """Creates a link to download a dataframe as a csv file.
+def downcast_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Stores float columns as float32 and integer columns in the smallest integer type.
+    Actual values and point forecasts are kept at full precision.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe to downcast.
+
+    Returns
+    -------
+    pd.DataFrame
+        Downcasted dataframe.
+    """
+    float_cols = df.select_dtypes("float64").columns.difference(FULL_PRECISION_COLS)
+    int_cols = df.select_dtypes("int64").columns
+    df = df.astype({col: "float32" for col in float_cols})
+    for col in int_cols:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def get_dataframe_bytes(
+    df: pd.DataFrame, data_format: str, index: bool = False, downcast: bool = False
+) -> bytes:
+    """Converts a dataframe into the content of a file at the requested format.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe to export.
+    data_format : str
+        Export format, among "csv", "csv.gz", "csv.zst", "parquet" and "feather".
+    index : bool
+        Whether or not to export dataframe index.
+    downcast : bool
+        Whether or not to store floats as float32 and integers in the smallest integer type,
+        only applied to binary formats (parquet and feather).
+
+    Returns
+    -------
+    bytes
+        File content.
+    """
+    if downcast and data_format in ["parquet", "feather"]:
+        df = downcast_dataframe(df)
+    buffer = io.BytesIO()
+    if data_format == "parquet":
+        df.to_parquet(buffer, index=index)
+    elif data_format == "feather":
+        df.reset_index(drop=not index).to_feather(buffer)
+    else:
+        compression = DATA_FORMATS[data_format]["compression"]
+        df.to_csv(buffer, index=index, compression={"method": compression} if compression else None)
+    return buffer.getvalue()
+
+
+def get_dataframe_download_link(
+    df: pd.DataFrame, filename: str, linkname: str, data_format: str = "csv"
+) -> str:
+    """Creates a link to download a dataframe as a csv, compressed csv, parquet or feather file.
 
     Parameters
     ----------
@@ -27,15 +150,17 @@ def get_dataframe_download_link(df: pd.DataFrame, filename: str, linkname: str)
         Name of the exported file.
     linkname : str
         Text displayed in the streamlit app.
+    data_format : str
+        Export format, among "csv", "csv.gz", "csv.zst", "parquet" and "feather".
 
     Returns
     -------
     str
         Download link.
     """
-    csv = df.to_csv()
-    b64 = base64.b64encode(csv.encode()).decode()
-    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}.csv">{linkname}</a>'
+    mime, extension = DATA_FORMATS[data_format]["mime"], DATA_FORMATS[data_format]["extension"]
+    b64 = base64.b64encode(get_dataframe_bytes(df, data_format, index=True)).decode()
+    href = f'<a href="data:{mime};base64,{b64}" download="{filename}.{extension}">{linkname}</a>'
     return href
 
 
@@ -65,7 +190,7 @@ def get_config_download_link(config: Dict[Any, Any], filename: str, linkname: st
     return href
 
 
-def get_plotly_download_link(fig: go.Figure, filename: str, linkname: str) -> str:
+def get_plotly_download_link(fig: "go.Figure", filename: str, linkname: str) -> str:
     """Creates a link to download a dataframe as a html file.
 
     Parameters
@@ -91,9 +216,13 @@ def get_plotly_download_link(fig: go.Figure, filename: str, linkname: str) -> st
 
 
 def display_dataframe_download_link(
-    df: pd.DataFrame, filename: str, linkname: str, add_blank: bool = False
+    df: pd.DataFrame,
+    filename: str,
+    linkname: str,
+    add_blank: bool = False,
+    data_format: str = "csv",
 ) -> None:
-    """Displays a link to download a dataframe as a csv file.
+    """Displays a link to download a dataframe as a csv, compressed csv, parquet or feather file.
 
     Parameters
     ----------
@@ -105,10 +234,14 @@ def display_dataframe_download_link(
         Text displayed in the streamlit app.
     add_blank : str
         Whether or not to add a blank before the link in streamlit app.
+    data_format : str
+        Export format, among "csv", "csv.gz", "csv.zst", "parquet" and "feather".
     """
     if add_blank:
         st.write("")
-    st.markdown(get_dataframe_download_link(df, filename, linkname), unsafe_allow_html=True)
+    st.markdown(
+        get_dataframe_download_link(df, filename, linkname, data_format), unsafe_allow_html=True
+    )
 
 
 def display_2_dataframe_download_links(
@@ -119,8 +252,9 @@ def display_2_dataframe_download_links(
     filename2: str,
     linkname2: str,
     add_blank: bool = False,
+    data_format: str = "csv",
 ) -> None:
-    """Displays a link to download a dataframe as a csv file.
+    """Displays links to download two dataframes as csv, compressed csv, parquet or feather files.
 
     Parameters
     ----------
@@ -138,16 +272,20 @@ def display_2_dataframe_download_links(
         Text displayed in the streamlit app for the second link.
     add_blank : str
         Whether or not to add a blank before the link in streamlit app.
+    data_format : str
+        Export format, among "csv", "csv.gz", "csv.zst", "parquet" and "feather".
     """
     if add_blank:
         st.write("")
+    link1 = get_dataframe_download_link(df1, filename1, linkname1, data_format)
+    link2 = get_dataframe_download_link(df2, filename2, linkname2, data_format)
     col1, col2 = st.columns(2)
     col1.markdown(
-        f"<p style='text-align: center;;'> {get_dataframe_download_link(df1, filename1, linkname1)}</p>",
+        f"<p style='text-align: center;;'> {link1}</p>",
         unsafe_allow_html=True,
     )
     col2.markdown(
-        f"<p style='text-align: center;;'> {get_dataframe_download_link(df2, filename2, linkname2)}</p>",
+        f"<p style='text-align: center;;'> {link2}</p>",
         unsafe_allow_html=True,
     )
 
@@ -189,7 +327,7 @@ def display_config_download_links(
 
 
 def display_plotly_download_link(
-    fig: go.Figure, filename: str, linkname: str, add_blank: bool = False
+    fig: "go.Figure", filename: str, linkname: str, add_blank: bool = False
 ) -> None:
     """Displays a link to export a plotly graph in html.
 
@@ -209,9 +347,7 @@ def display_plotly_download_link(
     st.markdown(get_plotly_download_link(fig, filename, linkname), unsafe_allow_html=True)
 
 
-def create_report_zip_file(
-    report: List[Dict[str, Any]],
-    config: Dict[Any, Any],
+def get_experiment_specs(
     use_cv: bool,
     make_future_forecast: bool,
     evaluate: bool,
@@ -222,15 +358,11 @@ def create_report_zip_file(
     date_col: str,
     target_col: str,
     dimensions: Dict[Any, Any],
-) -> str:
-    """Saves locally all report components in a zip file.
+) -> Dict[str, Any]:
+    """Gathers all user specifications of an experiment in a dictionary.
 
     Parameters
     ----------
-    report: List[Dict[str, Any]]
-        List of all report components.
-    config : Dict
-        Lib configuration dictionary.
     use_cv : bool
         Whether or not cross-validation is used.
     make_future_forecast : bool
@@ -254,35 +386,10 @@ def create_report_zip_file(
 
     Returns
     -------
-    str
-        Path of the zip file.
+    dict
+        User specifications.
     """
-    # Create zip file
-    zip_path = "experiment.zip"
-    zipObj = ZipFile(zip_path, "w")
-    report_name = f"report_{datetime.now().strftime('%Y%m%d_%Hh%Mm%Ss')}"
-    # Save plots and data
-    for x in report:
-        if x["type"] == "plot":
-            file_name = f"{report_name}/plots/{x['name']}.html"
-            file_path = _get_file_path(file_name)
-            x["object"].write_html(file_path)
-        if x["type"] == "dataset":
-            file_name = f"{report_name}/data/{x['name']}.csv"
-            file_path = _get_file_path(file_name)
-            x["object"].to_csv(file_path, index=False)
-        zipObj.write(file_path, arcname=file_name)
-    # Save default config
-    default_config = config.copy()
-    if "datasets" in default_config.keys():
-        del default_config["datasets"]
-    file_name = f"{report_name}/config/default_config.toml"
-    file_path = _get_file_path(file_name)
-    with open(file_path, "w") as toml_file:
-        toml.dump(default_config, toml_file)
-    zipObj.write(file_path, arcname=file_name)
-    # Save user specifications
-    all_specs = {
+    return {
         "model_params": params,
         "dates": dates,
         "columns": {"date": date_col, "target": target_col},
@@ -295,83 +402,189 @@ def create_report_zip_file(
             "make_future_forecast": make_future_forecast,
         },
     }
-    file_name = f"{report_name}/config/user_specifications.toml"
-    file_path = _get_file_path(file_name)
-    with open(file_path, "w") as toml_file:
-        toml.dump(all_specs, toml_file)
-    zipObj.write(file_path, arcname=file_name)
-    # Close zip file
-    zipObj.close()
-    return zip_path
 
 
-def _get_file_path(file_name: str) -> str:
-    """Returns the full path of a file to include in the zip file.
+def create_report_zip_file(
+    report: List[Dict[str, Any]],
+    config: Dict[Any, Any],
+    use_cv: bool,
+    make_future_forecast: bool,
+    evaluate: bool,
+    cleaning: Dict[Any, Any],
+    resampling: Dict[Any, Any],
+    params: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    date_col: str,
+    target_col: str,
+    dimensions: Dict[Any, Any],
+    data_format: str = "csv",
+    experiment: Optional[Dict[str, Any]] = None,
+) -> Tuple[io.BytesIO, str]:
+    """Writes all report components in an in-memory zip file, compressing them on the fly.
 
     Parameters
     ----------
-    file_name: str
-        Short file name.
+    report: List[Dict[str, Any]]
+        List of all report components.
+    config : Dict
+        Lib configuration dictionary.
+    use_cv : bool
+        Whether or not cross-validation is used.
+    make_future_forecast : bool
+        Whether or not to make a forecast on future dates.
+    evaluate : bool
+        Whether or not to do a model evaluation.
+    cleaning : Dict
+        Dataset cleaning specifications.
+    resampling : Dict
+        Dataset resampling specifications.
+    params : Dict
+        Model parameters.
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+    date_col : str
+        Name of date column.
+    target_col : str
+        Name of target column.
+    dimensions : Dict
+        Dictionary containing dimensions information.
+    data_format : str
+        Export format of datasets, among "csv", "csv.gz", "csv.zst", "parquet" and "feather".
+    experiment : Dict, optional
+        Experiment specs, fitted models, datasets, forecasts and model input data ('df'),
+        saved so that the experiment can be loaded back in the app without refitting.
 
     Returns
     -------
+    io.BytesIO
+        Zip file content.
     str
-        Full path.
+        Name of the zip file.
     """
-    return str(Path(get_project_root()) / f"report/{'/'.join(file_name.split('/')[1:])}")
+    zip_buffer = io.BytesIO()
+    report_name = f"report_{datetime.now().strftime('%Y%m%d_%Hh%Mm%Ss')}"
+    with ZipFile(zip_buffer, "w", compression=ZIP_DEFLATED) as zip_file:
+        # Save plots and data
+        plots = [x for x in report if x["type"] == "plot"]
+        if config["export"]["bundle_plots"]:
+            # Plotly.js is included once in report.html instead of once per plot
+            for x in plots:
+                zip_file.writestr(f"{report_name}/plots/{x['name']}.json", x["object"].to_json())
+            if len(plots) > 0:
+                _write_zip_entry(
+                    zip_file,
+                    f"{report_name}/report.html",
+                    lambda f: write_report_html(plots, report_name, f),
+                )
+        else:
+            for x in plots:
+                _write_zip_entry(
+                    zip_file, f"{report_name}/plots/{x['name']}.html", x["object"].write_html
+                )
+        for x in report:
+            if x["type"] == "dataset":
+                # Compressed formats are stored as is, deflating them again would be useless
+                zip_file.writestr(
+                    f"{report_name}/data/{x['name']}.{DATA_FORMATS[data_format]['extension']}",
+                    get_dataframe_bytes(
+                        x["object"], data_format, downcast=config["export"]["downcast"]
+                    ),
+                    compress_type=ZIP_DEFLATED if data_format == "csv" else ZIP_STORED,
+                )
+        # Save default config
+        default_config = config.copy()
+        if "datasets" in default_config.keys():
+            del default_config["datasets"]
+        _write_zip_entry(
+            zip_file,
+            f"{report_name}/config/default_config.toml",
+            lambda f: toml.dump(default_config, f),
+        )
+        # Save user specifications
+        all_specs = get_experiment_specs(
+            use_cv,
+            make_future_forecast,
+            evaluate,
+            cleaning,
+            resampling,
+            params,
+            dates,
+            date_col,
+            target_col,
+            dimensions,
+        )
+        _write_zip_entry(
+            zip_file,
+            f"{report_name}/config/user_specifications.toml",
+            lambda f: toml.dump(all_specs, f),
+        )
+        # Save fitted models and forecasts
+        if experiment is not None:
+            write_experiment_to_zip(zip_file, report_name, experiment)
+    return zip_buffer, f"{report_name}.zip"
 
 
-def create_save_experiment_button(zip_path: str) -> None:
-    """Displays a link to export the report as a zip file.
+def write_report_html(plots: List[Dict[str, Any]], title: str, file: TextIO) -> None:
+    """Writes a self-contained html report with all plots, which includes plotly.js only once.
+    Plots are stored as json and only rendered when they are scrolled into view.
 
     Parameters
     ----------
-    zip_path: str
-        Path of the zip file.
+    plots : List[Dict[str, Any]]
+        List of plot report components.
+    title : str
+        Title of the report.
+    file : TextIO
+        Text stream where the report is written.
     """
+    from plotly.offline import get_plotlyjs
+
+    file.write(REPORT_HTML_HEADER.format(title=title))
+    file.write(get_plotlyjs())
+    file.write("</script>\n</head>\n<body>\n")
+    file.write(f"<h1>{title}</h1>\n")
+    for i, x in enumerate(plots):
+        # Escapes closing tags so that plot json can't end its script element
+        fig_json = x["object"].to_json().replace("</", "<\\/")
+        file.write(f"<h2>{x['name']}</h2>\n")
+        file.write(f'<div class="plot" id="plot-{i}"></div>\n')
+        file.write(f'<script type="application/json" id="plot-{i}-data">{fig_json}</script>\n')
+    file.write(REPORT_HTML_FOOTER)
+
+
+def _write_zip_entry(
+    zip_file: ZipFile, file_name: str, write_func: Callable[[TextIO], Any]
+) -> None:
+    """Writes a text file directly into a zip file, without any temporary file on disk.
 
-    button_uuid = str(uuid.uuid4()).replace("-", "")
-    button_id = re.sub(r"\d+", "", button_uuid)
+    Parameters
+    ----------
+    zip_file : ZipFile
+        Zip file opened in write mode.
+    file_name : str
+        Path of the file inside the zip file.
+    write_func : Callable
+        Function writing the file content into a text stream.
+    """
+    with zip_file.open(file_name, "w") as entry:
+        text_entry = io.TextIOWrapper(entry, encoding="utf-8", newline="")
+        write_func(text_entry)
+        text_entry.flush()
+        text_entry.detach()
 
-    with open(zip_path, "rb") as f:
-        bytes = f.read()
-        b64 = base64.b64encode(bytes).decode()
-        href = (
-            f"<a download='{zip_path}' id='{button_id}' href=\"data:file/zip;base64,{b64}\" >Save "
-            f"experiment</a><br></br> "
-        )
 
-    color1 = "rgb(255, 0, 102)"
-    color2 = "rgb(0, 34, 68)"
-    color3 = "rgb(255, 255, 255)"
-    custom_css = f"""
-            <style>
-                #{button_id} {{
-                    background-color: {color1};
-                    color: {color3};
-                    padding: 0.45em 0.58em;
-                    position: relative;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    border-width: 2px;
-                    border-style: solid;
-                    border-color: {color3};
-                    border-image: initial;
-                }}
-                #{button_id}:hover {{
-                    border-color: {color2};
-                    color: {color2};
-                }}
-                #{button_id}:active {{
-                    box-shadow: none;
-                    background-color: {color3};
-                    border-color: {color1};
-                    color: {color1};
-                    }}
-            </style> """
+def create_save_experiment_button(zip_buffer: io.BytesIO, zip_name: str) -> None:
+    """Displays a button to export the report as a zip file.
 
-    st.markdown(
-        f"<p style='text-align: center;;'> {custom_css + href} </p>", unsafe_allow_html=True
+    Parameters
+    ----------
+    zip_buffer: io.BytesIO
+        Zip file content.
+    zip_name: str
+        Name of the downloaded zip file.
+    """
+    st.download_button(
+        "Save experiment", data=zip_buffer, file_name=zip_name, mime="application/zip"
     )
 
 
@@ -388,8 +601,10 @@ def display_save_experiment_button(
     date_col: str,
     target_col: str,
     dimensions: Dict[Any, Any],
+    data_format: str = "csv",
+    experiment: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """Saves locally all report components in a zip file.
+    """Displays a button to download all report components in a zip file.
 
     Parameters
     ----------
@@ -417,9 +632,14 @@ def display_save_experiment_button(
         Name of target column.
     dimensions : Dict
         Dictionary containing dimensions information.
+    data_format : str
+        Export format of datasets, among "csv", "csv.gz", "csv.zst", "parquet" and "feather".
+    experiment : Dict, optional
+        Experiment specs, fitted models, datasets, forecasts and model input data ('df'),
+        saved so that the experiment can be loaded back in the app without refitting.
     """
-    with st.spinner("Saving config, plots and data..."):
-        zip_path = create_report_zip_file(
+    with st.spinner("Saving config, plots, data and models..."):
+        zip_buffer, zip_name = create_report_zip_file(
             report,
             config,
             use_cv,
@@ -432,8 +652,10 @@ def display_save_experiment_button(
             date_col,
             target_col,
             dimensions,
+            data_format,
+            experiment,
         )
-        create_save_experiment_button(zip_path)
+        create_save_experiment_button(zip_buffer, zip_name)
 
 
 def display_links(repo_link: str, article_link: str) -> None:
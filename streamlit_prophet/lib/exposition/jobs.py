@@ -0,0 +1,65 @@
+from typing import Any, Dict, Tuple
+
+import time
+
+import streamlit as st
+from streamlit_prophet.lib.models.prophet import check_forecast_inputs, forecast_workflow
+from streamlit_prophet.lib.utils.jobs import FAILED, get_job_runner
+from streamlit_prophet.lib.utils.misc import get_content_hash
+
+
+def run_forecast_job(
+    config: Dict[Any, Any], readme: Dict[Any, Any], *workflow_args: Any
+) -> Tuple[Tuple[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]], float]:
+    """Runs forecast workflow in a background job, displays its progress until it is done,
+    and returns its results.
+
+    The job key is a hash of the workflow inputs, so that a rerun of the app, or another session
+    with the same inputs, polls the running job instead of fitting the models again.
+    Inputs are checked in the app before the job is submitted, as errors displayed by the job
+    are not shown in the app. A failed job is only run again if the user asks for it.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+    *workflow_args : Any
+        Arguments of forecast_workflow, config excluded.
+
+    Returns
+    -------
+    tuple
+        Datasets, models and forecasts dictionaries returned by forecast_workflow.
+    float
+        Duration of the job, in seconds.
+    """
+    workflow_args = (config,) + tuple(
+        dict(arg) if isinstance(arg, dict) else arg for arg in workflow_args
+    )
+    runner = get_job_runner(config)
+    key = get_content_hash("forecast_workflow", workflow_args)
+    if runner.get(key) is None:
+        check_forecast_inputs(*workflow_args)
+    job = runner.submit(
+        key,
+        "Training and forecast",
+        forecast_workflow,
+        *workflow_args,
+        report_progress=True,
+    )
+    if job.status == FAILED:
+        st.error(f"Training and forecast failed: {job.error}")
+        if st.button("Retry", help=readme["tooltips"]["retry_job"]):
+            runner.discard(key)
+            st.experimental_rerun()
+        st.stop()
+    if not job.is_finished:
+        st.progress(job.progress)
+        st.write(f"{job.message} ({job.duration:.0f}s)")
+        time.sleep(config["jobs"]["poll_interval"])
+        st.experimental_rerun()
+    datasets, models, forecasts = job.result
+    # Results are shared with the other sessions that submitted the same job
+    return (dict(datasets), dict(models), dict(forecasts)), round(job.duration, 3)
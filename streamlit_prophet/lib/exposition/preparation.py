@@ -4,9 +4,14 @@ import datetime
 from collections import defaultdict
 from datetime import timedelta
 
+import numpy as np
 import pandas as pd
+import streamlit as st
 from prophet import Prophet
+from scipy import sparse
+from streamlit_prophet.lib.models.preparation import get_model_fingerprint
 from streamlit_prophet.lib.utils.mapping import convert_into_nb_of_days, convert_into_nb_of_seconds
+from streamlit_prophet.lib.utils.misc import format_dates
 
 
 def get_forecast_components(
@@ -28,19 +33,40 @@ def get_forecast_components(
     pd.DataFrame
         Dataframe with only the relevant components to sum to get the prediction.
     """
-    fcst = forecast_df.copy()
-    components_col_names = get_forecast_components_col_names(fcst) + ["ds"]
-    if include_yhat:
-        components_col_names = components_col_names + ["yhat"]
-    components = fcst[components_col_names]
-    for col in components_col_names:
-        if col in model.component_modes["multiplicative"]:
-            components[col] *= components["trend"]
-
-    components = components.set_index("ds")
+    components = _compute_forecast_components(model, forecast_df)
+    # Copied, as the memoized components are shared by all reruns and sessions
+    if not include_yhat:
+        return components.drop("yhat", axis=1)
+    return components.copy()
+
+
+@st.cache(hash_funcs={Prophet: get_model_fingerprint}, allow_output_mutation=True, ttl=300)
+def _compute_forecast_components(model: Prophet, forecast_df: pd.DataFrame) -> pd.DataFrame:
+    """Computes grouped components (and yhat) of a forecast, memoized per model and forecast.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted model.
+    forecast_df : pd.DataFrame
+        Forecast dataframe returned by Prophet model.
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe indexed by date with grouped components and yhat. Must not be mutated.
+    """
+    components_col_names = get_forecast_components_col_names(forecast_df) + ["yhat"]
+    values = forecast_df[components_col_names].to_numpy(dtype=float)
+    multiplicative = np.isin(components_col_names, list(model.component_modes["multiplicative"]))
+    if multiplicative.any():
+        trend = forecast_df["trend"].to_numpy(dtype=float)
+        values = np.where(multiplicative, values * trend[:, np.newaxis], values)
+    components = pd.DataFrame(
+        values, index=pd.Index(forecast_df["ds"], name="ds"), columns=components_col_names
+    )
     components_mapping = get_components_mapping(components, model, cols_to_drop=["holidays"])
-    components = group_components(components, components_mapping)
-    return components
+    return group_components(components, components_mapping)
 
 
 def get_forecast_components_col_names(forecast_df: pd.DataFrame) -> List[Any]:
@@ -114,7 +140,7 @@ def get_components_mapping(
 def group_components(
     components: pd.DataFrame, components_mapping: Dict[str, List[Any]]
 ) -> pd.DataFrame:
-    """Group components based on components_mapping in a copy of the components df
+    """Group components based on components_mapping, through a product with a sparse 0/1 mapping matrix
 
     Parameters
     ----------
@@ -130,11 +156,16 @@ A column not in any of the mapping values will be dropped.
     pd.DataFrame
         Dataframe with components either left as is, summed or dropped, based on provided mapping
     """
-    grouped_components = pd.DataFrame(index=components.index)
-    for new_col_name, grouped_cols in components_mapping.items():
-        if new_col_name != "_to_drop_":
-            grouped_components[new_col_name] = components[grouped_cols].sum(axis=1)
-    return grouped_components
+    new_col_names = [name for name in components_mapping.keys() if name != "_to_drop_"]
+    col_positions = {col: i for i, col in enumerate(components.columns)}
+    rows = [col_positions[col] for name in new_col_names for col in components_mapping[name]]
+    cols = [j for j, name in enumerate(new_col_names) for _ in components_mapping[name]]
+    mapping_matrix = sparse.csc_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(components.columns), len(new_col_names))
+    )
+    values = np.nan_to_num(components.to_numpy(dtype=float))  # NaNs are skipped like in a sum
+    grouped_values = np.asarray(values @ mapping_matrix)
+    return pd.DataFrame(grouped_values, index=components.index, columns=new_col_names)
 
 
 def get_df_cv_with_hist(
@@ -222,9 +253,10 @@ def get_hover_template_cv(
     """
     hover_data = pd.DataFrame(cv_dates).T
     if resampling["freq"][-1] in ["s", "H"]:
-        hover_data = hover_data.applymap(lambda x: x.strftime("%Y/%m/%d %H:%M:%S"))
+        date_format = "%Y/%m/%d %H:%M:%S"
     else:
-        hover_data = hover_data.applymap(lambda x: x.strftime("%Y/%m/%d"))
+        date_format = "%Y/%m/%d"
+    hover_data = hover_data.apply(lambda col: format_dates(col, date_format))
     hover_template = "<br>".join(
         [
             "%{y}",
@@ -237,15 +269,91 @@ def get_hover_template_cv(
     return hover_data, hover_template
 
 
+@st.cache(hash_funcs={Prophet: get_model_fingerprint}, allow_output_mutation=True, ttl=300)
+def get_components_prefix_sums(model: Prophet, forecast_df: pd.DataFrame) -> Dict[str, Any]:
+    """Returns cumulative sums of forecast components and yhat, computed once per model and forecast.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted model.
+    forecast_df : pd.DataFrame
+        Forecast dataframe returned by Prophet model.
+
+    Returns
+    -------
+    dict
+        Prefix sums of components, see get_prefix_sums.
+    """
+    components = get_forecast_components(model, forecast_df, True).reset_index()
+    return get_prefix_sums(components)
+
+
+@st.cache(allow_output_mutation=True, ttl=300)
+def get_prefix_sums(df: pd.DataFrame) -> Dict[str, Any]:
+    """Computes cumulative sums and counts of non null values of all columns over the sorted date column.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe with a 'ds' column and numerical columns only.
+
+    Returns
+    -------
+    dict
+        Dictionary with sorted dates ('ds'), column names ('columns'), cumulative sums ('sums')
+        and cumulative counts of non null values ('counts'). Sums and counts have a leading row of zeros.
+    """
+    df = df.sort_values("ds")
+    values = df.drop("ds", axis=1).to_numpy(dtype=float)
+    not_null = ~np.isnan(values)
+    zeros = np.zeros((1, values.shape[1]))
+    return {
+        "ds": df["ds"].to_numpy(),
+        "columns": list(df.drop("ds", axis=1).columns),
+        "sums": np.vstack([zeros, np.cumsum(np.where(not_null, values, 0), axis=0)]),
+        "counts": np.vstack([zeros, np.cumsum(not_null, axis=0)]),
+    }
+
+
+def get_range_mean(
+    prefix_sums: Dict[str, Any], start_date: datetime.date, end_date: datetime.date
+) -> pd.Series:
+    """Returns the mean of each column between start date (included) and end date (excluded).
+
+    Parameters
+    ----------
+    prefix_sums : Dict
+        Prefix sums returned by get_prefix_sums.
+    start_date : datetime.date
+        Start date of the range.
+    end_date : datetime.date
+        End date of the range.
+
+    Returns
+    -------
+    pd.Series
+        Mean of each column on the range, null if there are no values on the range.
+    """
+    start, end = np.searchsorted(
+        prefix_sums["ds"], pd.to_datetime([start_date, end_date]).to_numpy(), side="left"
+    )
+    sums = prefix_sums["sums"][end] - prefix_sums["sums"][start]
+    counts = prefix_sums["counts"][end] - prefix_sums["counts"][start]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    return pd.Series(means, index=prefix_sums["columns"])
+
+
 def prepare_waterfall(
-    components: pd.DataFrame, start_date: datetime.date, end_date: datetime.date
-) -> pd.DataFrame:
-    """Returns a dataframe with only the relevant components to sum to get the prediction.
+    prefix_sums: Dict[str, Any], start_date: datetime.date, end_date: datetime.date
+) -> pd.Series:
+    """Returns the mean of the relevant components to sum to get the prediction on a period.
 
     Parameters
     ----------
-    components : pd.DataFrame
-        Dataframe with relevant components
+    prefix_sums : Dict
+        Prefix sums of relevant components, returned by get_components_prefix_sums.
     start_date : datetime.date
         Start date for components computation.
     end_date : datetime.date
@@ -253,13 +361,9 @@ def prepare_waterfall(
 
     Returns
     -------
-    pd.DataFrame
-        Dataframe with only the relevant data to plot the waterfall chart.
+    pd.Series
+        Series with only the relevant data to plot the waterfall chart.
     """
-    waterfall = components.loc[
-        (components["ds"] >= pd.to_datetime(start_date))
-        & (components["ds"] < pd.to_datetime(end_date))
-    ]
-    waterfall = waterfall.mean(axis=0, numeric_only=True)
+    waterfall = get_range_mean(prefix_sums, start_date, end_date)
     waterfall = waterfall[waterfall != 0]
     return waterfall
@@ -0,0 +1,60 @@
+from typing import Any, Dict
+
+import streamlit as st
+from streamlit_prophet.lib.models.tuning import tune_params
+
+
+def display_tuning(
+    tuning: Dict[Any, Any],
+    params: Dict[Any, Any],
+    config: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    resampling: Dict[Any, Any],
+    datasets: Dict[Any, Any],
+    readme: Dict[Any, Any],
+) -> None:
+    """Launches the hyperparameters search on user request, displays its results
+    and lets the user apply the best parameters in the sidebar.
+
+    Parameters
+    ----------
+    tuning : Dict
+        Hyperparameters search specifications.
+    params : Dict
+        Model parameters.
+    config : Dict
+        Lib configuration dictionary, containing information about random seed to use for training.
+    dates : Dict
+        Dictionary containing cross-validation cutoffs and horizon.
+    resampling : Dict
+        Dataset resampling specifications.
+    datasets : Dict
+        Dictionary containing training dataset.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+    """
+    if st.button("Launch tuning", help=readme["tooltips"]["launch_tuning"]):
+        if len(tuning["search_space"]) == 0:
+            st.error("Please select at least one value to try in the tuning sidebar section.")
+            st.stop()
+        with st.spinner("Searching best parameters..."):
+            results, best = tune_params(
+                params, tuning, config, dates, resampling, datasets["train"]
+            )
+        st.session_state["tuning_results"] = results
+        st.session_state["tuning_best"] = best
+    if "tuning_results" in st.session_state:
+        with st.expander("Tuning results", expanded=True):
+            st.dataframe(st.session_state["tuning_results"])
+            st.write("Best parameters:")
+            st.json(st.session_state["tuning_best"])
+            st.button(
+                "Apply best parameters",
+                on_click=_apply_best_params,
+                help=readme["tooltips"]["apply_tuning"],
+            )
+
+
+def _apply_best_params() -> None:
+    """Saves the best parameters in session state, so that they are used as sidebar defaults."""
+    st.session_state["tuned_params"] = st.session_state["tuning_best"]
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import datetime
 
@@ -12,13 +12,152 @@ from prophet import Prophet
 from prophet.plot import plot_plotly
 from streamlit_prophet.lib.evaluation.metrics import get_perf_metrics
 from streamlit_prophet.lib.evaluation.preparation import get_evaluation_df
+from streamlit_prophet.lib.exposition.downsampling import downsample_figure
 from streamlit_prophet.lib.exposition.expanders import (
     display_expander,
     display_expanders_performance,
 )
-from streamlit_prophet.lib.exposition.preparation import get_forecast_components, prepare_waterfall
+from streamlit_prophet.lib.exposition.preparation import (
+    get_components_prefix_sums,
+    get_forecast_components,
+    get_prefix_sums,
+    get_range_mean,
+    prepare_waterfall,
+)
 from streamlit_prophet.lib.inputs.dates import input_waterfall_dates
-from streamlit_prophet.lib.utils.misc import reverse_list
+from streamlit_prophet.lib.models.preparation import get_model_fingerprint
+from streamlit_prophet.lib.utils.misc import (
+    format_dates,
+    get_date_hover_field,
+    reverse_list,
+    to_plotly_dates,
+)
+
+
+def plot_results(
+    use_cv: bool,
+    make_future_forecast: bool,
+    evaluate: bool,
+    display_all_sections: bool,
+    target_col: str,
+    datasets: Dict[Any, Any],
+    models: Dict[Any, Any],
+    forecasts: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    eval: Dict[Any, Any],
+    resampling: Dict[Any, Any],
+    cleaning: Dict[Any, Any],
+    df: pd.DataFrame,
+    config: Dict[Any, Any],
+    readme: Dict[Any, Any],
+    report: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Plots all results sections: overview, evaluation, components and future forecast.
+
+    Parameters
+    ----------
+    use_cv : bool
+        Whether or not cross-validation is used.
+    make_future_forecast : bool
+        Whether or not a forecast is made on future dates.
+    evaluate : bool
+        Whether or not a model evaluation is done.
+    display_all_sections : bool
+        Whether to display all sections, or only the one selected by the user.
+    target_col : str
+        Name of target column.
+    datasets : Dict
+        Dictionary containing all datasets used for training and evaluation.
+    models : Dict
+        Dictionary containing fitted models.
+    forecasts : Dict
+        Dictionary containing all forecasts.
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+    eval : Dict
+        Evaluation specifications (metrics, evaluation set, granularity).
+    resampling : Dict
+        Resampling specifications (granularity, dataset frequency).
+    cleaning : Dict
+        Cleaning specifications.
+    df: pd.DataFrame
+        Dataframe containing the ground truth.
+    config : Dict
+        Lib configuration dictionary.
+    readme : Dict
+        Dictionary containing explanations about the graphs.
+    report: List[Dict[str, Any]]
+        List of all report components.
+    """
+    # Only the selected section is built, unless all plots are needed for the report
+    sections = []
+    if evaluate | make_future_forecast:
+        sections.append("Overview")
+    if evaluate:
+        sections.append("Evaluation")
+    if evaluate | make_future_forecast:
+        sections.append("Components")
+    if make_future_forecast:
+        sections.append("Future forecast")
+    if display_all_sections or len(sections) <= 1:
+        displayed_sections = sections
+    else:
+        displayed_sections = [
+            st.radio(
+                "Results",
+                sections,
+                horizontal=True,
+                help=readme["tooltips"]["results_sections"],
+            )
+        ]
+
+    if "Overview" in displayed_sections:
+        st.write("# 1. Overview")
+        report = plot_overview(
+            make_future_forecast,
+            use_cv,
+            models,
+            forecasts,
+            target_col,
+            cleaning,
+            config,
+            readme,
+            report,
+        )
+
+    if "Evaluation" in displayed_sections:
+        st.write(
+            f'# 2. Evaluation on {"CV" if use_cv else ""} {eval["set"].lower()} set{"s" if use_cv else ""}'
+        )
+        report = plot_performance(
+            use_cv, target_col, datasets, forecasts, dates, eval, resampling, config, readme, report
+        )
+
+    if "Components" in displayed_sections:
+        st.write(
+            "# 3. Impact of components and regressors"
+            if evaluate
+            else "# 2. Impact of components and regressors"
+        )
+        report = plot_components(
+            use_cv,
+            make_future_forecast,
+            target_col,
+            models,
+            forecasts,
+            cleaning,
+            resampling,
+            config,
+            readme,
+            df,
+            report,
+        )
+
+    if "Future forecast" in displayed_sections:
+        st.write("# 4. Future forecast" if evaluate else "# 3. Future forecast")
+        report = plot_future(models, forecasts, dates, target_col, cleaning, config, readme, report)
+
+    return report
 
 
 def plot_overview(
@@ -28,6 +167,7 @@ def plot_overview(
     forecasts: Dict[Any, Any],
     target_col: str,
     cleaning: Dict[Any, Any],
+    config: Dict[Any, Any],
     readme: Dict[Any, Any],
     report: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
@@ -47,13 +187,14 @@ def plot_overview(
         Name of target column.
     cleaning : Dict
         Cleaning specifications.
+    config : Dict
+        Lib configuration dictionary.
     readme : Dict
         Dictionary containing explanations about the graph.
     report: List[Dict[str, Any]]
         List of all report components.
     """
     display_expander(readme, "overview", "More info on this plot")
-    bool_param = False if cleaning["log_transform"] else True
     if make_future_forecast:
         model = models["future"]
         forecast = forecasts["future"]
@@ -63,15 +204,8 @@ def plot_overview(
     else:
         model = models["eval"]
         forecast = forecasts["eval"]
-    fig = plot_plotly(
-        model,
-        forecast,
-        ylabel=target_col,
-        changepoints=bool_param,
-        trend=bool_param,
-        uncertainty=bool_param,
-    )
-    st.plotly_chart(fig)
+    fig = make_forecast_plot(model, forecast, target_col, cleaning)
+    st.plotly_chart(downsample_figure(fig, config["style"]["max_points_per_trace"]))
     report.append({"object": fig, "name": "overview", "type": "plot"})
     return report
 
@@ -119,6 +253,8 @@ def plot_performance(
         evaluation_df, eval, dates, resampling, use_cv, config
     )
     st.write("## Performance metrics")
+    if use_cv and "cv_early_stopping" in forecasts:
+        report = display_cv_early_stopping(forecasts["cv_early_stopping"], report)
     display_expanders_performance(use_cv, dates, resampling, style, readme)
     display_expander(readme, "helper_metrics", "How to evaluate my model?", True)
     st.write("### Global performance")
@@ -130,9 +266,10 @@ def plot_performance(
     fig1 = plot_forecasts_vs_truth(evaluation_df, target_col, use_cv, style)
     fig2 = plot_truth_vs_actual_scatter(evaluation_df, use_cv, style)
     fig3 = plot_residuals_distrib(evaluation_df, use_cv, style)
-    st.plotly_chart(fig1)
-    st.plotly_chart(fig2)
-    st.plotly_chart(fig3)
+    st.plotly_chart(downsample_figure(fig1, style["max_points_per_trace"]))
+    st.plotly_chart(downsample_figure(fig2, style["max_points_per_trace"]))
+    st.plotly_chart(downsample_figure(fig3, style["max_points_per_trace"]))
+    evaluation_df["residuals"] = evaluation_df["forecast"] - evaluation_df["truth"]
     report.append({"object": fig1, "name": "eval_forecast_vs_truth_line", "type": "plot"})
     report.append({"object": fig2, "name": "eval_forecast_vs_truth_scatter", "type": "plot"})
     report.append({"object": fig3, "name": "eval_residuals_distribution", "type": "plot"})
@@ -143,6 +280,45 @@ def plot_performance(
     return report
 
 
+def display_cv_early_stopping(
+    running_metrics: pd.DataFrame, report: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Displays whether cross-validation was stopped early,
+    and the checks made after each batch of folds.
+
+    Parameters
+    ----------
+    running_metrics : pd.DataFrame
+        Running metric, bound and reference score after each batch of folds.
+    report: List[Dict[str, Any]]
+        List of all report components.
+
+    Returns
+    -------
+    list
+        List of all report components.
+    """
+    last_check = running_metrics.iloc[-1]
+    metric = running_metrics.columns[2]
+    if last_check["Stopped"]:
+        st.warning(
+            f"Cross-validation stopped after {last_check['Folds evaluated']} folds out of "
+            f"{last_check['Folds total']}: {metric} bound ({last_check['Bound']:.4f}) is above "
+            f"the reference score ({last_check['Reference']:.4f}). "
+            f"Results are displayed for the evaluated folds only."
+        )
+    else:
+        st.success(
+            f"All {last_check['Folds total']} folds evaluated: {metric} bound "
+            f"({last_check['Bound']:.4f}) never went above the reference score "
+            f"({last_check['Reference']:.4f})."
+        )
+    with st.expander("See early stopping checks", expanded=False):
+        st.dataframe(running_metrics)
+    report.append({"object": running_metrics, "name": "eval_cv_early_stopping", "type": "dataset"})
+    return report
+
+
 def plot_components(
     use_cv: bool,
     make_future_forecast: bool,
@@ -199,7 +375,7 @@ def plot_components(
     fig1 = make_separate_components_plot(
         model, forecast_df, target_col, cleaning, resampling, style
     )
-    st.plotly_chart(fig1)
+    st.plotly_chart(downsample_figure(fig1, style["max_points_per_trace"]))
 
     st.write("## Local impact")
     display_expander(readme, "waterfall", "More info on this plot", True)
@@ -207,7 +383,7 @@ def plot_components(
     fig2 = make_waterfall_components_plot(
         model, forecast_df, start_date, end_date, target_col, cleaning, resampling, style, df
     )
-    st.plotly_chart(fig2)
+    st.plotly_chart(downsample_figure(fig2, style["max_points_per_trace"]))
 
     report.append({"object": fig1, "name": "global_components", "type": "plot"})
     report.append({"object": fig2, "name": "local_components", "type": "plot"})
@@ -222,6 +398,7 @@ def plot_future(
     dates: Dict[Any, Any],
     target_col: str,
     cleaning: Dict[Any, Any],
+    config: Dict[Any, Any],
     readme: Dict[Any, Any],
     report: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
@@ -239,28 +416,70 @@ def plot_future(
         Name of target column.
     cleaning : Dict
         Cleaning specifications.
+    config : Dict
+        Lib configuration dictionary.
     readme : Dict
         Dictionary containing explanations about the graph.
     report: List[Dict[str, Any]]
         List of all report components.
     """
     display_expander(readme, "future", "More info on this plot")
-    bool_param = False if cleaning["log_transform"] else True
-    fig = plot_plotly(
+    fig = make_forecast_plot(
         models["future"],
         forecasts["future"],
+        target_col,
+        cleaning,
+        [dates["forecast_start_date"], dates["forecast_end_date"]],
+    )
+    st.plotly_chart(downsample_figure(fig, config["style"]["max_points_per_trace"]))
+    report.append({"object": fig, "name": "future_forecast", "type": "plot"})
+    report.append({"object": forecasts["future"], "name": "future_forecast", "type": "dataset"})
+    return report
+
+
+@st.cache(hash_funcs={Prophet: get_model_fingerprint}, allow_output_mutation=True, ttl=300)
+def make_forecast_plot(
+    model: Prophet,
+    forecast_df: pd.DataFrame,
+    target_col: str,
+    cleaning: Dict[Any, Any],
+    xaxis_range: Optional[List[Any]] = None,
+) -> go.Figure:
+    """Creates a plotly line plot with predictions and actual values, cached per model and forecast.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted model.
+    forecast_df : pd.DataFrame
+        Predictions of Prophet model.
+    target_col : str
+        Name of target column.
+    cleaning : Dict
+        Cleaning specifications.
+    xaxis_range : List, optional
+        Start and end dates displayed on the x axis, all dates are displayed if None.
+
+    Returns
+    -------
+    go.Figure
+        Plotly line plot with predictions and actual values.
+    """
+    bool_param = False if cleaning["log_transform"] else True
+    fig = plot_plotly(
+        model,
+        forecast_df,
         ylabel=target_col,
         changepoints=bool_param,
         trend=bool_param,
         uncertainty=bool_param,
     )
-    fig.update_layout(xaxis_range=[dates["forecast_start_date"], dates["forecast_end_date"]])
-    st.plotly_chart(fig)
-    report.append({"object": fig, "name": "future_forecast", "type": "plot"})
-    report.append({"object": forecasts["future"], "name": "future_forecast", "type": "dataset"})
-    return report
+    if xaxis_range is not None:
+        fig.update_layout(xaxis_range=xaxis_range)
+    return fig
 
 
+@st.cache(allow_output_mutation=True, ttl=300)
 def plot_forecasts_vs_truth(
     eval_df: pd.DataFrame, target_col: str, use_cv: bool, style: Dict[Any, Any]
 ) -> go.Figure:
@@ -337,6 +556,7 @@ def plot_forecasts_vs_truth(
     return fig
 
 
+@st.cache(allow_output_mutation=True, ttl=300)
 def plot_truth_vs_actual_scatter(
     eval_df: pd.DataFrame, use_cv: bool, style: Dict[Any, Any]
 ) -> go.Figure:
@@ -356,7 +576,13 @@ def plot_truth_vs_actual_scatter(
     go.Figure
         Plotly scatter plot showing forecasts and actual values on evaluation period.
     """
-    eval_df["date"] = eval_df["ds"].map(lambda x: x.strftime("%A %b %d %Y"))
+    hover_template = "<br>".join(
+        [
+            "truth=%{x:.4f}",
+            "forecast=%{y:.4f}",
+            f"date={get_date_hover_field('customdata', '%A %b %d %Y')}",
+        ]
+    )
     if use_cv:
         colors = reverse_list(style["colors"], eval_df["Fold"].nunique())
         fig = px.scatter(
@@ -366,8 +592,12 @@ def plot_truth_vs_actual_scatter(
             color="Fold",
             opacity=0.5,
             color_discrete_sequence=colors,
-            hover_data={"date": True, "truth": ":.4f", "forecast": ":.4f"},
         )
+        for trace in fig.data:
+            trace.update(
+                customdata=to_plotly_dates(eval_df.loc[eval_df["Fold"] == trace.name, "ds"]),
+                hovertemplate=f"Fold={trace.name}<br>{hover_template}<extra></extra>",
+            )
     else:
         fig = px.scatter(
             eval_df,
@@ -375,7 +605,10 @@ def plot_truth_vs_actual_scatter(
             y="forecast",
             opacity=0.5,
             color_discrete_sequence=style["colors"][2:],
-            hover_data={"date": True, "truth": ":.4f", "forecast": ":.4f"},
+        )
+        fig.update_traces(
+            customdata=to_plotly_dates(eval_df["ds"]),
+            hovertemplate=f"{hover_template}<extra></extra>",
         )
     fig.add_trace(
         go.Scatter(
@@ -392,6 +625,7 @@ def plot_truth_vs_actual_scatter(
     return fig
 
 
+@st.cache(allow_output_mutation=True, ttl=300)
 def plot_residuals_distrib(eval_df: pd.DataFrame, use_cv: bool, style: Dict[Any, Any]) -> go.Figure:
     """Creates a plotly distribution plot showing distribution of residuals on evaluation period.
 
@@ -409,7 +643,7 @@ def plot_residuals_distrib(eval_df: pd.DataFrame, use_cv: bool, style: Dict[Any,
     go.Figure
         Plotly distribution plot showing distribution of residuals on evaluation period.
     """
-    eval_df["residuals"] = eval_df["forecast"] - eval_df["truth"]
+    eval_df = eval_df.assign(residuals=eval_df["forecast"] - eval_df["truth"])
     if len(eval_df) >= 10:
         x_min, x_max = eval_df["residuals"].quantile(0.005), eval_df["residuals"].quantile(0.995)
     else:
@@ -491,13 +725,14 @@ def plot_detailed_metrics(
             width=1000,
             showlegend=False,
         )
-        st.plotly_chart(fig)
+        st.plotly_chart(downsample_figure(fig, style["max_points_per_trace"]))
         report.append({"object": fig, "name": "eval_detailed_performance", "type": "plot"})
     else:
         st.dataframe(metrics_df)
     return report
 
 
+@st.cache(hash_funcs={Prophet: get_model_fingerprint}, allow_output_mutation=True, ttl=300)
 def make_separate_components_plot(
     model: Prophet,
     forecast_df: pd.DataFrame,
@@ -538,7 +773,7 @@ def make_separate_components_plot(
             values = forecast_df.loc[forecast_df.ds.isin(hours), ("ds", col)]
             values = values.iloc[values.ds.dt.hour.values.argsort()]  # sort by hour order
             y = values[col]
-            x = values.ds.map(lambda h: h.strftime("%H:%M"))
+            x = format_dates(values.ds, "%H:%M")
         elif col == "weekly":
             days = forecast_df["ds"].groupby(forecast_df.ds.dt.dayofweek).last()
             values = forecast_df.loc[forecast_df.ds.isin(days), ("ds", col)]
@@ -627,11 +862,9 @@ def make_waterfall_components_plot(
         Waterfall chart with the components of prediction.
     """
     N_digits = style["waterfall_digits"]
-    components = get_forecast_components(model, forecast_df, True).reset_index()
-    waterfall = prepare_waterfall(components, start_date, end_date)
-    truth = df.loc[
-        (df["ds"] >= pd.to_datetime(start_date)) & (df["ds"] < pd.to_datetime(end_date)), "y"
-    ].mean(axis=0)
+    prefix_sums = get_components_prefix_sums(model, forecast_df)
+    waterfall = prepare_waterfall(prefix_sums, start_date, end_date)
+    truth = get_range_mean(get_prefix_sums(df[["ds", "y"]]), start_date, end_date)["y"]
     fig = go.Figure(
         go.Waterfall(
             orientation="v",
@@ -3,13 +3,20 @@ from typing import Any, Dict, Tuple
 import pandas as pd
 import streamlit as st
 from streamlit_prophet.lib.exposition.export import display_config_download_links
-from streamlit_prophet.lib.utils.load import download_toy_dataset, load_custom_config, load_dataset
+from streamlit_prophet.lib.utils.load import (
+    download_toy_dataset,
+    load_custom_config,
+    load_dataset,
+    load_experiment_file,
+    load_local_dataset,
+)
 
 
 def input_dataset(
     config: Dict[Any, Any], readme: Dict[Any, Any], instructions: Dict[Any, Any]
 ) -> Tuple[pd.DataFrame, Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]:
-    """Lets the user decide whether to upload a dataset or download a toy dataset.
+    """Lets the user decide whether to upload a dataset, download a toy dataset,
+    or load an experiment saved as a zip file.
 
     Parameters
     ----------
@@ -25,13 +32,27 @@ def input_dataset(
     pd.DataFrame
         Selected dataset loaded into a dataframe.
     dict
-        Loading options selected by user (upload or download, dataset name if download).
+        Loading options selected by user (upload or download, dataset name if download,
+        restored experiment if an experiment is loaded).
     dict
         Lib configuration dictionary.
     dict
         Dictionary containing all datasets.
     """
     load_options, datasets = dict(), dict()
+    if st.checkbox("Load a saved experiment", False, help=readme["tooltips"]["load_experiment"]):
+        file = st.file_uploader(
+            "Upload an experiment zip file",
+            type="zip",
+            help=readme["tooltips"]["experiment_upload"],
+        )
+        if not file:
+            st.stop()
+        experiment = load_experiment_file(file)
+        load_options["experiment"] = experiment
+        load_options["dataset"] = file.name
+        load_options["toy_dataset"] = False
+        return experiment["df"], load_options, config, dict(experiment["datasets"])
     load_options["toy_dataset"] = st.checkbox(
         "Load a toy dataset", True, help=readme["tooltips"]["upload_choice"]
     )
@@ -42,7 +63,16 @@ def input_dataset(
             format_func=lambda x: config["datasets"][x]["name"],
             help=readme["tooltips"]["toy_dataset"],
         )
-        df = download_toy_dataset(config["datasets"][dataset_name]["url"])
+        dataset = config["datasets"][dataset_name]
+        if "path" in dataset:
+            df = load_local_dataset(dataset["path"])
+        else:
+            df = download_toy_dataset(
+                dataset["url"],
+                config["download"]["cache_dir"],
+                config["download"]["timeout"],
+                config["download"]["max_age"],
+            )
         load_options["dataset"] = dataset_name
         load_options["date_format"] = config["dataprep"]["date_format"]
         load_options["separator"] = ","
@@ -79,6 +109,7 @@ def input_dataset(
                     st.stop()
         if file:
             df = load_dataset(file, load_options)
+            load_options["dataset"] = file.name
         else:
             st.stop()
     datasets["uploaded"] = df.copy()
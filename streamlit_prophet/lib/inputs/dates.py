@@ -142,6 +142,52 @@ def input_cv(
     return dates
 
 
+def input_cv_early_stopping(
+    dates: Dict[Any, Any], config: Dict[Any, Any], readme: Dict[Any, Any]
+) -> Dict[Any, Any]:
+    """Lets the user define when to stop cross-validation early.
+
+    Parameters
+    ----------
+    dates : Dict
+        Dictionary containing cross-validation specifications.
+    config : Dict
+        Lib config dictionary containing default early stopping specifications.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+
+    Returns
+    -------
+    dict
+        Dictionary containing cross-validation specifications, with early stopping specifications.
+    """
+    dates["early_stopping"] = dict()
+    if st.checkbox(
+        "Stop cross-validation early",
+        value=config["split"]["early_stopping"],
+        help=readme["tooltips"]["cv_early_stopping"],
+    ):
+        dates["early_stopping"]["metric"] = st.selectbox(
+            "Metric to compare with reference",
+            ["MAPE", "SMAPE", "MSE", "RMSE", "MAE"],
+            help=readme["tooltips"]["cv_early_stopping_reference"],
+        )
+        dates["early_stopping"]["reference"] = st.number_input(
+            "Reference score",
+            min_value=0.0,
+            value=1.0,
+            format="%.4f",
+            help=readme["tooltips"]["cv_early_stopping_reference"],
+        )
+        dates["early_stopping"]["bound"] = st.selectbox(
+            "Stopping bound",
+            config["split"]["early_stopping_bound"],
+            help=readme["tooltips"]["cv_early_stopping_bound"],
+        )
+        dates["early_stopping"]["min_folds"] = config["split"]["early_stopping_min_folds"]
+    return dates
+
+
 def input_forecast_dates(
     df: pd.DataFrame,
     dates: Dict[Any, Any],
@@ -2,12 +2,14 @@ from typing import Any, Dict, List
 
 import pandas as pd
 import streamlit as st
-from streamlit_prophet.lib.utils.holidays import lockdown_format_func
-from streamlit_prophet.lib.utils.mapping import (
-    COUNTRY_NAMES_MAPPING,
-    COVID_LOCKDOWN_DATES_MAPPING,
-    SCHOOL_HOLIDAYS_FUNC_MAPPING,
+from streamlit_prophet.lib.models.screening import estimate_fit_time_saving
+from streamlit_prophet.lib.utils.calendars import (
+    LOCKDOWNS_CALENDAR,
+    SCHOOL_HOLIDAYS_CALENDAR,
+    get_calendar_registry,
 )
+from streamlit_prophet.lib.utils.holidays import lockdown_format_func
+from streamlit_prophet.lib.utils.mapping import COUNTRY_NAMES_MAPPING
 
 
 def input_seasonality_params(
@@ -35,6 +37,7 @@ def input_seasonality_params(
         Model parameters with seasonality parameters added.
     """
     default_params = config["model"]
+    tuned_fourier_orders = default_params.get("fourier_order", dict())
     seasonalities: Dict[str, Dict[Any, Any]] = {
         "yearly": {"period": 365.25, "prophet_param": None},
         "monthly": {"period": 30.5, "prophet_param": None},
@@ -44,9 +47,13 @@ def input_seasonality_params(
         seasonalities["daily"] = {"period": 1, "prophet_param": None}
     for seasonality, values in seasonalities.items():
 
+        options = (
+            ["auto", False, "custom"] if seasonality[0] in ["y", "w", "d"] else [False, "custom"]
+        )
         values["prophet_param"] = st.selectbox(
             f"{seasonality.capitalize()} seasonality",
-            ["auto", False, "custom"] if seasonality[0] in ["y", "w", "d"] else [False, "custom"],
+            options,
+            index=options.index("custom") if seasonality in tuned_fourier_orders else 0,
             help=readme["tooltips"]["seasonality"],
         )
         if values["prophet_param"] == "custom":
@@ -61,12 +68,14 @@ def input_seasonality_params(
                 ),
                 "fourier_order": st.number_input(
                     f"Fourier order for {seasonality} seasonality",
-                    value=15,
+                    value=tuned_fourier_orders.get(seasonality, 15),
                     help=readme["tooltips"]["seasonality_fourier"],
                 ),
                 "prior_scale": st.number_input(
                     f"Prior scale for {seasonality} seasonality",
-                    value=10,
+                    value=default_params["seasonality_prior_scale"]
+                    if seasonality in tuned_fourier_orders
+                    else 10,
                     help=readme["tooltips"]["seasonality_prior_scale"],
                 ),
             }
@@ -226,8 +235,9 @@ def input_holidays_params(
         help=readme["tooltips"]["public_holidays"],
     )
 
+    calendars = get_calendar_registry(config).get_calendars(country)
     school_holidays = False
-    if country in SCHOOL_HOLIDAYS_FUNC_MAPPING.keys():
+    if SCHOOL_HOLIDAYS_CALENDAR in calendars.keys():
         school_holidays = st.checkbox(
             label="School holidays",
             value=config["model"]["school_holidays"],
@@ -235,8 +245,8 @@ def input_holidays_params(
         )
 
     lockdowns = []
-    if country in COVID_LOCKDOWN_DATES_MAPPING.keys():
-        lockdown_options = list(range(len(COVID_LOCKDOWN_DATES_MAPPING[country])))
+    if LOCKDOWNS_CALENDAR in calendars.keys():
+        lockdown_options = list(range(len(calendars[LOCKDOWNS_CALENDAR].holidays)))
         lockdowns = st.multiselect(
             label="Lockdown events",
             options=lockdown_options,
@@ -245,11 +255,27 @@ def input_holidays_params(
             help=readme["tooltips"]["lockdown_events"],
         )
 
+    custom_calendars = {
+        calendar_id: calendar
+        for calendar_id, calendar in calendars.items()
+        if calendar_id not in [SCHOOL_HOLIDAYS_CALENDAR, LOCKDOWNS_CALENDAR]
+    }
+    selected_calendars = []
+    if len(custom_calendars) > 0:
+        selected_calendars = st.multiselect(
+            label="Other calendars",
+            options=list(custom_calendars.keys()),
+            default=[c for c in config["model"]["calendars"] if c in custom_calendars.keys()],
+            format_func=lambda x: custom_calendars[x].name,
+            help=readme["tooltips"]["calendars"],
+        )
+
     params["holidays"] = {
         "country": country,
         "public_holidays": public_holidays,
         "school_holidays": school_holidays,
         "lockdown_events": lockdowns,
+        "calendars": selected_calendars,
     }
     return params
 
@@ -277,6 +303,7 @@ def input_regressors(
     """
     regressors: Dict[Any, Any] = dict()
     default_params = config["model"]
+    screening = {"method": default_params["screening_method"][0], "budget": 0}
     all_cols = set(df.columns) - {"ds", "y"}
     mask = df[all_cols].isnull().sum() == 0
     eligible_cols = sorted(list(mask[mask].index))
@@ -315,9 +342,31 @@ def input_regressors(
                 value=default_params["regressors_prior_scale"],
                 help=readme["tooltips"]["regressor_prior_scale"],
             )
+        if len(regressor_cols) > 0:
+            screening["method"] = st.selectbox(
+                "Regressors pre-screening method",
+                default_params["screening_method"],
+                help=readme["tooltips"]["screening_method"],
+            )
+            screening["budget"] = st.number_input(
+                "Maximum number of regressors",
+                min_value=0,
+                value=default_params["regressors_budget"],
+                help=readme["tooltips"]["regressors_budget"],
+            )
+            if 0 < screening["budget"] < len(regressor_cols):
+                saving = estimate_fit_time_saving(
+                    {**params, "regressors": regressors}, screening["budget"]
+                )
+                st.info(
+                    f"Pre-screening will keep the {screening['budget']} regressors most related "
+                    f"to the target on training data, out of {len(regressor_cols)}. "
+                    f"Estimated fit time saving: {saving:.0%}."
+                )
     else:
         st.write("There are no regressors in your dataset.")
     params["regressors"] = regressors
+    params["screening"] = screening
     return params
 
 
@@ -0,0 +1,67 @@
+from typing import Any, Dict, List
+
+import streamlit as st
+
+
+def input_tuning(
+    config: Dict[Any, Any], params: Dict[Any, Any], readme: Dict[Any, Any]
+) -> Dict[Any, Any]:
+    """Lets the user define the hyperparameters search (method, search space, pruning).
+
+    Parameters
+    ----------
+    config : Dict
+        Lib config dictionary containing information about default search space.
+    params : Dict
+        Model parameters, used to list the seasonalities whose fourier order can be tuned.
+    readme : Dict
+        Dictionary containing tooltips to guide user's choices.
+
+    Returns
+    -------
+    dict
+        Dictionary containing hyperparameters search specifications.
+    """
+    default_tuning = config["tuning"]
+    tuning: Dict[Any, Any] = dict()
+    tuning["method"] = st.selectbox(
+        "Search method", default_tuning["method"], help=readme["tooltips"]["tuning_method"]
+    )
+    tuning["n_candidates"] = default_tuning["n_candidates"]
+    if tuning["method"] != "Grid":
+        tuning["n_candidates"] = st.number_input(
+            "Number of candidates",
+            value=default_tuning["n_candidates"],
+            min_value=2,
+            help=readme["tooltips"]["tuning_n_candidates"],
+        )
+    tuning["metric"] = st.selectbox(
+        "Metric to optimize",
+        ["MAPE", "SMAPE", "MSE", "RMSE", "MAE"],
+        help=readme["tooltips"]["tuning_metric"],
+    )
+    search_space: Dict[str, List[Any]] = dict()
+    for param in ["changepoint_prior_scale", "seasonality_prior_scale", "holidays_prior_scale"]:
+        search_space[param] = st.multiselect(
+            f"Values of {param}",
+            default_tuning[param],
+            default=default_tuning[param] if param != "holidays_prior_scale" else [],
+            help=readme["tooltips"]["tuning_search_space"],
+        )
+    for seasonality, values in params["seasonalities"].items():
+        if values["prophet_param"] is not False or "custom_param" in values:
+            search_space[f"{seasonality}_fourier_order"] = st.multiselect(
+                f"Fourier orders of {seasonality} seasonality",
+                default_tuning["fourier_order"],
+                default=[],
+                help=readme["tooltips"]["tuning_search_space"],
+            )
+    tuning["search_space"] = {k: v for k, v in search_space.items() if len(v) > 0}
+    tuning["pruning_ratio"] = st.number_input(
+        "Pruning ratio",
+        value=default_tuning["pruning_ratio"],
+        min_value=1.0,
+        help=readme["tooltips"]["tuning_pruning_ratio"],
+    )
+    tuning["n_jobs"] = default_tuning["n_jobs"] if default_tuning["n_jobs"] else None
+    return tuning
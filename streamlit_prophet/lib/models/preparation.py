@@ -1,14 +1,14 @@
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
+import hashlib
+
+import numpy as np
 import pandas as pd
-from prophet import Prophet
-from streamlit_prophet.lib.utils.holidays import lockdown_format_func
-from streamlit_prophet.lib.utils.mapping import (
-    COVID_LOCKDOWN_DATES_MAPPING,
-    SCHOOL_HOLIDAYS_FUNC_MAPPING,
-    convert_into_nb_of_days,
-    convert_into_nb_of_seconds,
-)
+from streamlit_prophet.lib.utils.calendars import get_holidays_df
+from streamlit_prophet.lib.utils.mapping import convert_into_nb_of_days, convert_into_nb_of_seconds
+
+if TYPE_CHECKING:
+    from prophet import Prophet
 
 
 def get_prophet_cv_horizon(dates: Dict[Any, Any], resampling: Dict[Any, Any]) -> str:
@@ -35,8 +35,39 @@ def get_prophet_cv_horizon(dates: Dict[Any, Any], resampling: Dict[Any, Any]) ->
     return prophet_horizon
 
 
+def remove_empty_regressors(params: Dict[Any, Any], df: pd.DataFrame) -> Dict[Any, Any]:
+    """Removes from model parameters the regressors that are always 0 in training data,
+    e.g. dummies of categories that only appear outside the training period.
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters.
+    df : pd.DataFrame
+        Training dataframe.
+
+    Returns
+    -------
+    dict
+        Model parameters without the regressors that are always 0 in training data.
+    """
+    empty_regressors = {
+        regressor
+        for regressor in params["regressors"]
+        if regressor in df.columns and not df[regressor].fillna(0).astype(bool).any()
+    }
+    if len(empty_regressors) == 0:
+        return params
+    regressors = {
+        regressor: values
+        for regressor, values in params["regressors"].items()
+        if regressor not in empty_regressors
+    }
+    return {**params, "regressors": regressors}
+
+
 def add_prophet_holidays(
-    model: Prophet, holidays_params: Dict[Any, Any], dates: Dict[Any, Any]
+    model: "Prophet", holidays_params: Dict[Any, Any], dates: Dict[Any, Any]
 ) -> pd.DataFrame:
     """Add all available holidays to the Prophet model
 
@@ -54,37 +85,34 @@ def add_prophet_holidays(
     Prophet
         Prophet model with holidays added
     """
-    country = holidays_params["country"]
     if holidays_params["public_holidays"]:
-        model.add_country_holidays(country)
-
-    holidays_df_list = []
-    if holidays_params["school_holidays"]:
-        all_dates = {
-            k: v
-            for k, v in dates.items()
-            if k not in ["n_folds", "folds_horizon", "forecast_horizon", "cutoffs", "forecast_freq"]
-        }
-        years = list(range(min(all_dates.values()).year, max(all_dates.values()).year + 1))
-        get_holidays_func = SCHOOL_HOLIDAYS_FUNC_MAPPING[country]
-        holidays_df = get_holidays_func(years)
-        holidays_df[["lower_window", "upper_window"]] = 0
-        holidays_df_list.append(holidays_df)
-
-    for lockdown_idx in holidays_params["lockdown_events"]:
-        start, end = COVID_LOCKDOWN_DATES_MAPPING[country][lockdown_idx]
-        lockdown_df = pd.DataFrame(
-            {
-                "holiday": lockdown_format_func(lockdown_idx),
-                "ds": pd.date_range(start=start, end=end),
-                "lower_window": 0,
-                "upper_window": 0,
-            }
-        )
-        holidays_df_list.append(lockdown_df)
-
-    if len(holidays_df_list) == 0:
-        return model
-    holidays_df = pd.concat(holidays_df_list, sort=True)
-    model.holidays = holidays_df
+        # Public holidays are computed by Prophet for any fitted or predicted year
+        model.add_country_holidays(holidays_params["country"])
+    holidays_df = get_holidays_df(holidays_params, dates)
+    if holidays_df is not None:
+        model.holidays = holidays_df
     return model
+
+
+def get_model_fingerprint(model: "Prophet") -> str:
+    """Returns a hash of a fitted model, identical for two models fitted the same way on the same data.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted model.
+
+    Returns
+    -------
+    str
+        Hash of model parameters, components and training data.
+    """
+    hasher = hashlib.md5()
+    for name in sorted(model.params):
+        hasher.update(name.encode())
+        hasher.update(np.ascontiguousarray(model.params[name]).tobytes())
+    hasher.update(str(sorted(model.component_modes["multiplicative"])).encode())
+    if model.train_holiday_names is not None:
+        hasher.update(str(sorted(model.train_holiday_names)).encode())
+    hasher.update(pd.util.hash_pandas_object(model.history, index=False).values.tobytes())
+    return hasher.hexdigest()
@@ -1,14 +1,34 @@
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 from prophet import Prophet
 from prophet.diagnostics import cross_validation
+from prophet.utilities import warm_start_params
 from streamlit_prophet.lib.dataprep.clean import exp_transform
 from streamlit_prophet.lib.dataprep.format import check_future_regressors_df
 from streamlit_prophet.lib.dataprep.split import make_eval_df, make_future_df
+from streamlit_prophet.lib.evaluation.metrics import get_perf_metrics
+from streamlit_prophet.lib.evaluation.preparation import get_evaluation_df
 from streamlit_prophet.lib.exposition.preparation import get_df_cv_with_hist
-from streamlit_prophet.lib.models.preparation import add_prophet_holidays, get_prophet_cv_horizon
-from streamlit_prophet.lib.utils.logging import suppress_stdout_stderr
+from streamlit_prophet.lib.models.preparation import (
+    add_prophet_holidays,
+    get_prophet_cv_horizon,
+    remove_empty_regressors,
+)
+from streamlit_prophet.lib.utils.cache import shared_cache
+from streamlit_prophet.lib.utils.logging import capture_fit_logs, get_fit_reports, make_fit_report
+
+FUTURE_FIT_REUSE = "reuse"
+FUTURE_FIT_WARM_START = "warm_start"
+FUTURE_FIT_FULL = "full"
+FUTURE_FIT_DESCRIPTIONS = {
+    FUTURE_FIT_REUSE: "Evaluation model reused, as it was trained on the whole dataset",
+    FUTURE_FIT_WARM_START: "Model trained on the whole dataset, initialized with the evaluation model",
+    FUTURE_FIT_FULL: "Model trained on the whole dataset",
+}
 
 
 def instantiate_prophet_model(
@@ -49,6 +69,7 @@ def instantiate_prophet_model(
     return model
 
 
+@shared_cache("models", ignore=["progress"])
 def forecast_workflow(
     config: Dict[Any, Any],
     use_cv: bool,
@@ -64,6 +85,7 @@ def forecast_workflow(
     target_col: str,
     dimensions: Dict[Any, Any],
     load_options: Dict[Any, Any],
+    progress: Optional[Callable[[float, str], None]] = None,
 ) -> Tuple[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]:
     """Trains a Prophet model and makes a prediction on evaluation data and future data if needed.
 
@@ -97,6 +119,8 @@ def forecast_workflow(
         Dictionary containing dimensions information.
     load_options : Dict
         Loading options selected by user.
+    progress : Callable, optional
+        Function called with the share of work done and the current step, to report progress.
 
     Returns
     -------
@@ -109,14 +133,13 @@ def forecast_workflow(
     """
     models: Dict[Any, Any] = dict()
     forecasts: Dict[Any, Any] = dict()
-    with suppress_stdout_stderr():
-        if evaluate:
-            datasets, models, forecasts = forecast_eval(
-                config, use_cv, resampling, params, dates, datasets, models, forecasts
-            )
-        if make_future_forecast:
-            datasets, models, forecasts = forecast_future(
+    progress = progress or (lambda share, step: None)
+    with capture_fit_logs():
+        if evaluate & make_future_forecast & config["model"]["parallel_fits"]:
+            progress(0.0, "Training and evaluating model, and training model on the whole dataset")
+            datasets, models, forecasts = forecast_eval_and_future(
                 config,
+                use_cv,
                 params,
                 cleaning,
                 dates,
@@ -130,11 +153,103 @@ def forecast_workflow(
                 dimensions,
                 load_options,
             )
+        else:
+            if evaluate:
+                progress(0.0, "Training and evaluating model")
+                datasets, models, forecasts = forecast_eval(
+                    config, use_cv, resampling, params, dates, datasets, models, forecasts
+                )
+            if make_future_forecast:
+                progress(0.5 * evaluate, "Training model on the whole dataset and forecasting")
+                datasets, models, forecasts = forecast_future(
+                    config,
+                    params,
+                    cleaning,
+                    dates,
+                    datasets,
+                    models,
+                    forecasts,
+                    df,
+                    resampling,
+                    date_col,
+                    target_col,
+                    dimensions,
+                    load_options,
+                )
     if cleaning["log_transform"] & (evaluate | make_future_forecast):
         datasets, forecasts = exp_transform(datasets, forecasts)
     return datasets, models, forecasts
 
 
+def check_forecast_inputs(
+    config: Dict[Any, Any],
+    use_cv: bool,
+    make_future_forecast: bool,
+    evaluate: bool,
+    cleaning: Dict[Any, Any],
+    resampling: Dict[Any, Any],
+    params: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    datasets: Dict[Any, Any],
+    df: pd.DataFrame,
+    date_col: str,
+    target_col: str,
+    dimensions: Dict[Any, Any],
+    load_options: Dict[Any, Any],
+) -> None:
+    """Runs the input checks of forecast_workflow, which display an error and stop the app
+    if inputs are invalid. Called in the app before running the workflow in a background job,
+    where these errors would not be displayed.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary.
+    use_cv : bool
+        Whether or not cross-validation is used.
+    make_future_forecast : bool
+        Whether or not to make a forecast on future dates.
+    evaluate : bool
+        Whether or not to do a model evaluation.
+    cleaning : Dict
+        Dataset cleaning specifications.
+    resampling : Dict
+        Dataset resampling specifications.
+    params : Dict
+        Model parameters.
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+    datasets : Dict
+        Dictionary containing all relevant dataframes for training and forecasting.
+    df : pd.DataFrame
+        Full input dataframe, after cleaning, filtering and resampling.
+    date_col : str
+        Name of date column.
+    target_col : str
+        Name of target column.
+    dimensions : Dict
+        Dictionary containing dimensions information.
+    load_options : Dict
+        Loading options selected by user.
+    """
+    if make_future_forecast:
+        future_datasets = dict(datasets)
+        check_future_regressors_df(future_datasets, dates, params, resampling, date_col, dimensions)
+        make_future_df(
+            dates,
+            df,
+            future_datasets,
+            cleaning,
+            date_col,
+            target_col,
+            dimensions,
+            load_options,
+            config,
+            resampling,
+            params,
+        )
+
+
 def forecast_eval(
     config: Dict[Any, Any],
     use_cv: bool,
@@ -175,15 +290,24 @@ def forecast_eval(
     dict
         Dictionary containing the different forecasts.
     """
-    models["eval"] = instantiate_prophet_model(params, dates=dates)
-    models["eval"].fit(datasets["train"], seed=config["global"]["seed"])
+    models["eval"] = instantiate_prophet_model(
+        remove_empty_regressors(params, datasets["train"]), dates=dates
+    )
+    get_fit_reports(config).add(
+        fit_prophet_model(models["eval"], datasets["train"], "eval", seed=config["global"]["seed"])
+    )
     if use_cv:
-        forecasts["cv"] = cross_validation(
-            models["eval"],
-            cutoffs=dates["cutoffs"],
-            horizon=get_prophet_cv_horizon(dates, resampling),
-            parallel="processes",
-        )
+        if dates.get("early_stopping"):
+            forecasts["cv"], forecasts["cv_early_stopping"] = cross_validation_early_stopping(
+                models["eval"], dates, resampling, config
+            )
+        else:
+            forecasts["cv"] = cross_validation(
+                models["eval"],
+                cutoffs=dates["cutoffs"],
+                horizon=get_prophet_cv_horizon(dates, resampling),
+                parallel="processes",
+            )
         forecasts["cv_with_hist"] = get_df_cv_with_hist(forecasts, datasets, models)
     else:
         datasets = make_eval_df(datasets)
@@ -191,6 +315,90 @@ def forecast_eval(
     return datasets, models, forecasts
 
 
+def cross_validation_early_stopping(
+    model: Prophet, dates: Dict[Any, Any], resampling: Dict[Any, Any], config: Dict[Any, Any]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Runs cross-validation from the most recent fold, and stops as soon as a bound on the
+    average error over all folds shows that the model can't beat a reference score.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted Prophet model.
+    dates : Dict
+        Dictionary containing cross-validation cutoffs, horizon and early stopping specifications.
+    resampling : Dict
+        Dataset resampling specifications.
+    config : Dict
+        Lib configuration dictionary.
+
+    Returns
+    -------
+    pd.DataFrame
+        Cross-validation forecasts on the evaluated folds.
+    pd.DataFrame
+        Running metric after each batch of folds, with the bound compared to the reference score.
+    """
+    early_stopping = dates["early_stopping"]
+    metric = early_stopping["metric"]
+    eval = {"granularity": "cutoff", "metrics": [metric], "get_perf_on_agg_forecast": False}
+    cutoffs = sorted(dates["cutoffs"], reverse=True)
+    batch_size = max(int(early_stopping["min_folds"]), 1)
+    df_cv_list: List[pd.DataFrame] = []
+    running_metrics = []
+    for start in range(0, len(cutoffs), batch_size):
+        df_cv_list.append(
+            cross_validation(
+                model,
+                cutoffs=sorted(cutoffs[start : start + batch_size]),
+                horizon=get_prophet_cv_horizon(dates, resampling),
+                parallel="processes",
+            )
+        )
+        df_cv = pd.concat(df_cv_list, ignore_index=True)
+        evaluation_df = get_evaluation_df(dict(), {"cv": df_cv}, dates, eval, True)
+        _, metrics_dict = get_perf_metrics(evaluation_df, eval, dates, resampling, True, config)
+        folds_errors = metrics_dict[metric][metric].astype(float)
+        bound = get_early_stopping_bound(list(folds_errors), len(cutoffs), early_stopping["bound"])
+        stop = bound > early_stopping["reference"] and len(folds_errors) < len(cutoffs)
+        running_metrics.append(
+            {
+                "Folds evaluated": len(folds_errors),
+                "Folds total": len(cutoffs),
+                metric: float(folds_errors.mean()),
+                "Bound": bound,
+                "Reference": float(early_stopping["reference"]),
+                "Stopped": bool(stop),
+            }
+        )
+        if stop:
+            break
+    return df_cv.sort_values(["cutoff", "ds"]).reset_index(drop=True), pd.DataFrame(running_metrics)
+
+
+def get_early_stopping_bound(folds_errors: List[float], n_folds: int, bound: str) -> float:
+    """Computes a lower bound of the error averaged over all folds, from the folds already evaluated.
+
+    Parameters
+    ----------
+    folds_errors : List[float]
+        Errors on the folds already evaluated.
+    n_folds : int
+        Total number of folds.
+    bound : str
+        "optimistic" assumes a null error on the remaining folds, so stopping is always safe.
+        "running_mean" assumes the remaining folds have the same average error as the evaluated ones.
+
+    Returns
+    -------
+    float
+        Lower bound of the error averaged over all folds.
+    """
+    if bound == "running_mean":
+        return float(sum(folds_errors) / len(folds_errors))
+    return float(sum(folds_errors) / n_folds)
+
+
 def forecast_future(
     config: Dict[Any, Any],
     params: Dict[Any, Any],
@@ -207,6 +415,7 @@ def forecast_future(
     load_options: Dict[Any, Any],
 ) -> Tuple[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]:
     """Trains a Prophet model on the whole dataset and makes a prediction on future data.
+    The evaluation model is reused instead if it was already trained on the whole dataset.
 
     Parameters
     ----------
@@ -262,7 +471,299 @@ def forecast_future(
         resampling,
         params,
     )
-    models["future"] = instantiate_prophet_model(params, use_regressors=use_regressors, dates=dates)
-    models["future"].fit(datasets["full"], seed=config["global"]["seed"])
-    forecasts["future"] = models["future"].predict(datasets["future"])
+    models, forecasts = fit_future_model(
+        config, params, dates, datasets, models, forecasts, use_regressors
+    )
     return datasets, models, forecasts
+
+
+def forecast_eval_and_future(
+    config: Dict[Any, Any],
+    use_cv: bool,
+    params: Dict[Any, Any],
+    cleaning: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    datasets: Dict[Any, Any],
+    models: Dict[Any, Any],
+    forecasts: Dict[Any, Any],
+    df: pd.DataFrame,
+    resampling: Dict[Any, Any],
+    date_col: str,
+    target_col: str,
+    dimensions: Dict[Any, Any],
+    load_options: Dict[Any, Any],
+) -> Tuple[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]:
+    """Trains the evaluation model and the model on the whole dataset at the same time,
+    the latter in a separate process, and makes their predictions.
+
+    Both models are fitted with the configured random seed, so results are the same as when fitted
+    one after the other. The model on the whole dataset is fitted after the evaluation model
+    when it is initialized with or replaced by the evaluation model.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary, containing information about random seed to use for training.
+    use_cv : bool
+        Whether or not cross-validation is used.
+    params : Dict
+        Model parameters.
+    cleaning : Dict
+        Dataset cleaning specifications.
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+    datasets : Dict
+        Dictionary containing all relevant dataframes for training and forecasting.
+    models : Dict
+        Dictionary containing instantiated Prophet models.
+    forecasts : Dict
+        Dictionary containing the different forecasts.
+    df : pd.DataFrame
+        Full input dataframe, after cleaning, filtering and resampling.
+    resampling : Dict
+        Dictionary containing dataset frequency information.
+    date_col : str
+        Name of date column.
+    target_col : str
+        Name of target column.
+    dimensions : Dict
+        Dictionary containing dimensions information.
+    load_options : Dict
+        Loading options selected by user.
+
+    Returns
+    -------
+    dict
+        Dictionary containing all relevant datasets for training and forecasting.
+    dict
+        Dictionary containing fitted Prophet models.
+    dict
+        Dictionary containing the different forecasts.
+    """
+    use_regressors = check_future_regressors_df(
+        datasets, dates, params, resampling, date_col, dimensions
+    )
+    datasets = make_future_df(
+        dates,
+        df,
+        datasets,
+        cleaning,
+        date_col,
+        target_col,
+        dimensions,
+        load_options,
+        config,
+        resampling,
+        params,
+    )
+    if config["model"]["warm_start_future"] or is_eval_model_reusable(
+        datasets, params, use_regressors
+    ):
+        datasets, models, forecasts = forecast_eval(
+            config, use_cv, resampling, params, dates, datasets, models, forecasts
+        )
+        models, forecasts = fit_future_model(
+            config, params, dates, datasets, models, forecasts, use_regressors
+        )
+        return datasets, models, forecasts
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        future_fit = executor.submit(
+            fit_and_predict,
+            params,
+            dates,
+            datasets["full"],
+            datasets["future"],
+            config["global"]["seed"],
+            use_regressors,
+        )
+        datasets, models, forecasts = forecast_eval(
+            config, use_cv, resampling, params, dates, datasets, models, forecasts
+        )
+        models["future"], forecasts["future"], fit_report = future_fit.result()
+    get_fit_reports(config).add(fit_report)
+    return datasets, models, forecasts
+
+
+def fit_future_model(
+    config: Dict[Any, Any],
+    params: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    datasets: Dict[Any, Any],
+    models: Dict[Any, Any],
+    forecasts: Dict[Any, Any],
+    use_regressors: bool,
+) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+    """Fits the model on the whole dataset, or reuses the evaluation model if it was trained on the
+    whole dataset, and makes a prediction on future data.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary, containing random seed and warm start specifications.
+    params : Dict
+        Model parameters.
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+    datasets : Dict
+        Dictionary containing the whole dataset and the future dataframe.
+    models : Dict
+        Dictionary containing fitted Prophet models.
+    forecasts : Dict
+        Dictionary containing the different forecasts.
+    use_regressors : bool
+        Whether or not the future model uses regressors.
+
+    Returns
+    -------
+    dict
+        Dictionary containing fitted Prophet models.
+    dict
+        Dictionary containing the different forecasts.
+    """
+    if ("eval" in models) and is_eval_model_reusable(datasets, params, use_regressors):
+        models["future"] = models["eval"]
+        forecasts["future"] = models["future"].predict(datasets["future"])
+    else:
+        init = None
+        if ("eval" in models) & config["model"]["warm_start_future"]:
+            init = warm_start_params(models["eval"])
+        models["future"], forecasts["future"], fit_report = fit_and_predict(
+            params,
+            dates,
+            datasets["full"],
+            datasets["future"],
+            config["global"]["seed"],
+            use_regressors,
+            init,
+        )
+        get_fit_reports(config).add(fit_report)
+    return models, forecasts
+
+
+def fit_and_predict(
+    params: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    train: pd.DataFrame,
+    future: pd.DataFrame,
+    seed: int,
+    use_regressors: bool = True,
+    init: Optional[Dict[str, Any]] = None,
+) -> Tuple[Prophet, pd.DataFrame, Dict[str, Any]]:
+    """Fits a Prophet model on the whole dataset and makes a prediction,
+    in the current process or in a process pool worker.
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters.
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+    train : pd.DataFrame
+        Training dataframe.
+    future : pd.DataFrame
+        Dataframe of the dates to predict.
+    seed : int
+        Random seed used for model fitting.
+    use_regressors : bool
+        Whether or not to add regressors to the model.
+    init : Dict, optional
+        Initial values of the model parameters, default Prophet initialization if None.
+
+    Returns
+    -------
+    Prophet
+        Fitted Prophet model.
+    pd.DataFrame
+        Forecast on future dataframe.
+    dict
+        Fit report, with captured logs and Stan output.
+    """
+    fit_kwargs: Dict[str, Any] = dict(seed=seed)
+    if init is not None:
+        fit_kwargs["init"] = init
+    model = instantiate_prophet_model(
+        remove_empty_regressors(params, train), use_regressors=use_regressors, dates=dates
+    )
+    fit_report = fit_prophet_model(model, train, "future", **fit_kwargs)
+    with capture_fit_logs():
+        forecast = model.predict(future)
+    return model, forecast, fit_report
+
+
+def fit_prophet_model(
+    model: Prophet, df: pd.DataFrame, name: str, **fit_kwargs: Any
+) -> Dict[str, Any]:
+    """Fits a Prophet model, capturing Prophet and cmdstanpy logs of the current thread only.
+
+    Parameters
+    ----------
+    model : Prophet
+        Instantiated Prophet model.
+    df : pd.DataFrame
+        Training dataframe.
+    name : str
+        Name of the model, displayed in the fit report.
+    **fit_kwargs : Any
+        Arguments of Prophet fit method.
+
+    Returns
+    -------
+    dict
+        Fit report, with captured logs, Stan output and number of iterations.
+    """
+    start = time.perf_counter()
+    with capture_fit_logs() as logs:
+        model.fit(df, **fit_kwargs)
+    return make_fit_report(name, model, logs, time.perf_counter() - start)
+
+
+def is_eval_model_reusable(
+    datasets: Dict[Any, Any],
+    params: Dict[Any, Any],
+    use_regressors: bool,
+) -> bool:
+    """Checks whether the evaluation model was trained on the whole dataset with the same
+    specifications as the future model, in which case fitting the future model would give the same model.
+
+    Parameters
+    ----------
+    datasets : Dict
+        Dictionary containing training data and the whole dataset.
+    params : Dict
+        Model parameters.
+    use_regressors : bool
+        Whether or not the future model uses regressors.
+
+    Returns
+    -------
+    bool
+        True if the evaluation model can be used to forecast future dates.
+    """
+    if not use_regressors and len(params["regressors"]) > 0:
+        return False
+    cols = ["ds", "y"] + list(params["regressors"].keys())
+    train, full = datasets["train"], datasets["full"]
+    if (len(train) != len(full)) or not set(cols).issubset(set(full.columns)):
+        return False
+    return bool(train[cols].reset_index(drop=True).equals(full[cols].reset_index(drop=True)))
+
+
+def get_future_fit_path(models: Dict[Any, Any]) -> str:
+    """Returns how the model used to forecast future dates was obtained.
+
+    Parameters
+    ----------
+    models : Dict
+        Dictionary containing fitted Prophet models.
+
+    Returns
+    -------
+    str
+        FUTURE_FIT_REUSE if the evaluation model was reused, FUTURE_FIT_WARM_START if the future model
+        was initialized with the evaluation model parameters, FUTURE_FIT_FULL otherwise.
+    """
+    if ("eval" in models) and (models["future"] is models["eval"]):
+        return FUTURE_FIT_REUSE
+    if "init" in getattr(models["future"], "fit_kwargs", dict()):
+        return FUTURE_FIT_WARM_START
+    return FUTURE_FIT_FULL
@@ -0,0 +1,164 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Fourier orders used by Prophet when a built-in seasonality is enabled with its default settings
+PROPHET_FOURIER_ORDERS = {"yearly": 10, "weekly": 3, "daily": 4}
+
+
+def correlation_scores(df: pd.DataFrame, regressors: List[Any]) -> pd.Series:
+    """Computes the absolute Pearson correlation between each regressor and the target.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Training dataframe, with target column 'y' without missing values and regressors columns.
+    regressors : List
+        Names of the regressors to score.
+
+    Returns
+    -------
+    pd.Series
+        Score of each regressor, between 0 and 1, 0 for constant regressors.
+    """
+    X = df[regressors].to_numpy(dtype=float)
+    y = df["y"].to_numpy(dtype=float)
+    X = X - X.mean(axis=0)
+    y = y - y.mean()
+    norms = np.sqrt((X**2).sum(axis=0) * (y**2).sum())
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(norms > 0, np.abs(X.T @ y) / norms, 0.0)
+    return pd.Series(scores, index=regressors)
+
+
+def mutual_information_scores(
+    df: pd.DataFrame, regressors: List[Any], n_bins: int = 10
+) -> pd.Series:
+    """Computes the mutual information between each regressor and the target,
+    after binning continuous values into quantiles.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Training dataframe, with target column 'y' without missing values and regressors columns.
+    regressors : List
+        Names of the regressors to score.
+    n_bins : int
+        Maximum number of bins of the target and of each continuous regressor.
+
+    Returns
+    -------
+    pd.Series
+        Mutual information of each regressor with the target, in nats.
+    """
+    y_codes = _get_bins_codes(df["y"], n_bins)
+    n_y = y_codes.max() + 1
+    p_y = np.bincount(y_codes, minlength=n_y) / len(y_codes)
+    scores = []
+    for regressor in regressors:
+        x_codes = _get_bins_codes(df[regressor], n_bins)
+        n_x = x_codes.max() + 1
+        p_xy = np.bincount(x_codes * n_y + y_codes, minlength=n_x * n_y).reshape(n_x, n_y)
+        p_xy = p_xy / len(y_codes)
+        p_x_p_y = np.outer(p_xy.sum(axis=1), p_y)
+        nonzero = p_xy > 0
+        scores.append(float((p_xy[nonzero] * np.log(p_xy[nonzero] / p_x_p_y[nonzero])).sum()))
+    return pd.Series(scores, index=regressors)
+
+
+def _get_bins_codes(values: pd.Series, n_bins: int) -> np.ndarray:
+    """Returns the codes of the distinct values of a column if there are at most n_bins of them,
+    and the codes of its quantile bins otherwise.
+    """
+    if values.nunique() <= n_bins:
+        return pd.factorize(values)[0]
+    return pd.qcut(values, n_bins, labels=False, duplicates="drop").to_numpy(dtype=int)
+
+
+SCREENING_METHODS: Dict[str, Callable[[pd.DataFrame, List[Any]], pd.Series]] = {
+    "Correlation": correlation_scores,
+    "Mutual information": mutual_information_scores,
+}
+
+
+def screen_regressors(
+    params: Dict[Any, Any], df: pd.DataFrame
+) -> Tuple[Dict[Any, Any], pd.DataFrame]:
+    """Ranks regressors by their relationship with the target on training data,
+    and keeps the best ones within the regressors budget.
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters, containing regressors and screening specifications (method and budget).
+    df : pd.DataFrame
+        Training dataframe.
+
+    Returns
+    -------
+    dict
+        Model parameters, with only the regressors kept by the screening.
+    pd.DataFrame
+        Score of each regressor, the best one first, and whether or not it is kept.
+    """
+    regressors = sorted(params["regressors"].keys())
+    budget = int(params["screening"]["budget"])
+    df = df.loc[df["y"].notnull()]  # Prophet also ignores rows with missing target when fitting
+    scores = SCREENING_METHODS[params["screening"]["method"]](df, regressors)
+    ranking = (
+        pd.DataFrame({"Regressor": regressors, "Score": scores.values})
+        .sort_values(["Score", "Regressor"], ascending=[False, True], kind="stable")
+        .reset_index(drop=True)
+    )
+    ranking["Kept"] = (budget <= 0) | (ranking.index < budget)
+    kept = set(ranking.loc[ranking["Kept"], "Regressor"])
+    params = {
+        **params,
+        "regressors": {k: v for k, v in params["regressors"].items() if k in kept},
+    }
+    return params, ranking
+
+
+def get_n_seasonality_features(params: Dict[Any, Any]) -> int:
+    """Returns the number of Fourier features of the seasonalities of the model.
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters.
+
+    Returns
+    -------
+    int
+        Number of seasonality features.
+    """
+    n_features = 0
+    for seasonality, values in params["seasonalities"].items():
+        if "custom_param" in values:
+            n_features += 2 * int(values["custom_param"]["fourier_order"])
+        elif values.get("prophet_param") not in [False, None]:
+            n_features += 2 * PROPHET_FOURIER_ORDERS.get(seasonality, 0)
+    return n_features
+
+
+def estimate_fit_time_saving(params: Dict[Any, Any], n_kept: int) -> float:
+    """Estimates the share of fit time saved by keeping only some regressors. Stan fit time grows
+    about linearly with the number of features of the model (seasonalities and regressors).
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters, with all selected regressors.
+    n_kept : int
+        Number of regressors kept.
+
+    Returns
+    -------
+    float
+        Estimated share of fit time saved, between 0 and 1.
+    """
+    n_regressors = len(params["regressors"])
+    n_removed = max(n_regressors - n_kept, 0)
+    n_features = get_n_seasonality_features(params) + n_regressors
+    return n_removed / n_features if n_features > 0 else 0.0
@@ -0,0 +1,488 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from zipfile import ZipFile
+
+import numpy as np
+import pandas as pd
+import toml
+from streamlit_prophet.lib.utils.experiments import (
+    get_experiment_artifacts_path,
+    load_experiment_model,
+    load_experiments_index,
+)
+
+if TYPE_CHECKING:
+    from prophet import Prophet
+
+FORECAST_COLS = ["ds", "yhat", "yhat_lower", "yhat_upper"]
+
+
+class ModelPool:
+    """Pool of fitted models loaded from the experiment store or from exported zip files.
+
+    Models are identified by '<source>/<model name>', where source is either an experiment id
+    or the name of a zip file without extension. Least recently used models are unloaded
+    when more than max_models models are loaded. Models are loaded outside of the pool lock,
+    so that a slow load only blocks the requests for the model being loaded.
+    """
+
+    def __init__(
+        self,
+        store_path: Optional[Path] = None,
+        zip_paths: Optional[List[Path]] = None,
+        max_models: int = 8,
+    ):
+        self.store_path = store_path
+        self.zip_paths = {Path(path).stem: Path(path) for path in (zip_paths or [])}
+        self.max_models = max_models
+        self.models: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"hits": 0, "loads": 0, "evictions": 0}
+        self.loading: Dict[str, Future] = dict()
+        self.lock = threading.Lock()
+
+    @property
+    def loaded(self) -> List[str]:
+        """Ids of the models currently loaded, least recently used first."""
+        with self.lock:
+            return list(self.models.keys())
+
+    def list_models(self) -> List[str]:
+        """Returns the ids of all models that can be served.
+
+        Returns
+        -------
+        List[str]
+            Model ids.
+        """
+        model_ids = []
+        for source, zip_path in self.zip_paths.items():
+            with ZipFile(zip_path) as zip_file:
+                model_ids += [
+                    f"{source}/{Path(name).stem}"
+                    for name in zip_file.namelist()
+                    if Path(name).parent.name == "models" and name.endswith(".json")
+                ]
+        if self.store_path is not None:
+            for experiment_id in load_experiments_index(self.store_path)["id"]:
+                artifacts_path = get_experiment_artifacts_path(self.store_path, experiment_id)
+                model_ids += [
+                    f"{experiment_id}/{path.stem}"
+                    for path in sorted((artifacts_path / "models").glob("*.json"))
+                ]
+        return model_ids
+
+    def get(self, model_id: str) -> Dict[str, Any]:
+        """Returns a served model, loading it if needed.
+
+        Parameters
+        ----------
+        model_id : str
+            Model id, '<experiment id or zip name>/<model name>'.
+
+        Returns
+        -------
+        dict
+            Fitted model ('model') and whether its forecasts must be exp transformed ('log_transform').
+        """
+        with self.lock:
+            if model_id in self.models:
+                self.stats["hits"] += 1
+                self.models.move_to_end(model_id)
+                return self.models[model_id]
+            # Concurrent requests for a model being loaded wait for the same load
+            loading = self.loading.get(model_id)
+            if loading is None:
+                loading = self.loading[model_id] = Future()
+                is_loader = True
+            else:
+                is_loader = False
+        if not is_loader:
+            return loading.result()
+        try:
+            model, specs = self._load(model_id)
+        except BaseException as e:
+            with self.lock:
+                del self.loading[model_id]
+            loading.set_exception(e)
+            raise
+        served = {
+            "model": model,
+            "log_transform": bool(specs.get("cleaning", {}).get("log_transform", False)),
+        }
+        with self.lock:
+            del self.loading[model_id]
+            self.models[model_id] = served
+            self.stats["loads"] += 1
+            while len(self.models) > self.max_models:
+                self.models.popitem(last=False)
+                self.stats["evictions"] += 1
+        loading.set_result(served)
+        return served
+
+    def _load(self, model_id: str) -> Tuple["Prophet", Dict[Any, Any]]:
+        """Loads a model and the specifications of the experiment it belongs to.
+
+        Parameters
+        ----------
+        model_id : str
+            Model id, '<experiment id or zip name>/<model name>'.
+
+        Returns
+        -------
+        Prophet
+            Fitted model.
+        dict
+            Experiment specifications.
+        """
+        source, _, model_name = model_id.rpartition("/")
+        if source in self.zip_paths:
+            return load_zip_model(self.zip_paths[source], model_name)
+        if self.store_path is not None and source != "":
+            return load_experiment_model(self.store_path, source, model_name)
+        raise KeyError(f"Model {model_id} not found")
+
+
+def load_zip_model(zip_path: Path, model_name: str) -> Tuple["Prophet", Dict[Any, Any]]:
+    """Loads a model from an experiment exported as a zip file, with the experiment specifications.
+
+    Parameters
+    ----------
+    zip_path : Path
+        Path of the zip file.
+    model_name : str
+        Name of the model, among "eval" and "future".
+
+    Returns
+    -------
+    Prophet
+        Fitted model.
+    dict
+        Experiment specifications, empty if the zip file doesn't contain them.
+    """
+    from prophet.serialize import model_from_json
+
+    with ZipFile(zip_path) as zip_file:
+        names = zip_file.namelist()
+        model_files = [name for name in names if name.endswith(f"models/{model_name}.json")]
+        if len(model_files) == 0:
+            raise KeyError(f"Model {model_name} not found in {zip_path.name}")
+        model = model_from_json(zip_file.read(model_files[0]).decode())
+        specs_files = [name for name in names if name.endswith("config/user_specifications.toml")]
+        specs = toml.loads(zip_file.read(specs_files[0]).decode()) if specs_files else dict()
+    return model, specs
+
+
+def make_future_df(model: "Prophet", request: Dict[str, Any]) -> pd.DataFrame:
+    """Builds the dataframe to predict for a forecast request.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted model.
+    request : Dict
+        Forecast request, with either 'dates' or 'horizon' (and optionally 'freq', 'D' by default),
+        and 'regressors' giving values of the model regressors, and of cap and floor for logistic growth.
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with a 'ds' column and one column per model regressor.
+    """
+    if "dates" in request:
+        future = pd.DataFrame({"ds": pd.to_datetime(request["dates"])})
+    else:
+        future = model.make_future_dataframe(
+            periods=int(request["horizon"]), freq=request.get("freq", "D"), include_history=False
+        )
+    regressors = request.get("regressors", dict())
+    required_cols = list(model.extra_regressors.keys())
+    if model.growth == "logistic":
+        required_cols += ["cap", "floor"] if model.logistic_floor else ["cap"]
+    missing_cols = [col for col in required_cols if col not in regressors]
+    if len(missing_cols) > 0:
+        raise ValueError(f"Missing regressors values: {', '.join(missing_cols)}")
+    for col in required_cols:
+        future[col] = np.asarray(regressors[col], dtype=float)
+    return future
+
+
+def predict_batch(
+    model: "Prophet", futures: List[pd.DataFrame], log_transform: bool = False
+) -> List[pd.DataFrame]:
+    """Predicts several requests of the same model with as few predict calls as possible.
+
+    Rows requested several times are predicted once. Prophet sorts rows by date, so rows sharing
+    a date but with different regressors values are predicted in separate calls.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted model.
+    futures : List[pd.DataFrame]
+        Dataframes to predict, with the same columns.
+    log_transform : bool
+        Whether or not to apply an exp transform to the forecasts.
+
+    Returns
+    -------
+    List[pd.DataFrame]
+        Forecast of each dataframe, with columns 'ds', 'yhat', 'yhat_lower' and 'yhat_upper'.
+    """
+    input_cols = list(futures[0].columns)
+    rows = pd.concat(futures, ignore_index=True).drop_duplicates(ignore_index=True)
+    layers = rows.groupby("ds").cumcount()
+    predictions = pd.concat(
+        [
+            rows.loc[layers == layer, input_cols].merge(
+                model.predict(rows.loc[layers == layer, input_cols])[FORECAST_COLS], on="ds"
+            )
+            for layer in range(layers.max() + 1)
+        ],
+        ignore_index=True,
+    )
+    if log_transform:
+        predictions[FORECAST_COLS[1:]] = np.exp(predictions[FORECAST_COLS[1:]])
+    return [
+        future.merge(predictions, on=input_cols, how="left")[FORECAST_COLS] for future in futures
+    ]
+
+
+class BatchPredictor:
+    """Predicts forecast requests in a background thread, grouping requests received
+    within max_wait seconds into a single vectorized prediction per model.
+    """
+
+    def __init__(self, pool: ModelPool, max_batch_size: int = 64, max_wait: float = 0.01):
+        self.pool = pool
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.stats = {"requests": 0, "batches": 0}
+        self.queue: "queue.Queue[Optional[Tuple[str, pd.DataFrame, Future]]]" = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, model_id: str, future_df: pd.DataFrame) -> Future:
+        """Adds a dataframe to predict to the next batch.
+
+        Parameters
+        ----------
+        model_id : str
+            Id of the model to use.
+        future_df : pd.DataFrame
+            Dataframe to predict.
+
+        Returns
+        -------
+        Future
+            Future whose result is the forecast dataframe.
+        """
+        result: Future = Future()
+        self.queue.put((model_id, future_df, result))
+        return result
+
+    def close(self) -> None:
+        """Stops the background thread once pending requests are predicted."""
+        self.queue.put(None)
+        self.thread.join()
+
+    def _run(self) -> None:
+        """Collects requests into batches and predicts them, until the predictor is closed."""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.queue.put(None)
+                    break
+                batch.append(item)
+            self._predict(batch)
+
+    def _predict(self, batch: List[Tuple[str, pd.DataFrame, Future]]) -> None:
+        """Predicts a batch of requests with one vectorized prediction per model.
+
+        Parameters
+        ----------
+        batch : List[Tuple[str, pd.DataFrame, Future]]
+            Model id, dataframe to predict and future to set for each request.
+        """
+        model_ids = list(dict.fromkeys(model_id for model_id, _, _ in batch))
+        for model_id in model_ids:
+            requests = [(df, result) for id_, df, result in batch if id_ == model_id]
+            try:
+                served = self.pool.get(model_id)
+                forecasts = predict_batch(
+                    served["model"], [df for df, _ in requests], served["log_transform"]
+                )
+            except Exception as e:
+                for _, result in requests:
+                    result.set_exception(e)
+                continue
+            for (_, result), forecast in zip(requests, forecasts):
+                result.set_result(forecast)
+            self.stats["requests"] += len(requests)
+            self.stats["batches"] += 1
+
+
+class ForecastServer(ThreadingHTTPServer):
+    """HTTP server answering forecast requests with models of a pool, one thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        pool: ModelPool,
+        predictor: BatchPredictor,
+        request_timeout: float = 60,
+    ):
+        super().__init__(address, ForecastRequestHandler)
+        self.pool = pool
+        self.predictor = predictor
+        self.request_timeout = request_timeout
+
+    def forecast(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submits all forecast requests of a call, then waits for their forecasts.
+
+        Parameters
+        ----------
+        requests : List[Dict]
+            Forecast requests, with a 'model' id and the keys expected by make_future_df.
+
+        Returns
+        -------
+        List[Dict]
+            Forecast of each request as lists of values by column, or error message.
+        """
+        pending: List[Union[Future, Exception]] = []
+        for request in requests:
+            try:
+                model = self.pool.get(request["model"])["model"]
+                pending.append(
+                    self.predictor.submit(request["model"], make_future_df(model, request))
+                )
+            except Exception as e:
+                pending.append(e)
+        responses = []
+        for result in pending:
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                forecast = result.result(timeout=self.request_timeout)
+            except Exception as e:
+                responses.append({"error": f"{type(e).__name__}: {e}"})
+                continue
+            response = forecast.to_dict(orient="list")
+            response["ds"] = forecast["ds"].dt.strftime("%Y-%m-%d %H:%M:%S").tolist()
+            responses.append(response)
+        return responses
+
+    def server_close(self) -> None:
+        """Closes the server and stops the batch predictor."""
+        super().server_close()
+        self.predictor.close()
+
+
+class ForecastRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET /health, GET /models and POST /predict requests."""
+
+    server: ForecastServer
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/models":
+            self._send_json(
+                200,
+                {
+                    "models": self.server.pool.list_models(),
+                    "loaded": self.server.pool.loaded,
+                    "pool": self.server.pool.stats,
+                    "batches": self.server.predictor.stats,
+                },
+            )
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/predict":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            requests = body["requests"]
+            if not isinstance(requests, list):
+                raise TypeError("requests must be a list")
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": f"Invalid request body: {e}"})
+            return
+        self._send_json(200, {"forecasts": self.server.forecast(requests)})
+
+    def _send_json(self, status: int, content: Dict[str, Any]) -> None:
+        """Sends a json response.
+
+        Parameters
+        ----------
+        status : int
+            HTTP status code.
+        content : Dict
+            Response content.
+        """
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_server(
+    pool: ModelPool,
+    serving_config: Dict[str, Any],
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> ForecastServer:
+    """Creates a forecast server, not started yet.
+
+    Parameters
+    ----------
+    pool : ModelPool
+        Pool of the models to serve.
+    serving_config : Dict
+        Serving section of the lib configuration (host, port, batching and timeout settings).
+    host : str, optional
+        Host to bind, config host by default.
+    port : int, optional
+        Port to bind, config port by default. 0 binds any free port.
+
+    Returns
+    -------
+    ForecastServer
+        Forecast server, started with serve_forever.
+    """
+    predictor = BatchPredictor(
+        pool, serving_config["max_batch_size"], serving_config["max_wait_ms"] / 1000
+    )
+    return ForecastServer(
+        (
+            serving_config["host"] if host is None else host,
+            serving_config["port"] if port is None else port,
+        ),
+        pool,
+        predictor,
+        serving_config["request_timeout"],
+    )
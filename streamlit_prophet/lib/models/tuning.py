@@ -0,0 +1,293 @@
+from typing import Any, Dict, List, Tuple
+
+import copy
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from streamlit_prophet.lib.evaluation.metrics import MAE, MAPE, MSE, RMSE, SMAPE
+from streamlit_prophet.lib.models.preparation import get_prophet_cv_horizon, remove_empty_regressors
+from streamlit_prophet.lib.utils.logging import capture_fit_logs
+
+PRIOR_SCALE_PARAMS = ["changepoint_prior_scale", "seasonality_prior_scale", "holidays_prior_scale"]
+METRICS = {"MAPE": MAPE, "SMAPE": SMAPE, "MSE": MSE, "RMSE": RMSE, "MAE": MAE}
+PRUNING_TOLERANCE = 1e-8
+
+
+def get_candidates(
+    search_space: Dict[str, List[Any]], method: str, n_candidates: int, seed: int
+) -> List[Dict[str, Any]]:
+    """Generates the parameter combinations to evaluate.
+
+    Parameters
+    ----------
+    search_space : Dict
+        Values to try for each parameter.
+    method : str
+        Search method, among "Grid", "Random" and "Successive halving".
+    n_candidates : int
+        Number of combinations sampled for random search and successive halving.
+    seed : int
+        Random seed used to sample combinations.
+
+    Returns
+    -------
+    list
+        List of parameter combinations.
+    """
+    names = sorted(search_space.keys())
+    grid = [
+        dict(zip(names, values))
+        for values in itertools.product(*[search_space[name] for name in names])
+    ]
+    if method == "Grid" or len(grid) <= n_candidates:
+        return grid
+    rng = np.random.default_rng(seed)
+    return [grid[i] for i in sorted(rng.choice(len(grid), size=n_candidates, replace=False))]
+
+
+def set_candidate_params(params: Dict[Any, Any], candidate: Dict[str, Any]) -> Dict[Any, Any]:
+    """Returns a copy of model parameters updated with the values of a candidate.
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters.
+    candidate : Dict
+        Values of the tuned parameters. Fourier orders are named "<seasonality>_fourier_order".
+
+    Returns
+    -------
+    dict
+        Updated model parameters.
+    """
+    params = copy.deepcopy(params)
+    for name, value in candidate.items():
+        if name in PRIOR_SCALE_PARAMS:
+            params["prior_scale"][name] = value
+        elif name.endswith("_fourier_order"):
+            seasonality = params["seasonalities"][name[: -len("_fourier_order")]]
+            if "custom_param" in seasonality:
+                seasonality["custom_param"]["fourier_order"] = value
+            elif seasonality["prophet_param"] is not False:
+                seasonality["prophet_param"] = value
+    return params
+
+
+def set_tuned_defaults(config: Dict[Any, Any], candidate: Dict[str, Any]) -> Dict[Any, Any]:
+    """Returns a copy of the lib config whose default model parameters are the tuned values,
+    so that they are displayed in the sidebar.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary.
+    candidate : Dict
+        Values of the tuned parameters. Fourier orders are named "<seasonality>_fourier_order".
+
+    Returns
+    -------
+    dict
+        Lib configuration dictionary with updated default model parameters.
+    """
+    if not candidate:
+        return config
+    config = copy.deepcopy(config)
+    for name, value in candidate.items():
+        if name in PRIOR_SCALE_PARAMS:
+            config["model"][name] = value
+        elif name.endswith("_fourier_order"):
+            config["model"].setdefault("fourier_order", dict())[
+                name[: -len("_fourier_order")]
+            ] = value
+    return config
+
+
+def get_rungs(n_folds: int, method: str) -> List[int]:
+    """Returns the number of folds on which candidates are evaluated after each pruning round.
+
+    Parameters
+    ----------
+    n_folds : int
+        Number of cross-validation folds.
+    method : str
+        Search method, among "Grid", "Random" and "Successive halving".
+
+    Returns
+    -------
+    list
+        Increasing numbers of folds, the last one being the total number of folds.
+    """
+    if method == "Successive halving":
+        rungs = [
+            min(2**i, n_folds) for i in range(int(math.ceil(math.log2(max(n_folds, 1)))) + 1)
+        ]
+    else:
+        rungs = [1, n_folds]
+    return sorted(set(rungs))
+
+
+def evaluate_fold(
+    params: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    train: pd.DataFrame,
+    cutoff: pd.Timestamp,
+    horizon: pd.Timedelta,
+    metric: str,
+    seed: int,
+) -> float:
+    """Fits a model on data until a cutoff date and computes its error on the following horizon.
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters.
+    dates : Dict
+        Dictionary containing all relevant dates for training.
+    train : pd.DataFrame
+        Training dataframe.
+    cutoff : pd.Timestamp
+        Last date of the fold training period.
+    horizon : pd.Timedelta
+        Length of the fold validation period.
+    metric : str
+        Name of the metric to compute.
+    seed : int
+        Random seed used for model fitting.
+
+    Returns
+    -------
+    float
+        Metric value on the fold validation period.
+    """
+    from streamlit_prophet.lib.models.prophet import instantiate_prophet_model
+
+    with capture_fit_logs():
+        fold_train = train.loc[train["ds"] <= cutoff]
+        model = instantiate_prophet_model(remove_empty_regressors(params, fold_train), dates=dates)
+        model.fit(fold_train, seed=seed)
+        val = train.loc[(train["ds"] > cutoff) & (train["ds"] <= cutoff + horizon)]
+        forecast = model.predict(val.drop(columns="y"))
+    return float(METRICS[metric](val["y"].values, forecast["yhat"].values))
+
+
+def tune_params(
+    params: Dict[Any, Any],
+    tuning: Dict[Any, Any],
+    config: Dict[Any, Any],
+    dates: Dict[Any, Any],
+    resampling: Dict[Any, Any],
+    train: pd.DataFrame,
+) -> Tuple[pd.DataFrame, Dict[Any, Any]]:
+    """Searches the best parameters on cross-validation folds, pruning bad candidates on the first folds.
+
+    Folds are evaluated from the most recent one. After each round, successive halving keeps
+    the best half of the candidates, while grid and random search drop the candidates whose error
+    is more than the pruning ratio times the best error.
+
+    Parameters
+    ----------
+    params : Dict
+        Model parameters, used for all parameters that are not tuned.
+    tuning : Dict
+        Tuning specifications (search space, method, number of candidates, metric, pruning ratio).
+    config : Dict
+        Lib configuration dictionary, containing information about random seed to use for training.
+    dates : Dict
+        Dictionary containing cross-validation cutoffs and horizon.
+    resampling : Dict
+        Dataset resampling specifications.
+    train : pd.DataFrame
+        Training dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        Evaluation results of all candidates, the best one first.
+    dict
+        Best values of the tuned parameters.
+    """
+    seed = config["global"]["seed"]
+    candidates = get_candidates(
+        tuning["search_space"], tuning["method"], tuning["n_candidates"], seed
+    )
+    cutoffs = sorted(dates["cutoffs"], reverse=True)
+    horizon = pd.Timedelta(get_prophet_cv_horizon(dates, resampling))
+    scores: Dict[int, List[float]] = {i: [] for i in range(len(candidates))}
+    alive = list(range(len(candidates)))
+    with ProcessPoolExecutor(max_workers=tuning.get("n_jobs")) as executor:
+        for rung in get_rungs(len(cutoffs), tuning["method"]):
+            futures = {
+                (i, k): executor.submit(
+                    evaluate_fold,
+                    set_candidate_params(params, candidates[i]),
+                    dates,
+                    train,
+                    cutoffs[k],
+                    horizon,
+                    tuning["metric"],
+                    seed,
+                )
+                for i in alive
+                for k in range(len(scores[i]), rung)
+            }
+            for (i, k), future in sorted(futures.items()):
+                scores[i].append(future.result())
+            if rung == len(cutoffs):
+                break
+            alive = _prune_candidates(alive, scores, tuning)
+    results = pd.DataFrame(candidates)
+    results[tuning["metric"]] = [np.mean(scores[i]) for i in range(len(candidates))]
+    results["Folds evaluated"] = [len(scores[i]) for i in range(len(candidates))]
+    results = results.sort_values(
+        ["Folds evaluated", tuning["metric"]], ascending=[False, True]
+    ).reset_index(drop=True)
+    best_candidate = {name: results.loc[0, name] for name in tuning["search_space"]}
+    return results, _to_python_types(best_candidate)
+
+
+def _prune_candidates(
+    alive: List[int], scores: Dict[int, List[float]], tuning: Dict[Any, Any]
+) -> List[int]:
+    """Keeps only the most promising candidates after a round of evaluation.
+
+    Parameters
+    ----------
+    alive : List[int]
+        Indices of the candidates still evaluated.
+    scores : Dict
+        Errors of each candidate on each evaluated fold.
+    tuning : Dict
+        Tuning specifications (method, pruning ratio).
+
+    Returns
+    -------
+    list
+        Indices of the candidates to evaluate on the next folds.
+    """
+    mean_scores = {i: np.mean(scores[i]) for i in alive}
+    if tuning["method"] == "Successive halving":
+        n_kept = max(1, int(math.ceil(len(alive) / 2)))
+        return sorted(sorted(alive, key=lambda i: mean_scores[i])[:n_kept])
+    best_score = min(mean_scores.values())
+    # Additive tolerance, so that a null best error (e.g. perfect fit) doesn't prune all others
+    threshold = best_score + (tuning["pruning_ratio"] - 1) * abs(best_score) + PRUNING_TOLERANCE
+    return [i for i in alive if mean_scores[i] <= threshold]
+
+
+def _to_python_types(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts numpy values of a candidate into python values, so that they can be used in widgets.
+
+    Parameters
+    ----------
+    candidate : Dict
+        Values of the tuned parameters.
+
+    Returns
+    -------
+    dict
+        Values of the tuned parameters as python types.
+    """
+    return {k: v.item() if isinstance(v, np.generic) else v for k, v in candidate.items()}
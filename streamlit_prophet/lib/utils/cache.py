@@ -0,0 +1,249 @@
+import types
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from streamlit_prophet.lib.utils.misc import get_content_hash
+
+DEFAULT_MAX_MEMORY_MB = 1024
+
+
+class SharedCache:
+    """In-memory cache shared by all sessions of the server, with a memory budget.
+
+    Entries are identified by a namespace and a content hash of the cached function inputs.
+    Least recently used entries are evicted when the estimated size of all entries is above the budget.
+    """
+
+    def __init__(self, max_memory_mb: float = DEFAULT_MAX_MEMORY_MB):
+        self.max_memory = int(max_memory_mb * 1024**2)
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats: Dict[str, Dict[str, int]] = dict()
+        self.lock = threading.Lock()
+
+    @property
+    def memory(self) -> int:
+        """Estimated size in bytes of all cached values."""
+        return sum(entry["size"] for entry in self.entries.values())
+
+    def get_or_compute(
+        self, namespace: str, key: str, compute: Callable[[], Any], ttl: Optional[float] = None
+    ) -> Any:
+        """Returns the cached value of a key, computing and caching it if needed.
+
+        Parameters
+        ----------
+        namespace : str
+            Name of the group of entries the key belongs to, used for statistics.
+        key : str
+            Content hash of the inputs used to compute the value.
+        compute : Callable
+            Function computing the value.
+        ttl : float, optional
+            Number of seconds after which the cached value is computed again.
+
+        Returns
+        -------
+        Any
+            Cached or computed value.
+        """
+        entry_key = f"{namespace}:{key}"
+        with self.lock:
+            stats = self.stats.setdefault(namespace, {"hits": 0, "misses": 0, "evictions": 0})
+            entry = self.entries.get(entry_key)
+            if entry is not None and (ttl is None or time.time() - entry["created_at"] < ttl):
+                stats["hits"] += 1
+                self.entries.move_to_end(entry_key)
+                return entry["value"]
+            stats["misses"] += 1
+        # Value is computed outside the lock, so that other entries can be read meanwhile
+        value = compute()
+        size = get_object_size(value)
+        with self.lock:
+            if size <= self.max_memory:
+                self.entries[entry_key] = {
+                    "value": value,
+                    "size": size,
+                    "namespace": namespace,
+                    "created_at": time.time(),
+                }
+                self.entries.move_to_end(entry_key)
+                self._evict()
+        return value
+
+    def set_max_memory(self, max_memory_mb: float) -> None:
+        """Updates the memory budget, evicting entries if needed.
+
+        Parameters
+        ----------
+        max_memory_mb : float
+            Memory budget in MB.
+        """
+        with self.lock:
+            self.max_memory = int(max_memory_mb * 1024**2)
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all entries and resets statistics."""
+        with self.lock:
+            self.entries.clear()
+            self.stats.clear()
+
+    def get_stats(self) -> pd.DataFrame:
+        """Returns number of entries, memory used, hits, misses and evictions of each namespace.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per namespace.
+        """
+        with self.lock:
+            rows = []
+            for namespace, stats in sorted(self.stats.items()):
+                entries = [e for e in self.entries.values() if e["namespace"] == namespace]
+                requests = stats["hits"] + stats["misses"]
+                rows.append(
+                    {
+                        "namespace": namespace,
+                        "entries": len(entries),
+                        "memory (MB)": round(sum(e["size"] for e in entries) / 1024**2, 2),
+                        **stats,
+                        "hit ratio": round(stats["hits"] / requests, 3) if requests else 0.0,
+                    }
+                )
+        return pd.DataFrame(
+            rows,
+            columns=[
+                "namespace",
+                "entries",
+                "memory (MB)",
+                "hits",
+                "misses",
+                "evictions",
+                "hit ratio",
+            ],
+        )
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until the memory budget is respected."""
+        memory = self.memory
+        while memory > self.max_memory and self.entries:
+            _, entry = self.entries.popitem(last=False)
+            memory -= entry["size"]
+            self.stats[entry["namespace"]]["evictions"] += 1
+
+
+_shared_cache = SharedCache()
+
+
+def get_shared_cache() -> SharedCache:
+    """Returns the cache shared by all sessions of the server.
+
+    Returns
+    -------
+    SharedCache
+        Server-wide cache.
+    """
+    return _shared_cache
+
+
+def shared_cache(
+    namespace: str, ttl: Optional[float] = None, ignore: Iterable[str] = ()
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator caching the outputs of a function in the server-wide cache.
+
+    Cached dataframes and dictionaries are copied before being returned, so that a session
+    modifying its outputs does not modify the outputs of other sessions.
+
+    Parameters
+    ----------
+    namespace : str
+        Name of the group of entries, used for statistics.
+    ttl : float, optional
+        Number of seconds after which the cached value is computed again.
+    ignore : Iterable[str]
+        Names of keyword arguments that are not part of the cache key.
+
+    Returns
+    -------
+    Callable
+        Decorator.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key_kwargs = {k: v for k, v in kwargs.items() if k not in ignore}
+            key = get_content_hash(func.__module__, func.__qualname__, args, key_kwargs)
+            value = _shared_cache.get_or_compute(namespace, key, lambda: func(*args, **kwargs), ttl)
+            return _copy_value(value)
+
+        return wrapper
+
+    return decorator
+
+
+def get_object_size(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """Estimates the memory used by an object, including dataframes, arrays and object attributes.
+
+    Parameters
+    ----------
+    obj : Any
+        Object whose size is estimated.
+    seen : Set[int], optional
+        Ids of the objects already counted.
+
+    Returns
+    -------
+    int
+        Estimated size in bytes.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            get_object_size(k, seen) + get_object_size(v, seen) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(get_object_size(x, seen) for x in obj)
+    if hasattr(obj, "__dict__") and not (isinstance(obj, types.ModuleType) or callable(obj)):
+        return sys.getsizeof(obj) + get_object_size(vars(obj), seen)
+    return sys.getsizeof(obj)
+
+
+def _copy_value(value: Any) -> Any:
+    """Copies dataframes and containers of a cached value, other objects are shared.
+
+    Parameters
+    ----------
+    value : Any
+        Cached value.
+
+    Returns
+    -------
+    Any
+        Copied value.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_copy_value(x) for x in value)
+    if isinstance(value, list):
+        return [_copy_value(x) for x in value]
+    return value
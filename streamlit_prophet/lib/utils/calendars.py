@@ -0,0 +1,373 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import datetime
+import functools
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from streamlit_prophet.lib.utils.holidays import lockdown_format_func
+from streamlit_prophet.lib.utils.mapping import (
+    COVID_LOCKDOWN_DATES_MAPPING,
+    SCHOOL_HOLIDAYS_FUNC_MAPPING,
+)
+
+SCHOOL_HOLIDAYS_CALENDAR = "school_holidays"
+LOCKDOWNS_CALENDAR = "lockdown_events"
+
+
+class HolidayCalendar:
+    """Holidays calendar, precompiled into date-sorted arrays the first time it is used,
+    so that the holidays of any date range are retrieved with a slice of these arrays.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], pd.DataFrame]):
+        self.name = name
+        self.loader = loader
+        self.lock = threading.Lock()
+        self._store: Optional[Dict[str, np.ndarray]] = None
+
+    @property
+    def store(self) -> Dict[str, np.ndarray]:
+        """Date-sorted arrays of holidays dates, names codes and windows, and array of names."""
+        with self.lock:
+            if self._store is None:
+                self._store = compile_calendar(self.loader())
+        return self._store
+
+    @property
+    def holidays(self) -> List[str]:
+        """Sorted names of the holidays of the calendar."""
+        return list(self.store["names"])
+
+    def get_holidays_df(
+        self, start: Any, end: Any, holidays: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Returns the holidays of the calendar between two dates.
+
+        Parameters
+        ----------
+        start : Any
+            First date of the range, included.
+        end : Any
+            Last date of the range, excluded.
+        holidays : List[str], optional
+            Names of the holidays to keep, all holidays by default.
+
+        Returns
+        -------
+        pd.DataFrame
+            Holidays dataframe with columns 'ds', 'holiday', 'lower_window' and 'upper_window'.
+        """
+        store = self.store
+        start_idx, end_idx = np.searchsorted(
+            store["ds"], np.array([start, end], dtype="datetime64[ns]")
+        )
+        rows = slice(start_idx, end_idx)
+        if holidays is not None:
+            codes = np.flatnonzero(np.isin(store["names"], holidays))
+            rows = start_idx + np.flatnonzero(np.isin(store["codes"][rows], codes))
+        return pd.DataFrame(
+            {
+                "ds": store["ds"][rows],
+                "holiday": store["names"][store["codes"][rows]],
+                "lower_window": store["lower_window"][rows],
+                "upper_window": store["upper_window"][rows],
+            }
+        )
+
+
+class CalendarRegistry:
+    """Registry of the holidays calendars available for each country, other than public holidays."""
+
+    def __init__(self) -> None:
+        self.calendars: Dict[str, Dict[str, HolidayCalendar]] = dict()
+        self.lock = threading.Lock()
+
+    def register(
+        self, country: str, calendar_id: str, name: str, loader: Callable[[], pd.DataFrame]
+    ) -> None:
+        """Registers a calendar for a country, replacing the calendar with the same id if any.
+
+        Parameters
+        ----------
+        country : str
+            Country code.
+        calendar_id : str
+            Identifier of the calendar.
+        name : str
+            Name of the calendar, displayed in the app.
+        loader : Callable
+            Function returning the holidays dataframe of the calendar, with columns 'ds' and 'holiday'.
+        """
+        with self.lock:
+            self.calendars.setdefault(country, dict())[calendar_id] = HolidayCalendar(name, loader)
+
+    def register_file(self, country: str, calendar_id: str, name: str, path: str) -> None:
+        """Registers a calendar stored in a local csv or parquet file.
+
+        Parameters
+        ----------
+        country : str
+            Country code.
+        calendar_id : str
+            Identifier of the calendar.
+        name : str
+            Name of the calendar, displayed in the app.
+        path : str
+            Path of the calendar file, with columns 'ds' and 'holiday',
+            and optionally 'lower_window' and 'upper_window'.
+        """
+        self.register(country, calendar_id, name, functools.partial(load_calendar_file, path))
+
+    def get_calendars(self, country: str) -> Dict[str, HolidayCalendar]:
+        """Returns the calendars registered for a country.
+
+        Parameters
+        ----------
+        country : str
+            Country code.
+
+        Returns
+        -------
+        Dict[str, HolidayCalendar]
+            Calendars by identifier.
+        """
+        with self.lock:
+            return dict(self.calendars.get(country, dict()))
+
+    def get_calendar(self, country: str, calendar_id: str) -> HolidayCalendar:
+        """Returns a calendar registered for a country.
+
+        Parameters
+        ----------
+        country : str
+            Country code.
+        calendar_id : str
+            Identifier of the calendar.
+
+        Returns
+        -------
+        HolidayCalendar
+            Registered calendar.
+        """
+        calendars = self.get_calendars(country)
+        if calendar_id not in calendars:
+            raise KeyError(f"Calendar {calendar_id} is not registered for country {country}")
+        return calendars[calendar_id]
+
+
+def compile_calendar(holidays_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Compiles a holidays dataframe into date-sorted arrays, with holidays names stored as codes.
+
+    Parameters
+    ----------
+    holidays_df : pd.DataFrame
+        Holidays dataframe with columns 'ds' and 'holiday', and optionally 'lower_window' and 'upper_window'.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Arrays 'ds', 'codes', 'lower_window' and 'upper_window' sorted by date,
+        and array 'names' of the holidays names indexed by codes.
+    """
+    missing_cols = {"ds", "holiday"} - set(holidays_df.columns)
+    if len(missing_cols) > 0:
+        raise ValueError(f"Holidays calendar is missing columns {sorted(missing_cols)}")
+    ds = pd.to_datetime(holidays_df["ds"]).values.astype("datetime64[ns]")
+    order = np.argsort(ds, kind="stable")
+    codes, names = pd.factorize(holidays_df["holiday"].astype(str), sort=True)
+    store = {
+        "ds": ds[order],
+        "codes": codes[order].astype(np.int32),
+        "names": np.asarray(names, dtype=object),
+    }
+    for window in ["lower_window", "upper_window"]:
+        values = holidays_df[window] if window in holidays_df.columns else 0
+        store[window] = np.broadcast_to(np.asarray(values, dtype=np.int64), ds.shape)[order]
+    return store
+
+
+def load_calendar_file(path: str) -> pd.DataFrame:
+    """Loads a holidays calendar from a csv or parquet file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the calendar file.
+
+    Returns
+    -------
+    pd.DataFrame
+        Holidays dataframe.
+    """
+    file_path = Path(path).expanduser()
+    if file_path.suffix == ".parquet":
+        return pd.read_parquet(file_path)
+    return pd.read_csv(file_path)
+
+
+def get_lockdowns_df(country: str) -> pd.DataFrame:
+    """Returns the days of the covid lockdown events of a country.
+
+    Parameters
+    ----------
+    country : str
+        Country code.
+
+    Returns
+    -------
+    pd.DataFrame
+        Holidays dataframe with one row per lockdown day, with columns 'ds' and 'holiday'.
+    """
+    return pd.concat(
+        [
+            pd.DataFrame(
+                {"holiday": lockdown_format_func(i), "ds": pd.date_range(start=start, end=end)}
+            )
+            for i, (start, end) in enumerate(COVID_LOCKDOWN_DATES_MAPPING[country])
+        ],
+        ignore_index=True,
+    )
+
+
+def _make_default_registry() -> CalendarRegistry:
+    """Creates a registry containing the built-in school holidays and lockdown events calendars."""
+    registry = CalendarRegistry()
+    for country, func in SCHOOL_HOLIDAYS_FUNC_MAPPING.items():
+        registry.register(country, SCHOOL_HOLIDAYS_CALENDAR, "School holidays", func)
+    for country in COVID_LOCKDOWN_DATES_MAPPING.keys():
+        registry.register(
+            country,
+            LOCKDOWNS_CALENDAR,
+            "Lockdown events",
+            functools.partial(get_lockdowns_df, country),
+        )
+    return registry
+
+
+_calendar_registry = _make_default_registry()
+_config_calendars: Dict[str, Dict[str, Any]] = dict()
+
+
+def get_calendar_registry(config: Dict[Any, Any]) -> CalendarRegistry:
+    """Returns the calendar registry shared by all sessions of the server,
+    after registering the custom calendars of the config.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary, containing custom calendars country, name and file path.
+
+    Returns
+    -------
+    CalendarRegistry
+        Server-wide calendar registry.
+    """
+    for calendar_id, calendar in config.get("calendars", dict()).items():
+        if _config_calendars.get(calendar_id) != calendar:
+            _calendar_registry.register_file(
+                calendar["country"], calendar_id, calendar["name"], calendar["path"]
+            )
+            _config_calendars[calendar_id] = dict(calendar)
+            build_holidays_df.cache_clear()
+    return _calendar_registry
+
+
+def get_holidays_years(dates: Dict[Any, Any]) -> Tuple[int, int]:
+    """Returns the first and last years covered by training, validation and forecast dates.
+
+    Parameters
+    ----------
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+
+    Returns
+    -------
+    int
+        First year.
+    int
+        Last year.
+    """
+    all_dates = [v for v in dates.values() if isinstance(v, (datetime.date, pd.Timestamp))]
+    return min(all_dates).year, max(all_dates).year
+
+
+def get_holidays_df(
+    holidays_params: Dict[Any, Any], dates: Dict[Any, Any]
+) -> Optional[pd.DataFrame]:
+    """Returns the holidays dataframe to give to Prophet models, shared by all models with the same
+    holidays parameters and years. Public holidays are not included, they are added to each model
+    with add_country_holidays so that they cover any predicted date.
+
+    Parameters
+    ----------
+    holidays_params : Dict
+        Holidays parameters (country, public_holidays, school_holidays, lockdown_events, calendars).
+    dates : Dict
+        Dictionary containing all relevant dates for training and forecasting.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Holidays dataframe with columns 'ds', 'holiday', 'lower_window' and 'upper_window',
+        None if no holiday is selected. It must not be modified, as it is shared by all models.
+    """
+    start_year, end_year = get_holidays_years(dates)
+    return build_holidays_df(
+        holidays_params["country"],
+        start_year,
+        end_year,
+        bool(holidays_params["school_holidays"]),
+        tuple(holidays_params["lockdown_events"]),
+        tuple(holidays_params.get("calendars", [])),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def build_holidays_df(
+    country: str,
+    start_year: int,
+    end_year: int,
+    school_holidays: bool,
+    lockdown_events: Tuple[int, ...],
+    calendars: Tuple[str, ...] = (),
+) -> Optional[pd.DataFrame]:
+    """Builds the holidays dataframe of a country, once per country, years and holidays selection.
+
+    Parameters
+    ----------
+    country : str
+        Country code.
+    start_year : int
+        First year of holidays.
+    end_year : int
+        Last year of holidays.
+    school_holidays : bool
+        Whether or not to include school holidays.
+    lockdown_events : Tuple[int]
+        Indices of the lockdown events to include.
+    calendars : Tuple[str]
+        Identifiers of the custom calendars to include.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Holidays dataframe, None if no holiday is selected.
+    """
+    start, end = f"{start_year}-01-01", f"{end_year + 1}-01-01"
+    holidays_df_list = []
+    if school_holidays:
+        calendar = _calendar_registry.get_calendar(country, SCHOOL_HOLIDAYS_CALENDAR)
+        holidays_df_list.append(calendar.get_holidays_df(start, end))
+    if len(lockdown_events) > 0:
+        calendar = _calendar_registry.get_calendar(country, LOCKDOWNS_CALENDAR)
+        lockdowns = [lockdown_format_func(lockdown_idx) for lockdown_idx in lockdown_events]
+        holidays_df_list.append(calendar.get_holidays_df(start, end, lockdowns))
+    for calendar_id in calendars:
+        calendar = _calendar_registry.get_calendar(country, calendar_id)
+        holidays_df_list.append(calendar.get_holidays_df(start, end))
+    if len(holidays_df_list) == 0:
+        return None
+    return pd.concat(holidays_df_list, ignore_index=True)
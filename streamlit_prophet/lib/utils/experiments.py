@@ -0,0 +1,423 @@
+from typing import IO, TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+import io
+import json
+import shutil
+import sqlite3
+import uuid
+from datetime import datetime
+from pathlib import Path
+from zipfile import ZIP_STORED, ZipFile
+
+import pandas as pd
+import toml
+from streamlit_prophet.lib.utils.misc import get_content_hash
+
+if TYPE_CHECKING:
+    from prophet import Prophet
+
+INDEX_FILE_NAME = "experiments.db"
+ARTIFACTS_DIR_NAME = "artifacts"
+ZIP_EXPERIMENT_DIR_NAME = "experiment"
+CREATE_INDEX_QUERY = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    dataset TEXT,
+    target TEXT,
+    specs TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    timings TEXT NOT NULL,
+    artifacts_path TEXT NOT NULL
+)
+"""
+
+
+def get_store_path(config: Dict[Any, Any]) -> Path:
+    """Returns the directory of the experiment store.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary.
+
+    Returns
+    -------
+    Path
+        Directory containing the experiments index and artifacts.
+    """
+    return Path(config["experiments"]["store_path"]).expanduser()
+
+
+def _connect(store_path: Path) -> sqlite3.Connection:
+    """Opens a connection to the experiments index, creating it if needed.
+
+    Parameters
+    ----------
+    store_path : Path
+        Directory of the experiment store.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Connection to the experiments index.
+    """
+    store_path.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(store_path / INDEX_FILE_NAME, timeout=30)
+    connection.execute(CREATE_INDEX_QUERY)
+    return connection
+
+
+def save_experiment(
+    store_path: Path,
+    specs: Dict[Any, Any],
+    metrics: Dict[str, float],
+    timings: Dict[str, float],
+    datasets: Dict[Any, Any],
+    models: Dict[Any, Any],
+    forecasts: Dict[Any, Any],
+    df: pd.DataFrame,
+    dataset_name: Optional[str] = None,
+) -> str:
+    """Saves an experiment artifacts on disk and records it in the experiments index.
+
+    Parameters
+    ----------
+    store_path : Path
+        Directory of the experiment store.
+    specs : Dict
+        User specifications (model parameters, dates, columns, cleaning, resampling, actions).
+    metrics : Dict
+        Global performance metrics of the experiment.
+    timings : Dict
+        Durations of the experiment steps, in seconds.
+    datasets : Dict
+        Dictionary containing all datasets used for training and evaluation.
+    models : Dict
+        Dictionary containing fitted models.
+    forecasts : Dict
+        Dictionary containing all forecasts.
+    df : pd.DataFrame
+        Model input data.
+    dataset_name : str, optional
+        Name of the dataset, displayed in the leaderboard.
+
+    Returns
+    -------
+    str
+        Experiment id.
+    """
+    from prophet.serialize import model_to_json
+
+    experiment_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    artifacts_path = store_path / ARTIFACTS_DIR_NAME / experiment_id
+    for sub_dir in ["models", "datasets", "forecasts"]:
+        (artifacts_path / sub_dir).mkdir(parents=True, exist_ok=True)
+    for name, model in models.items():
+        (artifacts_path / "models" / f"{name}.json").write_text(model_to_json(model))
+    for name, dataset in datasets.items():
+        if name != "uploaded":
+            dataset.to_parquet(artifacts_path / "datasets" / f"{name}.parquet")
+    for name, forecast in forecasts.items():
+        forecast.to_parquet(artifacts_path / "forecasts" / f"{name}.parquet")
+    df.to_parquet(artifacts_path / "model_input_data.parquet")
+    specs_toml = toml.dumps(specs)
+    (artifacts_path / "specs.toml").write_text(specs_toml)
+    # The experiment is indexed only once all its artifacts are written
+    with _connect(store_path) as connection:
+        connection.execute(
+            "INSERT INTO experiments VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                experiment_id,
+                datetime.now().isoformat(timespec="seconds"),
+                dataset_name,
+                specs.get("columns", {}).get("target"),
+                specs_toml,
+                json.dumps(metrics),
+                json.dumps(timings),
+                str(artifacts_path),
+            ),
+        )
+    connection.close()
+    return experiment_id
+
+
+def load_experiments_index(store_path: Path) -> pd.DataFrame:
+    """Loads the list of stored experiments, with their metrics and timings as columns.
+
+    Parameters
+    ----------
+    store_path : Path
+        Directory of the experiment store.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per experiment, most recent first.
+    """
+    if not (store_path / INDEX_FILE_NAME).exists():
+        return pd.DataFrame(columns=["id", "created_at", "dataset", "target"])
+    with _connect(store_path) as connection:
+        index = pd.read_sql_query(
+            "SELECT id, created_at, dataset, target, metrics, timings FROM experiments "
+            "ORDER BY created_at DESC",
+            connection,
+        )
+    connection.close()
+    metrics = pd.DataFrame([json.loads(x) for x in index["metrics"]], index=index.index)
+    timings = pd.DataFrame([json.loads(x) for x in index["timings"]], index=index.index)
+    timings.columns = [f"{col} (s)" for col in timings.columns]
+    return pd.concat([index.drop(columns=["metrics", "timings"]), metrics, timings], axis=1)
+
+
+def load_experiment(store_path: Path, experiment_id: str) -> Dict[str, Any]:
+    """Loads the specifications and artifacts of a stored experiment, without refitting anything.
+
+    Parameters
+    ----------
+    store_path : Path
+        Directory of the experiment store.
+    experiment_id : str
+        Experiment id.
+
+    Returns
+    -------
+    dict
+        Specs, metrics, timings, models, datasets, forecasts and model input data of the experiment.
+    """
+    with _connect(store_path) as connection:
+        row = connection.execute(
+            "SELECT specs, metrics, timings, artifacts_path FROM experiments WHERE id = ?",
+            (experiment_id,),
+        ).fetchone()
+    connection.close()
+    if row is None:
+        raise KeyError(f"Experiment {experiment_id} not found in {store_path}")
+    from prophet.serialize import model_from_json
+
+    specs, metrics, timings, artifacts_path = row
+    artifacts_path = Path(artifacts_path)
+    models: Dict[str, "Prophet"] = {
+        path.stem: model_from_json(path.read_text())
+        for path in sorted((artifacts_path / "models").glob("*.json"))
+    }
+    return {
+        "id": experiment_id,
+        "specs": toml.loads(specs),
+        "metrics": json.loads(metrics),
+        "timings": json.loads(timings),
+        "models": models,
+        "datasets": {
+            path.stem: pd.read_parquet(path)
+            for path in sorted((artifacts_path / "datasets").glob("*.parquet"))
+        },
+        "forecasts": {
+            path.stem: pd.read_parquet(path)
+            for path in sorted((artifacts_path / "forecasts").glob("*.parquet"))
+        },
+        "df": pd.read_parquet(artifacts_path / "model_input_data.parquet"),
+    }
+
+
+def get_experiment_artifacts_path(store_path: Path, experiment_id: str) -> Path:
+    """Returns the directory where the artifacts of a stored experiment are saved.
+
+    Parameters
+    ----------
+    store_path : Path
+        Directory of the experiment store.
+    experiment_id : str
+        Experiment id.
+
+    Returns
+    -------
+    Path
+        Directory of the experiment artifacts.
+    """
+    with _connect(store_path) as connection:
+        row = connection.execute(
+            "SELECT artifacts_path FROM experiments WHERE id = ?", (experiment_id,)
+        ).fetchone()
+    connection.close()
+    if row is None:
+        raise KeyError(f"Experiment {experiment_id} not found in {store_path}")
+    return Path(row[0])
+
+
+def load_experiment_model(
+    store_path: Path, experiment_id: str, model_name: str
+) -> Tuple["Prophet", Dict[Any, Any]]:
+    """Loads a single fitted model of a stored experiment and the experiment specifications,
+    without loading its datasets and forecasts.
+
+    Parameters
+    ----------
+    store_path : Path
+        Directory of the experiment store.
+    experiment_id : str
+        Experiment id.
+    model_name : str
+        Name of the model, among "eval" and "future".
+
+    Returns
+    -------
+    Prophet
+        Fitted model.
+    dict
+        Experiment specifications.
+    """
+    from prophet.serialize import model_from_json
+
+    artifacts_path = get_experiment_artifacts_path(store_path, experiment_id)
+    model_path = artifacts_path / "models" / f"{model_name}.json"
+    if not model_path.exists():
+        raise KeyError(f"Model {model_name} not found in experiment {experiment_id}")
+    specs = toml.loads((artifacts_path / "specs.toml").read_text())
+    return model_from_json(model_path.read_text()), specs
+
+
+def delete_experiment(store_path: Path, experiment_id: str) -> None:
+    """Removes an experiment from the index and deletes its artifacts.
+
+    Parameters
+    ----------
+    store_path : Path
+        Directory of the experiment store.
+    experiment_id : str
+        Experiment id.
+    """
+    with _connect(store_path) as connection:
+        connection.execute("DELETE FROM experiments WHERE id = ?", (experiment_id,))
+    connection.close()
+    shutil.rmtree(store_path / ARTIFACTS_DIR_NAME / experiment_id, ignore_errors=True)
+
+
+def get_experiment_fingerprint(models_json: Dict[str, str], df: pd.DataFrame) -> Dict[str, Any]:
+    """Returns hashes of the model input data and of the serialized models of an experiment.
+
+    Parameters
+    ----------
+    models_json : Dict
+        Dictionary containing fitted models serialized in json.
+    df : pd.DataFrame
+        Model input data.
+
+    Returns
+    -------
+    dict
+        Hash of the input data ('data') and hash of each model ('models').
+    """
+    return {
+        "data": get_content_hash(df),
+        "models": {name: get_content_hash(model) for name, model in models_json.items()},
+    }
+
+
+def write_experiment_to_zip(zip_file: ZipFile, path: str, experiment: Dict[str, Any]) -> None:
+    """Writes specifications, fitted models, datasets, forecasts and input data of an experiment
+    in a zip file, along with their fingerprint, so that it can be restored without refitting.
+
+    Parameters
+    ----------
+    zip_file : ZipFile
+        Zip file opened in write mode.
+    path : str
+        Folder of the zip file where the experiment is written.
+    experiment : Dict
+        Experiment specs, models, datasets, forecasts and model input data ('df').
+    """
+    from prophet.serialize import model_to_json
+
+    path = f"{path}/{ZIP_EXPERIMENT_DIR_NAME}"
+    zip_file.writestr(f"{path}/specs.toml", toml.dumps(experiment["specs"]))
+    models_json = {name: model_to_json(model) for name, model in experiment["models"].items()}
+    for name, model_json in models_json.items():
+        zip_file.writestr(f"{path}/models/{name}.json", model_json)
+    # Parquet files are already compressed, deflating them again would be useless
+    for artifact in ["datasets", "forecasts"]:
+        for name, df in experiment[artifact].items():
+            if name != "uploaded":
+                zip_file.writestr(
+                    f"{path}/{artifact}/{name}.parquet", _to_parquet(df), compress_type=ZIP_STORED
+                )
+    zip_file.writestr(
+        f"{path}/model_input_data.parquet", _to_parquet(experiment["df"]), compress_type=ZIP_STORED
+    )
+    zip_file.writestr(
+        f"{path}/fingerprint.json",
+        json.dumps(get_experiment_fingerprint(models_json, experiment["df"])),
+    )
+
+
+def load_experiment_zip(file: Union[str, Path, IO[bytes]]) -> Dict[str, Any]:
+    """Restores an experiment written in a zip file, checking its models and data fingerprint.
+
+    Parameters
+    ----------
+    file : str, Path or file-like object
+        Zip file.
+
+    Returns
+    -------
+    dict
+        Specs, metrics, timings, models, datasets, forecasts and model input data of the experiment.
+    """
+    from prophet.serialize import model_from_json
+
+    with ZipFile(file) as zip_file:
+        names = zip_file.namelist()
+        specs_files = [n for n in names if n.endswith(f"{ZIP_EXPERIMENT_DIR_NAME}/specs.toml")]
+        if len(specs_files) == 0:
+            raise ValueError("This zip file doesn't contain any saved experiment.")
+        path = specs_files[0][: -len("specs.toml")]
+
+        def read_artifacts(artifact: str) -> Dict[str, Any]:
+            return {
+                Path(name).stem: zip_file.read(name)
+                for name in sorted(names)
+                if name.startswith(f"{path}{artifact}/")
+            }
+
+        models_json = {name: content.decode() for name, content in read_artifacts("models").items()}
+        experiment = {
+            "id": Path(path).parent.name,
+            "specs": toml.loads(zip_file.read(specs_files[0]).decode()),
+            "metrics": dict(),
+            "timings": dict(),
+            "models": models_json,
+            "datasets": {
+                name: pd.read_parquet(io.BytesIO(content))
+                for name, content in read_artifacts("datasets").items()
+            },
+            "forecasts": {
+                name: pd.read_parquet(io.BytesIO(content))
+                for name, content in read_artifacts("forecasts").items()
+            },
+            "df": pd.read_parquet(io.BytesIO(zip_file.read(f"{path}model_input_data.parquet"))),
+        }
+        fingerprint = json.loads(zip_file.read(f"{path}fingerprint.json"))
+    if get_experiment_fingerprint(models_json, experiment["df"]) != fingerprint:
+        raise ValueError("Restored models or data don't match the fingerprint of the experiment.")
+    # Models are deserialized once their content is checked
+    experiment["models"] = {
+        name: model_from_json(model_json) for name, model_json in models_json.items()
+    }
+    return experiment
+
+
+def _to_parquet(df: pd.DataFrame) -> bytes:
+    """Serializes a dataframe in parquet format.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe to serialize.
+
+    Returns
+    -------
+    bytes
+        Parquet file content.
+    """
+    buffer = io.BytesIO()
+    df.to_parquet(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,192 @@
+from typing import Any, Callable, Dict, List, Optional
+
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+
+class Job:
+    """A function call run in the background, with its status, progress and result."""
+
+    def __init__(self, key: str, name: str):
+        self.key = key
+        self.name = name
+        self.status = PENDING
+        self.progress = 0.0
+        self.message = "Waiting for a worker..."
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future: Optional[Future] = None
+
+    def set_progress(self, progress: float, message: str) -> None:
+        """Updates the job progress, called by the running function.
+
+        Parameters
+        ----------
+        progress : float
+            Share of the work done, between 0 and 1.
+        message : str
+            Description of the current step.
+        """
+        self.progress = min(max(float(progress), 0.0), 1.0)
+        self.message = message
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job is done or failed."""
+        return self.status in [DONE, FAILED]
+
+    @property
+    def duration(self) -> float:
+        """Running time of the job in seconds, up to now if it is still running."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+
+class JobRunner:
+    """Runs jobs on a thread pool shared by all sessions, and keeps them in a registry.
+
+    Jobs are identified by a key, so that a job submitted again while it is pending, running or done
+    (e.g. by another session with the same inputs) is not run twice.
+    """
+
+    def __init__(self, max_workers: int = 2, max_finished_jobs: int = 20):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs: Dict[str, Job] = dict()
+        self.lock = threading.Lock()
+
+    def submit(
+        self,
+        key: str,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        report_progress: bool = False,
+        **kwargs: Any,
+    ) -> Job:
+        """Submits a function call as a job, unless a job with the same key already exists.
+
+        Parameters
+        ----------
+        key : str
+            Job key, identical for identical function calls.
+        name : str
+            Job name displayed in the app.
+        func : Callable
+            Function to run.
+        *args : Any
+            Positional arguments of the function.
+        report_progress : bool
+            Whether to pass the job set_progress method to the function as a progress argument.
+        **kwargs : Any
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        Job
+            Submitted job, or the existing job with the same key, even if it failed.
+        """
+        with self.lock:
+            job = self.jobs.get(key)
+            if job is not None:
+                return job
+            job = Job(key, name)
+            if report_progress:
+                kwargs["progress"] = job.set_progress
+            self.jobs[key] = job
+            job.future = self.executor.submit(self._run, job, func, *args, **kwargs)
+            self._evict_finished_jobs()
+        return job
+
+    def get(self, key: str) -> Optional[Job]:
+        """Returns the job with a given key, if it is in the registry.
+
+        Parameters
+        ----------
+        key : str
+            Job key.
+
+        Returns
+        -------
+        Job or None
+            Job with this key, None if there is no such job.
+        """
+        return self.jobs.get(key)
+
+    def discard(self, key: str) -> None:
+        """Removes a finished job from the registry, so that it is run again when submitted again.
+
+        Parameters
+        ----------
+        key : str
+            Job key.
+        """
+        with self.lock:
+            job = self.jobs.get(key)
+            if job is not None and job.is_finished:
+                del self.jobs[key]
+
+    def list_jobs(self) -> List[Job]:
+        """Returns all jobs of the registry, most recent first.
+
+        Returns
+        -------
+        list
+            Jobs of the registry.
+        """
+        with self.lock:
+            return sorted(self.jobs.values(), key=lambda job: job.submitted_at, reverse=True)
+
+    def _run(self, job: Job, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Runs a job function and stores its result or error in the job."""
+        job.status, job.started_at, job.message = RUNNING, time.time(), "Running..."
+        try:
+            job.result = func(*args, **kwargs)
+            job.status, job.progress, job.message = DONE, 1.0, "Done"
+        except BaseException as e:  # Including st.stop, which raises a BaseException
+            job.error = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
+            job.status, job.message = FAILED, "Failed"
+        finally:
+            job.finished_at = time.time()
+
+    def _evict_finished_jobs(self) -> None:
+        """Removes the oldest finished jobs when more than max_finished_jobs are kept."""
+        finished = sorted(
+            [job for job in self.jobs.values() if job.is_finished], key=lambda job: job.finished_at
+        )
+        for job in finished[: max(len(finished) - self.max_finished_jobs, 0)]:
+            del self.jobs[job.key]
+
+
+_job_runner: Optional[JobRunner] = None
+_job_runner_lock = threading.Lock()
+
+
+def get_job_runner(config: Dict[Any, Any]) -> JobRunner:
+    """Returns the job runner shared by all sessions of the server, creating it if needed.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary, containing number of workers and finished jobs to keep.
+
+    Returns
+    -------
+    JobRunner
+        Server-wide job runner.
+    """
+    global _job_runner
+    with _job_runner_lock:
+        if _job_runner is None:
+            _job_runner = JobRunner(
+                config["jobs"]["max_workers"], config["jobs"]["max_finished_jobs"]
+            )
+    return _job_runner
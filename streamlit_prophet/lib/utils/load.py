@@ -1,13 +1,23 @@
 from typing import Any, Dict, Tuple
 
+import hashlib
 import io
+import json
+import os
+import time
 from pathlib import Path
+from urllib.parse import urlparse
+from zipfile import BadZipFile
 
 import pandas as pd
 import requests
 import streamlit as st
 import toml
 from PIL import Image
+from streamlit_prophet.lib.utils.cache import shared_cache
+from streamlit_prophet.lib.utils.experiments import load_experiment_zip
+
+DATASETS_CACHE_DIR = "~/.streamlit_prophet/datasets"
 
 
 def get_project_root() -> str:
@@ -76,25 +86,160 @@ def load_config(
     return dict(config_streamlit), dict(config_instructions), dict(config_readme)
 
 
-@st.cache(ttl=300)
-def download_toy_dataset(url: str) -> pd.DataFrame:
+@shared_cache("toy_datasets", ttl=300)
+def download_toy_dataset(
+    url: str,
+    cache_dir: str = DATASETS_CACHE_DIR,
+    timeout: float = 10,
+    max_age: float = 86400,
+) -> pd.DataFrame:
     """Downloads a toy dataset from an external source and converts it into a pandas dataframe.
 
+    Downloaded datasets are stored on disk as parquet files. A stored dataset is used without network
+    access during max_age seconds, then revalidated with its ETag and Last-Modified headers.
+    If the server can't be reached, the stored dataset is used, or the small sample of the
+    dataset bundled with the app if it was never downloaded.
+
     Parameters
     ----------
     url : str
         Link to the toy dataset.
+    cache_dir : str
+        Directory where downloaded datasets are stored.
+    timeout : float
+        Number of seconds to wait for the server.
+    max_age : float
+        Number of seconds during which a stored dataset is used without revalidation.
 
     Returns
     -------
     pd.DataFrame
         Loaded dataset.
     """
-    download = requests.get(url).content
-    df = pd.read_csv(io.StringIO(download.decode("utf-8")))
+    dataset_path = get_dataset_cache_path(url, cache_dir)
+    metadata_path = dataset_path.with_suffix(".json")
+    metadata = json.loads(metadata_path.read_text()) if metadata_path.exists() else dict()
+    is_stored = dataset_path.exists() and bool(metadata)
+    if is_stored and time.time() - metadata["fetched_at"] < max_age:
+        return pd.read_parquet(dataset_path)
+    headers = dict()
+    if is_stored and metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if is_stored and metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException:
+        if is_stored:
+            return pd.read_parquet(dataset_path)
+        bundled_path = get_bundled_dataset_path(url)
+        if bundled_path.exists():
+            return pd.read_csv(bundled_path)
+        raise
+    if response.status_code == 304 and is_stored:
+        df = pd.read_parquet(dataset_path)
+    else:
+        df = pd.read_csv(io.BytesIO(response.content))
+        dataset_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written in a temporary file first, so that concurrent sessions never read a partial file
+        tmp_path = dataset_path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, dataset_path)
+    metadata = {
+        "url": url,
+        "etag": response.headers.get("ETag", metadata.get("etag")),
+        "last_modified": response.headers.get("Last-Modified", metadata.get("last_modified")),
+        "fetched_at": time.time(),
+    }
+    metadata_path.write_text(json.dumps(metadata))
     return df
 
 
+def get_dataset_cache_path(url: str, cache_dir: str) -> Path:
+    """Returns the path of the parquet file where a downloaded dataset is stored.
+
+    Parameters
+    ----------
+    url : str
+        Link to the dataset.
+    cache_dir : str
+        Directory where downloaded datasets are stored.
+
+    Returns
+    -------
+    Path
+        Path of the stored dataset.
+    """
+    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+    return Path(cache_dir).expanduser() / f"{Path(urlparse(url).path).stem}_{url_hash}.parquet"
+
+
+def get_bundled_dataset_path(url: str) -> Path:
+    """Returns the path of the small sample of a toy dataset bundled with the app,
+    used when the dataset can't be downloaded.
+
+    Parameters
+    ----------
+    url : str
+        Link to the toy dataset.
+
+    Returns
+    -------
+    Path
+        Path of the bundled dataset, a gzip compressed csv file.
+    """
+    return (
+        Path(get_project_root())
+        / "references"
+        / "datasets"
+        / f"{Path(urlparse(url).path).stem}.csv.gz"
+    )
+
+
+@shared_cache("local_datasets", ttl=300)
+def load_local_dataset(path: str) -> pd.DataFrame:
+    """Loads a dataset registered by path in the config, from a csv, parquet or feather file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the dataset file.
+
+    Returns
+    -------
+    pd.DataFrame
+        Loaded dataset.
+    """
+    file_path = Path(path).expanduser()
+    if file_path.suffix == ".parquet":
+        return pd.read_parquet(file_path)
+    if file_path.suffix == ".feather":
+        return pd.read_feather(file_path)
+    return pd.read_csv(file_path)
+
+
+@st.cache(allow_output_mutation=True, suppress_st_warning=True, ttl=300)
+def load_experiment_file(file: io.BytesIO) -> Dict[str, Any]:
+    """Loads an experiment saved as a zip file from user's file system, without refitting its models.
+
+    Parameters
+    ----------
+    file : io.BytesIO
+        Uploaded zip file.
+
+    Returns
+    -------
+    dict
+        Specs, models, datasets, forecasts and model input data of the experiment.
+    """
+    try:
+        return load_experiment_zip(file)
+    except (ValueError, KeyError, BadZipFile) as e:
+        st.error(f"This experiment can't be loaded: {e}")
+        st.stop()
+
+
 @st.cache(ttl=300)
 def load_custom_config(config_file: io.BytesIO) -> Dict[Any, Any]:
     """Loads config toml file from user's file system as a dictionary.
@@ -1,31 +1,193 @@
-import os
+from typing import Any, Dict, List, Optional
 
+import logging
+import re
+import threading
+import time
+from collections import deque
 
-class suppress_stdout_stderr:
+FIT_LOGGERS = ["cmdstanpy", "prophet", "prophet.models"]
+
+
+class _ThreadCaptureFilter(logging.Filter):
+    """Logging filter that diverts the records emitted by the threads capturing fit logs,
+    so that they are stored by their capture instead of being printed by the logger handlers.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.captures: Dict[int, List[List[logging.LogRecord]]] = dict()
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        with self.lock:
+            captures = self.captures.get(record.thread or 0)
+            if not captures:
+                return True
+            captures[-1].append(record)
+        return False
+
+    def start(self, thread_id: int, records: List[logging.LogRecord]) -> None:
+        with self.lock:
+            self.captures.setdefault(thread_id, []).append(records)
+
+    def stop(self, thread_id: int) -> None:
+        with self.lock:
+            self.captures[thread_id].pop()
+            if len(self.captures[thread_id]) == 0:
+                del self.captures[thread_id]
+
+
+_capture_filter = _ThreadCaptureFilter()
+for _logger_name in FIT_LOGGERS:
+    logging.getLogger(_logger_name).addFilter(_capture_filter)
+
+
+class capture_fit_logs:
     """
-    A context manager for doing a "deep suppression" of stdout and stderr in
-    Python, i.e. will suppress all print, even if the print originates in a
-    compiled C/Fortran sub-function.
-       This will not suppress raised exceptions, since exceptions are printed
-    to stderr just before a script exits, and after the context manager has
-    exited (at least, I think that is why it lets exceptions through).
+    A context manager capturing the logs of Prophet and cmdstanpy emitted by the current thread,
+    instead of printing them. Unlike a redirection of stdout and stderr file descriptors, it only
+    affects the thread that uses it, so that several sessions of the server can fit models at the
+    same time while the logs of other threads are still printed.
+    Stan itself runs in a subprocess whose output is written to a file by cmdstanpy,
+    it can be read afterwards with get_stan_output.
     """
 
-    def __init__(self):
-        # Open a pair of null files
-        self.null_fds = [os.open(os.devnull, os.O_RDWR) for x in range(2)]
-        # Save the actual stdout (1) and stderr (2) file descriptors.
-        self.save_fds = [os.dup(1), os.dup(2)]
-
-    def __enter__(self):
-        # Assign the null pointers to stdout and stderr.
-        os.dup2(self.null_fds[0], 1)
-        os.dup2(self.null_fds[1], 2)
-
-    def __exit__(self, *_):
-        # Re-assign the real stdout/stderr back to (1) and (2)
-        os.dup2(self.save_fds[0], 1)
-        os.dup2(self.save_fds[1], 2)
-        # Close the null files
-        for fd in self.null_fds + self.save_fds:
-            os.close(fd)
+    def __init__(self) -> None:
+        self.records: List[logging.LogRecord] = []
+        self.thread_id = threading.get_ident()
+
+    def __enter__(self) -> "capture_fit_logs":
+        _capture_filter.start(self.thread_id, self.records)
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        _capture_filter.stop(self.thread_id)
+
+    @property
+    def messages(self) -> List[str]:
+        """Captured log messages, prefixed with their logger name and level."""
+        return [f"{r.name} - {r.levelname} - {r.getMessage()}" for r in self.records]
+
+
+def get_stan_output(model: Any) -> str:
+    """Returns the console output of the Stan optimization of a fitted Prophet model.
+
+    Parameters
+    ----------
+    model : Prophet
+        Fitted Prophet model.
+
+    Returns
+    -------
+    str
+        Stan console output, empty if it is not available (e.g. if Stan was not run).
+    """
+    try:
+        with open(model.stan_fit.runset.stdout_files[0]) as file:
+            return file.read()
+    except (AttributeError, IndexError, OSError):
+        return ""
+
+
+def get_stan_iterations(stan_output: str) -> Optional[int]:
+    """Returns the number of iterations of a Stan optimization, read from its console output.
+
+    Parameters
+    ----------
+    stan_output : str
+        Stan console output.
+
+    Returns
+    -------
+    int or None
+        Number of iterations, None if the output has no iteration line.
+    """
+    iterations = re.findall(r"^\s*(?:Iteration\s+)?(\d+)[\s.]", stan_output, flags=re.MULTILINE)
+    return max(int(i) for i in iterations) if iterations else None
+
+
+def make_fit_report(
+    name: str, model: Any, logs: capture_fit_logs, duration: float
+) -> Dict[str, Any]:
+    """Summarizes a model fit, with its captured logs and Stan output.
+
+    Parameters
+    ----------
+    name : str
+        Name of the fitted model.
+    model : Prophet
+        Fitted Prophet model.
+    logs : capture_fit_logs
+        Logs captured during the fit.
+    duration : float
+        Fit duration, in seconds.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Fit report, with model name, thread, end time, duration, number of iterations and output.
+    """
+    stan_output = get_stan_output(model)
+    return {
+        "model": name,
+        "thread": threading.current_thread().name,
+        "time": time.strftime("%H:%M:%S"),
+        "duration (s)": round(duration, 2),
+        "iterations": get_stan_iterations(stan_output),
+        "output": "\n".join(logs.messages + [stan_output]).strip(),
+    }
+
+
+class FitReports:
+    """Reports of the last model fits of the server, shared by all sessions."""
+
+    def __init__(self, max_reports: int = 50):
+        self.reports: deque = deque(maxlen=max_reports)
+        self.lock = threading.Lock()
+
+    def add(self, report: Dict[str, Any]) -> None:
+        """Adds a fit report, dropping the oldest one above the maximum number of reports.
+
+        Parameters
+        ----------
+        report : Dict
+            Fit report, as returned by make_fit_report.
+        """
+        with self.lock:
+            self.reports.append(report)
+
+    def list_reports(self) -> List[Dict[str, Any]]:
+        """Returns the fit reports, the most recent first.
+
+        Returns
+        -------
+        List[Dict]
+            Fit reports.
+        """
+        with self.lock:
+            return list(reversed(self.reports))
+
+
+_fit_reports: Optional[FitReports] = None
+_fit_reports_lock = threading.Lock()
+
+
+def get_fit_reports(config: Dict[Any, Any]) -> FitReports:
+    """Returns the fit reports shared by all sessions of the server, creating them if needed.
+
+    Parameters
+    ----------
+    config : Dict
+        Lib configuration dictionary, containing the number of fit reports to keep.
+
+    Returns
+    -------
+    FitReports
+        Server-wide fit reports.
+    """
+    global _fit_reports
+    with _fit_reports_lock:
+        if _fit_reports is None:
+            _fit_reports = FitReports(config["jobs"]["max_fit_reports"])
+    return _fit_reports
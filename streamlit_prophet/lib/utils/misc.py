@@ -1,5 +1,10 @@
 from typing import Any, List
 
+import hashlib
+
+import numpy as np
+import pandas as pd
+
 
 def reverse_list(L: List[Any], N: int) -> List[Any]:
     """Cuts the list after the N-th element and reverses its order.
@@ -20,3 +25,108 @@ def reverse_list(L: List[Any], N: int) -> List[Any]:
         L = L[:N]
     reversed_list = [L[len(L) - 1 - i] for i, x in enumerate(L)]
     return reversed_list
+
+
+def format_dates(dates: Any, date_format: str) -> pd.Series:
+    """Formats dates as strings with a vectorized strftime.
+
+    Parameters
+    ----------
+    dates : Any
+        Dates to format (series, index, list of dates or datetimes).
+    date_format : str
+        Format used to convert dates into strings, for example "%Y/%m/%d".
+
+    Returns
+    -------
+    pd.Series
+        Formatted dates.
+    """
+    if isinstance(dates, pd.Series):
+        return pd.to_datetime(dates).dt.strftime(date_format)
+    return pd.Series(pd.to_datetime(dates)).dt.strftime(date_format)
+
+
+def to_plotly_dates(dates: Any) -> np.ndarray:
+    """Converts dates into ISO strings that plotly can format on the client side in hover templates.
+
+    Parameters
+    ----------
+    dates : Any
+        Dates to convert (series, index, list of dates or datetimes).
+
+    Returns
+    -------
+    np.ndarray
+        Dates as ISO strings.
+    """
+    return np.datetime_as_string(pd.to_datetime(dates).to_numpy(dtype="datetime64[s]"), unit="s")
+
+
+def get_date_hover_field(field: str, date_format: str) -> str:
+    """Returns a plotly hover template field that formats a date on the client side.
+
+    Parameters
+    ----------
+    field : str
+        Name of the trace attribute containing dates, for example "x" or "customdata".
+    date_format : str
+        d3 date format, for example "%A %b %d %Y".
+
+    Returns
+    -------
+    str
+        Hover template field.
+    """
+    return f"%{{{field}|{date_format}}}"
+
+
+def get_content_hash(*objects: Any) -> str:
+    """Computes a hash of the content of python objects, dataframes included.
+
+    Parameters
+    ----------
+    *objects : Any
+        Objects to hash: dataframes, series, arrays, dictionaries, lists or objects with a stable repr.
+
+    Returns
+    -------
+    str
+        Hexadecimal md5 hash of the objects content.
+    """
+    md5 = hashlib.md5()
+    for obj in objects:
+        _update_content_hash(md5, obj)
+    return md5.hexdigest()
+
+
+def _update_content_hash(md5: Any, obj: Any) -> None:
+    """Recursively feeds the content of an object to a hash.
+
+    Parameters
+    ----------
+    md5 : Any
+        Hash object to update.
+    obj : Any
+        Object to hash.
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        names = list(obj.columns) if isinstance(obj, pd.DataFrame) else [obj.name]
+        md5.update(f"{type(obj).__name__}{names}".encode())
+        md5.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, np.ndarray):
+        md5.update(f"{obj.dtype}{obj.shape}".encode())
+        md5.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        md5.update(b"{")
+        for key in sorted(obj.keys(), key=str):
+            md5.update(repr(key).encode())
+            _update_content_hash(md5, obj[key])
+        md5.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        md5.update(b"[")
+        for item in obj:
+            _update_content_hash(md5, item)
+        md5.update(b"]")
+    else:
+        md5.update(repr(obj).encode())
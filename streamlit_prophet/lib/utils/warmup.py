@@ -0,0 +1,90 @@
+from typing import Dict, List
+
+import importlib
+import time
+
+import numpy as np
+import pandas as pd
+
+HEAVY_MODULES = [
+    "prophet",
+    "cmdstanpy",
+    "holidays",
+    "plotly.graph_objects",
+    "plotly.express",
+    "streamlit_prophet.lib.models.prophet",
+    "streamlit_prophet.lib.exposition.visualize",
+]
+
+
+def preload_modules(modules: List[str]) -> Dict[str, float]:
+    """Imports modules, so that they are already loaded when the dashboard first needs them.
+
+    Parameters
+    ----------
+    modules : List[str]
+        Names of the modules to import.
+
+    Returns
+    -------
+    Dict[str, float]
+        Import duration of each module, in seconds.
+    """
+    timings = dict()
+    for module in modules:
+        start = time.perf_counter()
+        importlib.import_module(module)
+        timings[f"import {module}"] = time.perf_counter() - start
+    return timings
+
+
+def warm_up_stan_backend(n_points: int = 30, seed: int = 42) -> Dict[str, float]:
+    """Loads the Prophet Stan backend and runs a tiny fit and prediction,
+    so that the first fit of the dashboard doesn't pay backend loading and checks.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of daily data points of the warm-up dataset.
+    seed : int
+        Random seed for the warm-up dataset and fit.
+
+    Returns
+    -------
+    Dict[str, float]
+        Duration of backend loading, fit and prediction, in seconds.
+    """
+    from prophet import Prophet
+    from streamlit_prophet.lib.utils.logging import capture_fit_logs
+
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2021-01-01", periods=n_points, freq="D"),
+            "y": rng.normal(size=n_points).cumsum(),
+        }
+    )
+    timings = dict()
+    start = time.perf_counter()
+    model = Prophet(yearly_seasonality=False, daily_seasonality=False)
+    timings["load Stan backend"] = time.perf_counter() - start
+    start = time.perf_counter()
+    np.random.seed(seed)
+    with capture_fit_logs():
+        model.fit(df)
+    timings["warm-up fit"] = time.perf_counter() - start
+    start = time.perf_counter()
+    model.predict(model.make_future_dataframe(periods=7))
+    timings["warm-up predict"] = time.perf_counter() - start
+    return timings
+
+
+def warm_up() -> Dict[str, float]:
+    """Pre-imports heavy modules and warms up the Prophet Stan backend.
+
+    Returns
+    -------
+    Dict[str, float]
+        Duration of each warm-up step, in seconds.
+    """
+    return {**preload_modules(HEAVY_MODULES), **warm_up_stan_backend()}
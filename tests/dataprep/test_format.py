@@ -1,5 +1,7 @@
 import itertools
 
+import numpy as np
+import pandas as pd
 import pytest
 from streamlit_prophet.lib.dataprep.format import (
     filter_and_aggregate_df,
@@ -134,3 +136,30 @@ def test_resample_df(origin_dim, new_dim, agg):
     assert output.shape[0] < df.shape[0]
     # Output dataframe should have the same columns as input dataframe
     assert set(output.columns) == set(df.columns)
+
+
+@pytest.mark.parametrize(
+    "categories, freq",
+    [
+        (["a", "b", "c"], "W"),
+        (["a", "b", "c", "d", "e"], "M"),
+    ],
+)
+def test_one_hot_regressors_dtype(categories, freq):
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2020-01-01", periods=120, freq="D"),
+            "y": np.arange(120, dtype=float),
+            "cat": [categories[i % len(categories)] for i in range(120)],
+        }
+    )
+    output, _ = filter_and_aggregate_df(
+        df, dimensions={"agg": "Mean"}, config=config, date_col="", target_col=""
+    )
+    dummies = [f"cat_{category}" for category in categories]
+    # Categorical regressor is one-hot encoded into int8 dummies
+    assert set(output.columns) == {"ds", "y"} | set(dummies)
+    assert all(output[col].dtype == np.int8 for col in dummies)
+    resampled = resample_df(output, resampling=make_resampling_test(freq=freq, agg="Mean"))
+    # Dummies are still stored as int8 after resampling
+    assert all(resampled[col].dtype == np.int8 for col in dummies)
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import pytest
+from streamlit_prophet.lib.exposition.downsampling import (
+    downsample_figure,
+    lttb_indices,
+    minmax_indices,
+)
+
+
+@pytest.mark.parametrize(
+    "n, n_out",
+    [(10000, 500), (1001, 1000), (100, 500), (50, 3)],
+)
+def test_lttb_indices(n, n_out):
+    x, y = np.arange(n, dtype=float), np.random.randn(n)
+    output = lttb_indices(x, y, n_out)
+    # The number of points kept is the point budget, unless there are less points than the budget
+    assert len(output) == min(n, n_out)
+    # Indices are strictly increasing, and first and last points are always kept
+    assert (np.diff(output) > 0).all() and output[0] == 0 and output[-1] == n - 1
+
+
+@pytest.mark.parametrize(
+    "n, n_out",
+    [(10000, 500), (1001, 1000), (100, 500), (999, 7)],
+)
+def test_minmax_indices(n, n_out):
+    y = np.random.randn(n)
+    y[np.random.choice(n, n // 10)] = np.nan
+    output = minmax_indices(y, n_out)
+    # The number of points kept doesn't exceed the point budget, unless there are less points than the budget
+    assert len(output) <= min(n, n_out)
+    # Global min and max values are always kept
+    assert np.nanargmin(y) in output and np.nanargmax(y) in output
+
+
+@pytest.mark.parametrize(
+    "max_points, expected_len",
+    [(1000, 1000), (False, 5000), (10000, 5000)],
+)
+def test_downsample_figure(max_points, expected_len):
+    df = pd.DataFrame({"ds": pd.date_range("2020-01-01", periods=5000, freq="H")})
+    df["y"] = np.random.randn(len(df))
+    fig = px.line(df, x="ds", y="y")
+    output = downsample_figure(fig, max_points)
+    # Displayed figure has at most max_points points per trace
+    assert len(output.data[0].y) == expected_len
+    # Input figure is left at full resolution
+    assert len(fig.data[0].y) == len(df)
@@ -0,0 +1,144 @@
+import base64
+import importlib.util
+import io
+from zipfile import ZipFile
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from plotly.offline import get_plotlyjs
+from streamlit_prophet.lib.exposition.export import (
+    create_report_zip_file,
+    downcast_dataframe,
+    get_available_data_formats,
+    get_dataframe_bytes,
+    get_dataframe_download_link,
+    write_report_html,
+)
+from streamlit_prophet.lib.utils.load import load_config
+
+config, _, _ = load_config(
+    "config_streamlit.toml", "config_instructions.toml", "config_readme.toml"
+)
+
+
+@pytest.mark.parametrize(
+    "report",
+    [
+        [],
+        [
+            {
+                "object": go.Figure(go.Scatter(x=[1, 2], y=[3, 4])),
+                "name": "overview",
+                "type": "plot",
+            },
+            {
+                "object": pd.DataFrame({"ds": ["2021-01-01"], "y": [1.5]}),
+                "name": "eval_data",
+                "type": "dataset",
+            },
+        ],
+    ],
+)
+@pytest.mark.parametrize("bundle_plots", [True, False])
+def test_create_report_zip_file(report, bundle_plots):
+    export_config = {**config, "export": {**config["export"], "bundle_plots": bundle_plots}}
+    zip_buffer, zip_name = create_report_zip_file(
+        report, export_config, False, False, True, {}, {}, {}, {}, "date", "target", {}
+    )
+    n_plots = len([x for x in report if x["type"] == "plot"])
+    with ZipFile(zip_buffer) as zip_file:
+        file_names = zip_file.namelist()
+        # The zip file contains the configs, one file per report component and the html report
+        assert len(file_names) == len(report) + 2 + (bundle_plots and n_plots > 0)
+        # All files are stored in a folder named after the zip file
+        assert all(name.startswith(zip_name.replace(".zip", "/")) for name in file_names)
+        # Datasets can be read back from the zip file
+        for x in report:
+            if x["type"] == "dataset":
+                with zip_file.open(f"{zip_name[:-4]}/data/{x['name']}.csv") as f:
+                    assert pd.read_csv(f).equals(x["object"])
+
+
+def read_dataframe_bytes(content, data_format):
+    if data_format == "parquet":
+        return pd.read_parquet(io.BytesIO(content))
+    if data_format == "feather":
+        return pd.read_feather(io.BytesIO(content))
+    return pd.read_csv(
+        io.BytesIO(content), compression={"csv.gz": "gzip", "csv.zst": "zstd"}.get(data_format)
+    )
+
+
+@pytest.mark.parametrize("data_format", get_available_data_formats())
+@pytest.mark.parametrize("downcast", [True, False])
+def test_get_dataframe_bytes(data_format, downcast):
+    df = pd.DataFrame({"x": np.linspace(0, 1, 100), "n": np.arange(100), "s": ["a", "b"] * 50})
+    output = read_dataframe_bytes(
+        get_dataframe_bytes(df, data_format, downcast=downcast), data_format
+    )
+    # The exported dataframe can be read back with the same columns and values
+    assert list(output.columns) == list(df.columns)
+    assert np.allclose(output["x"], df["x"], rtol=1e-6)
+    assert (output["n"] == df["n"]).all() and (output["s"] == df["s"]).all()
+    # Text formats are never downcasted
+    if data_format.startswith("csv"):
+        assert get_dataframe_bytes(df, data_format, downcast=downcast) == get_dataframe_bytes(
+            df, data_format
+        )
+
+
+@pytest.mark.parametrize(
+    "missing, expected",
+    [
+        ([], ["csv", "csv.gz", "csv.zst", "parquet", "feather"]),
+        (["zstandard"], ["csv", "csv.gz", "parquet", "feather"]),
+        (["pyarrow"], ["csv", "csv.gz", "csv.zst"]),
+    ],
+)
+def test_get_available_data_formats(monkeypatch, missing, expected):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util, "find_spec", lambda name: None if name in missing else find_spec(name)
+    )
+    # Formats whose packages are not installed are not offered
+    assert get_available_data_formats() == expected
+
+
+@pytest.mark.parametrize("data_format", get_available_data_formats())
+def test_get_dataframe_download_link(data_format):
+    df = pd.DataFrame({"x": [0.5, 1.5], "s": ["a", "b"]})
+    link = get_dataframe_download_link(df, "forecast", "Download", data_format)
+    # The link downloads a file with the extension of the requested format
+    assert f'download="forecast.{data_format}"' in link
+    # The dataframe can be read back from the link content
+    content = base64.b64decode(link.split("base64,")[1].split('"')[0])
+    output = read_dataframe_bytes(content, data_format)
+    assert (output["x"] == df["x"]).all() and (output["s"] == df["s"]).all()
+
+
+def test_downcast_dataframe():
+    df = pd.DataFrame({"x": [0.5, 1.5], "n": [1, 300], "s": ["a", "b"], "yhat": [0.1, 0.2]})
+    output = downcast_dataframe(df)
+    # Floats are stored as float32, integers with the smallest type and other columns are unchanged
+    # Point forecasts are kept at full precision
+    assert list(output.dtypes) == [np.float32, np.int16, object, np.float64]
+    # Input dataframe is not modified
+    assert df["x"].dtype == np.float64
+
+
+def test_write_report_html():
+    plots = [
+        {"object": go.Figure(go.Scatter(x=[1, 2], y=[3, 4], name="</script>")), "name": name}
+        for name in ["overview", "future_forecast"]
+    ]
+    file = io.StringIO()
+    write_report_html(plots, "report", file)
+    html = file.getvalue()
+    # Plotly.js is included only once whatever the number of plots
+    assert html.count(get_plotlyjs()) == 1
+    # Each plot has its own container and json data
+    assert html.count('class="plot"') == len(plots)
+    # Plot json can't close its script element
+    assert html.count("</script>") == 2 + len(plots)
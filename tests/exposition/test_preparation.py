@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from prophet import Prophet
+from streamlit_prophet.lib.exposition.preparation import (
+    get_forecast_components,
+    get_prefix_sums,
+    get_range_mean,
+    group_components,
+)
+from streamlit_prophet.lib.utils.logging import capture_fit_logs
+from tests.samples.df import make_test_df
+
+components_test = pd.DataFrame(
+    {
+        "trend": [1.0, 2.0, 3.0],
+        "Christmas": [0.5, np.nan, 0.0],
+        "New Year": [0.0, 1.0, 2.0],
+        "holidays": [0.5, 1.0, 2.0],
+    },
+    index=pd.date_range("2020-01-01", periods=3, name="ds"),
+)
+
+
+@pytest.mark.parametrize(
+    "mapping, expected",
+    [
+        (
+            {
+                "trend": ["trend"],
+                "Public holidays": ["Christmas", "New Year"],
+                "_to_drop_": ["holidays"],
+            },
+            {"trend": [1.0, 2.0, 3.0], "Public holidays": [0.5, 1.0, 2.0]},
+        ),
+        ({"trend": ["trend"]}, {"trend": [1.0, 2.0, 3.0]}),
+    ],
+)
+def test_group_components(mapping, expected):
+    output = group_components(components_test, mapping)
+    # Output columns are the mapping keys, except the ones to drop
+    assert list(output.columns) == list(expected.keys())
+    # Grouped columns are the sum of their components, null values being ignored
+    assert np.allclose(output.values, pd.DataFrame(expected).values)
+    # Output dataframe keeps the same date index
+    assert output.index.equals(components_test.index)
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date",
+    [
+        ("2019-03-01", "2019-03-02"),
+        ("2019-03-01", "2019-06-15"),
+        ("2010-01-01", "2030-01-01"),
+        ("2019-03-01", "2019-03-01"),
+        ("2025-01-01", "2026-01-01"),
+    ],
+)
+def test_get_range_mean(start_date, end_date):
+    df = make_test_df(
+        ds={"freq": "H"},
+        cols={"a": {}, "b": {"frac_nan": 0.1}},
+        start="2019-01-01",
+        end="2020-01-01",
+    ).sample(frac=1)
+    output = get_range_mean(get_prefix_sums(df), start_date, end_date)
+    mask = (df["ds"] >= pd.to_datetime(start_date)) & (df["ds"] < pd.to_datetime(end_date))
+    expected = df.loc[mask].mean(numeric_only=True)
+    # Range means from prefix sums are equal to the means of filtered rows, null values being ignored
+    assert np.allclose(output.values, expected[output.index].values, equal_nan=True)
+
+
+@pytest.mark.parametrize("include_yhat", [True, False])
+def test_get_forecast_components(include_yhat):
+    df = pd.DataFrame({"ds": pd.date_range("2021-01-01", periods=60), "y": np.arange(60.0)})
+    model = Prophet(yearly_seasonality=False, daily_seasonality=False, uncertainty_samples=0)
+    with capture_fit_logs():
+        model.fit(df)
+    forecast = model.predict(df[["ds"]])
+    components = get_forecast_components(model, forecast, include_yhat)
+    # Prediction is included only if requested
+    assert ("yhat" in components.columns) == include_yhat
+    # Modifying returned components doesn't modify the memoized ones
+    components["new_col"] = 0
+    assert "new_col" not in get_forecast_components(model, forecast, include_yhat).columns
@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+from prophet import Prophet
+from streamlit_prophet.lib.models.preparation import (
+    add_prophet_holidays,
+    get_model_fingerprint,
+    remove_empty_regressors,
+)
+from streamlit_prophet.lib.utils.logging import capture_fit_logs
+from tests.samples.dict import make_dates_test
+
+
+def fit_test_model(df: pd.DataFrame) -> Prophet:
+    model = Prophet()
+    with capture_fit_logs():
+        model.fit(df)
+    return model
+
+
+@pytest.mark.parametrize("n_days", [30, 100])
+def test_get_model_fingerprint(n_days):
+    df = pd.DataFrame({"ds": pd.date_range("2021-01-01", periods=n_days), "y": range(n_days)})
+    fingerprint = get_model_fingerprint(fit_test_model(df))
+    # Two models fitted the same way on the same data have the same fingerprint
+    assert fingerprint == get_model_fingerprint(fit_test_model(df))
+    # A model fitted on different data has a different fingerprint
+    assert fingerprint != get_model_fingerprint(fit_test_model(df.assign(y=df["y"] * 2)))
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([0, 0, 0], ["regressor2"]),
+        ([0, 1, 0], ["regressor1", "regressor2"]),
+        ([0, None, 0], ["regressor2"]),
+    ],
+)
+def test_remove_empty_regressors(values, expected):
+    df = pd.DataFrame({"regressor1": values, "regressor2": [1.5, 0, 2]})
+    params = {"regressors": {col: {"prior_scale": 10} for col in df.columns}, "other": {}}
+    output = remove_empty_regressors(params, df)
+    # Regressors that are always 0 in training data are removed
+    assert sorted(output["regressors"].keys()) == expected
+    # Other parameters are kept
+    assert output["other"] == params["other"]
+
+
+@pytest.mark.parametrize("school_holidays", [False, True])
+def test_add_prophet_holidays(school_holidays):
+    dates = make_dates_test(
+        train_start="2018-01-01",
+        train_end="2019-12-31",
+        val_start="2020-01-01",
+        val_end="2020-12-31",
+        forecast_start="2021-01-01",
+        forecast_end="2021-12-31",
+    )
+    holidays_params = {
+        "country": "FR",
+        "public_holidays": True,
+        "school_holidays": school_holidays,
+        "lockdown_events": [],
+    }
+    df = pd.DataFrame({"ds": pd.date_range("2018-01-01", "2019-12-31")})
+    df["y"] = 10.0 + 5 * ((df["ds"].dt.month == 12) & (df["ds"].dt.day == 25))
+    model = add_prophet_holidays(Prophet(), holidays_params, dates)
+    with capture_fit_logs():
+        model.fit(df)
+    forecast = model.predict(pd.DataFrame({"ds": pd.to_datetime(["2019-12-25", "2022-12-25"])}))
+    # Public holidays are predicted one year after the last date used to build holidays
+    assert forecast.loc[1, "Christmas Day"] == pytest.approx(forecast.loc[0, "Christmas Day"])
+    assert forecast.loc[1, "Christmas Day"] > 1
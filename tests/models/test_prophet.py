@@ -1,6 +1,19 @@
 import pytest
 from streamlit_prophet.lib.dataprep.split import get_train_set, get_train_val_sets
-from streamlit_prophet.lib.models.prophet import forecast_workflow
+from streamlit_prophet.lib.models.prophet import (
+    FUTURE_FIT_FULL,
+    FUTURE_FIT_REUSE,
+    FUTURE_FIT_WARM_START,
+    check_forecast_inputs,
+    forecast_eval,
+    forecast_eval_and_future,
+    forecast_future,
+    forecast_workflow,
+    get_early_stopping_bound,
+    get_future_fit_path,
+    instantiate_prophet_model,
+    is_eval_model_reusable,
+)
 from streamlit_prophet.lib.utils.load import load_config
 from tests.samples.df import df_test
 from tests.samples.dict import (
@@ -86,3 +99,176 @@ def test_forecast_workflow(use_cv, make_future_forecast, evaluate):
         assert datasets["future"].ds.nunique() > 0
         # Number of distinct dates in future dataframe = number of distinct dates in future forecast dataframe
         assert forecasts["future"].ds.nunique() == datasets["future"].ds.nunique()
+
+
+@pytest.mark.parametrize(
+    "folds_errors, n_folds, bound, expected",
+    [
+        ([0.2, 0.4], 4, "optimistic", 0.15),
+        ([0.2, 0.4], 4, "running_mean", 0.3),
+        ([0.1, 0.1, 0.1, 0.1], 4, "optimistic", 0.1),
+    ],
+)
+def test_get_early_stopping_bound(folds_errors, n_folds, bound, expected):
+    # Bound is the sum of errors divided by the total number of folds if optimistic,
+    # and the average error on evaluated folds otherwise
+    assert get_early_stopping_bound(folds_errors, n_folds, bound) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "reference, expected_folds",
+    [
+        (0.0, 2),
+        (1e9, 5),
+    ],
+)
+def test_forecast_eval_early_stopping(reference, expected_folds):
+    df = df_test[20]
+    params = make_params_test()
+    dates = make_dates_test()
+    dates["early_stopping"] = {
+        "metric": "MAE",
+        "reference": reference,
+        "bound": "optimistic",
+        "min_folds": 2,
+    }
+    datasets = get_train_set(df, dates, dict())
+    datasets, models, forecasts = forecast_eval(
+        config, True, make_resampling_test(), params, dates, datasets, dict(), dict()
+    )
+    # Cross-validation stops after the first batch of folds if the reference can't be beaten
+    assert forecasts["cv"].cutoff.nunique() == expected_folds
+    assert forecasts["cv_early_stopping"]["Folds evaluated"].iloc[-1] == expected_folds
+    assert forecasts["cv_early_stopping"]["Stopped"].iloc[-1] == (expected_folds < 5)
+    # Evaluated folds are the most recent ones
+    assert forecasts["cv"].cutoff.max() == max(dates["cutoffs"])
+
+
+@pytest.mark.parametrize(
+    "train_end, use_regressors, expected",
+    [
+        ("2020-01-01", True, True),
+        ("2019-12-31", True, False),
+        ("2020-01-01", False, False),
+    ],
+)
+def test_is_eval_model_reusable(train_end, use_regressors, expected):
+    df = df_test[20]
+    params = make_params_test(
+        regressors={col: {"prior_scale": 10, "mode": "additive"} for col in ["regressor1"]}
+    )
+    datasets = get_train_set(df, make_dates_test(train_end=train_end), dict())
+    datasets["full"] = df.copy()
+    # Evaluation model is reusable only if it was trained on the whole dataset with the same regressors
+    assert is_eval_model_reusable(datasets, params, use_regressors) == expected
+
+
+@pytest.mark.parametrize(
+    "train_end, warm_start, expected",
+    [
+        ("2020-01-01", False, FUTURE_FIT_REUSE),
+        ("2019-06-30", True, FUTURE_FIT_WARM_START),
+        ("2019-06-30", False, FUTURE_FIT_FULL),
+    ],
+)
+def test_forecast_future_fit_path(train_end, warm_start, expected):
+    df = df_test[20][["ds", "y"]]
+    params = make_params_test()
+    dates = make_dates_test(train_end=train_end)
+    datasets = get_train_set(df, dates, dict())
+    models = {"eval": instantiate_prophet_model(params, dates=dates)}
+    models["eval"].fit(datasets["train"], seed=config["global"]["seed"])
+    future_config = {**config, "model": {**config["model"], "warm_start_future": warm_start}}
+    datasets, models, forecasts = forecast_future(
+        future_config,
+        params,
+        make_cleaning_test(),
+        dates,
+        datasets,
+        models,
+        dict(),
+        df,
+        make_resampling_test(),
+        "ds",
+        "y",
+        make_dimensions_test(df, frac=1),
+        {"date_format": "%Y-%m-%d"},
+    )
+    # Future model is the evaluation model when it was trained on the whole dataset,
+    # and is initialized with the evaluation model parameters if warm start is enabled
+    assert get_future_fit_path(models) == expected
+    # Future forecast is made whatever the path
+    assert forecasts["future"].ds.nunique() == datasets["future"].ds.nunique()
+
+
+def test_forecast_eval_and_future():
+    df = df_test[20][["ds", "y"]]
+    params = make_params_test()
+    dates = make_dates_test()
+    parallel = forecast_eval_and_future(
+        config,
+        False,
+        params,
+        make_cleaning_test(),
+        dates,
+        get_train_val_sets(df, dates, config, dict()),
+        dict(),
+        dict(),
+        df,
+        make_resampling_test(),
+        "ds",
+        "y",
+        make_dimensions_test(df, frac=1),
+        {"date_format": "%Y-%m-%d"},
+    )
+    sequential = forecast_future(
+        config,
+        params,
+        make_cleaning_test(),
+        dates,
+        *forecast_eval(
+            config,
+            False,
+            make_resampling_test(),
+            params,
+            dates,
+            get_train_val_sets(df, dates, config, dict()),
+            dict(),
+            dict(),
+        ),
+        df,
+        make_resampling_test(),
+        "ds",
+        "y",
+        make_dimensions_test(df, frac=1),
+        {"date_format": "%Y-%m-%d"},
+    )
+    # Models fitted at the same time give the same forecasts as models fitted one after the other
+    for key in ["eval", "future"]:
+        assert parallel[2][key]["yhat"].equals(sequential[2][key]["yhat"])
+    # Model on the whole dataset is fitted separately from the evaluation model
+    assert get_future_fit_path(parallel[1]) == FUTURE_FIT_FULL
+
+
+def test_check_forecast_inputs():
+    df = df_test[20][["ds", "y"]]
+    dates = make_dates_test()
+    datasets = get_train_set(df, dates, dict())
+    check_forecast_inputs(
+        config,
+        True,
+        True,
+        True,
+        make_cleaning_test(),
+        make_resampling_test(),
+        make_params_test(),
+        dates,
+        datasets,
+        df,
+        "ds",
+        "y",
+        make_dimensions_test(df, frac=1),
+        {"date_format": "%Y-%m-%d"},
+    )
+    # Valid inputs pass the checks without modifying the datasets given to the workflow
+    assert set(datasets.keys()) == {"train"}
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from streamlit_prophet.lib.models.screening import (
+    correlation_scores,
+    estimate_fit_time_saving,
+    mutual_information_scores,
+    screen_regressors,
+)
+from tests.samples.dict import make_params_test
+
+
+def make_screening_df(n: int = 500, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2020-01-01", periods=n, freq="D"),
+            "strong": rng.normal(size=n),
+            "weak": rng.normal(size=n),
+            "noise": rng.normal(size=n),
+            "constant": np.ones(n),
+        }
+    )
+    df["y"] = 3 * df["strong"] + 0.5 * df["weak"] + rng.normal(scale=0.5, size=n)
+    return df
+
+
+@pytest.mark.parametrize("scores_func", [correlation_scores, mutual_information_scores])
+def test_scores(scores_func):
+    df = make_screening_df()
+    scores = scores_func(df, ["noise", "weak", "strong", "constant"])
+    # Regressors more related to the target have higher scores
+    assert scores["strong"] > scores["weak"] > scores["noise"]
+    # Constant regressors have a null score
+    assert scores["constant"] == pytest.approx(0)
+
+
+@pytest.mark.parametrize(
+    "method, budget, expected, frac_nan",
+    [
+        ("Correlation", 1, ["strong"], 0),
+        ("Mutual information", 2, ["strong", "weak"], 0),
+        ("Correlation", 0, ["constant", "noise", "strong", "weak"], 0),
+        ("Correlation", 1, ["strong"], 0.1),
+        ("Mutual information", 2, ["strong", "weak"], 0.1),
+    ],
+)
+def test_screen_regressors(method, budget, expected, frac_nan):
+    df = make_screening_df()
+    df.loc[df.sample(frac=frac_nan, random_state=42).index, "y"] = None
+    params = make_params_test(
+        regressors={col: {"prior_scale": 10} for col in ["noise", "weak", "strong", "constant"]}
+    )
+    params["screening"] = {"method": method, "budget": budget}
+    output, ranking = screen_regressors(params, df)
+    # Best regressors are kept within the budget, all of them if there is no budget,
+    # even if the target has missing values
+    assert sorted(output["regressors"].keys()) == expected
+    # Ranking contains all regressors, the best one first
+    assert len(ranking) == 4
+    assert ranking.loc[0, "Regressor"] == "strong"
+    assert ranking["Kept"].sum() == len(expected)
+    # Input parameters are not modified
+    assert len(params["regressors"]) == 4
+
+
+@pytest.mark.parametrize(
+    "n_regressors, n_kept, expected",
+    [
+        (26, 26, 0.0),
+        (26, 0, 0.5),
+        (100, 50, 50 / 126),
+    ],
+)
+def test_estimate_fit_time_saving(n_regressors, n_kept, expected):
+    # Default yearly and weekly seasonalities have 2 * (10 + 3) = 26 features
+    params = make_params_test(regressors={f"r{i}": dict() for i in range(n_regressors)})
+    # Saving is the share of model features removed
+    assert estimate_fit_time_saving(params, n_kept) == pytest.approx(expected)
@@ -0,0 +1,204 @@
+import json
+import threading
+import urllib.request
+from zipfile import ZipFile
+
+import numpy as np
+import pandas as pd
+import pytest
+import toml
+from prophet import Prophet
+from prophet.serialize import model_to_json
+from streamlit_prophet.lib.models.serving import (
+    ModelPool,
+    make_future_df,
+    make_server,
+    predict_batch,
+)
+from streamlit_prophet.lib.utils.experiments import save_experiment
+from streamlit_prophet.lib.utils.load import load_config
+
+config, _, _ = load_config(
+    "config_streamlit.toml", "config_instructions.toml", "config_readme.toml"
+)
+
+
+def make_fitted_model(regressor: bool = False) -> Prophet:
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {"ds": pd.date_range("2021-01-01", periods=60, freq="D"), "y": rng.normal(size=60)}
+    )
+    model = Prophet(yearly_seasonality=False, daily_seasonality=False, uncertainty_samples=10)
+    if regressor:
+        df["temperature"] = rng.normal(size=60)
+        model.add_regressor("temperature")
+    return model.fit(df)
+
+
+def make_zip_file(path, models, log_transform=False):
+    with ZipFile(path, "w") as zip_file:
+        for name, model in models.items():
+            zip_file.writestr(f"report/models/{name}.json", model_to_json(model))
+        zip_file.writestr(
+            "report/config/user_specifications.toml",
+            toml.dumps({"cleaning": {"log_transform": log_transform}}),
+        )
+    return path
+
+
+def test_predict_batch():
+    model = make_fitted_model(regressor=True)
+    dates = pd.date_range("2021-03-02", periods=5, freq="D")
+    futures = [
+        pd.DataFrame({"ds": dates, "temperature": 0.0}),
+        pd.DataFrame({"ds": dates[2:], "temperature": 0.0}),
+        pd.DataFrame({"ds": dates[::-1], "temperature": np.arange(5.0)}),
+    ]
+    forecasts = predict_batch(model, futures)
+    # Each request gets the same forecast as an individual prediction, in its own row order
+    for future, forecast in zip(futures, forecasts):
+        expected = model.predict(future).set_index("ds").loc[future["ds"], "yhat"]
+        assert list(forecast["ds"]) == list(future["ds"])
+        np.testing.assert_allclose(forecast["yhat"].values, expected.values)
+    # Forecasts have no missing value
+    assert all(forecast.notnull().all().all() for forecast in forecasts)
+
+
+def test_predict_batch_log_transform():
+    model = make_fitted_model()
+    future = pd.DataFrame({"ds": pd.date_range("2021-03-02", periods=3, freq="D")})
+    forecast = predict_batch(model, [future], log_transform=True)[0]
+    # Forecasts are exp transformed
+    np.testing.assert_allclose(
+        forecast["yhat"].values, np.exp(model.predict(future)["yhat"].values)
+    )
+
+
+@pytest.mark.parametrize(
+    "request_, expected_dates",
+    [
+        ({"horizon": 3}, ["2021-03-02", "2021-03-03", "2021-03-04"]),
+        ({"horizon": 2, "freq": "W"}, ["2021-03-07", "2021-03-14"]),
+        ({"dates": ["2021-04-01", "2021-04-05"]}, ["2021-04-01", "2021-04-05"]),
+    ],
+)
+def test_make_future_df(request_, expected_dates):
+    future = make_future_df(make_fitted_model(), request_)
+    # Future dates are built from horizon or given dates
+    assert list(future["ds"]) == list(pd.to_datetime(expected_dates))
+
+
+def test_make_future_df_missing_regressors():
+    # An error is raised if regressors values are missing
+    with pytest.raises(ValueError):
+        make_future_df(make_fitted_model(regressor=True), {"horizon": 3})
+
+
+def test_model_pool(tmp_path):
+    model = make_fitted_model()
+    zip_paths = [
+        make_zip_file(tmp_path / f"experiment_{i}.zip", {"eval": model, "future": model})
+        for i in range(2)
+    ]
+    pool = ModelPool(None, zip_paths, max_models=2)
+    # Models of all zip files are listed
+    assert sorted(pool.list_models()) == [
+        "experiment_0/eval",
+        "experiment_0/future",
+        "experiment_1/eval",
+        "experiment_1/future",
+    ]
+    pool.get("experiment_0/eval")
+    pool.get("experiment_0/future")
+    pool.get("experiment_0/eval")
+    pool.get("experiment_1/future")
+    # Least recently used model is unloaded above max_models
+    assert pool.loaded == ["experiment_0/eval", "experiment_1/future"]
+    assert pool.stats == {"hits": 1, "loads": 3, "evictions": 1}
+    # An error is raised for unknown models
+    with pytest.raises(KeyError):
+        pool.get("experiment_2/eval")
+
+
+def test_model_pool_concurrent_loads(tmp_path, monkeypatch):
+    model = make_fitted_model()
+    zip_path = make_zip_file(tmp_path / "experiment.zip", {"eval": model, "future": model})
+    pool = ModelPool(None, [zip_path])
+    pool.get("experiment/eval")
+    load, started, release = pool._load, threading.Event(), threading.Event()
+
+    def slow_load(model_id):
+        started.set()
+        release.wait(10)
+        return load(model_id)
+
+    monkeypatch.setattr(pool, "_load", slow_load)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pool.get("experiment/future")))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    started.wait(10)
+    # Loaded models are returned while another model is being loaded
+    assert pool.get("experiment/eval")["model"] is not None
+    assert pool.loaded == ["experiment/eval"]
+    release.set()
+    for thread in threads:
+        thread.join(10)
+    # Concurrent requests for a model being loaded share a single load
+    assert len(results) == 2 and results[0] is results[1]
+    assert pool.stats["loads"] == 2
+
+
+def test_model_pool_store(tmp_path):
+    model = make_fitted_model()
+    future = pd.DataFrame({"ds": pd.date_range("2021-03-02", periods=3, freq="D")})
+    experiment_id = save_experiment(
+        tmp_path,
+        {"cleaning": {"log_transform": True}},
+        dict(),
+        dict(),
+        dict(),
+        {"future": model},
+        dict(),
+        future,
+    )
+    pool = ModelPool(tmp_path)
+    # Models of stored experiments are listed and loaded with their specifications
+    assert pool.list_models() == [f"{experiment_id}/future"]
+    assert pool.get(f"{experiment_id}/future")["log_transform"]
+
+
+def test_forecast_server(tmp_path):
+    model = make_fitted_model()
+    pool = ModelPool(None, [make_zip_file(tmp_path / "experiment.zip", {"future": model})])
+    server = make_server(pool, {**config["serving"], "max_wait_ms": 100}, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    body = {
+        "requests": [
+            {"model": "experiment/future", "horizon": 3},
+            {"model": "experiment/future", "dates": ["2021-03-03"]},
+            {"model": "experiment/unknown", "horizon": 3},
+        ]
+    }
+    request = urllib.request.Request(f"{url}/predict", data=json.dumps(body).encode())
+    try:
+        with urllib.request.urlopen(request) as response:
+            forecasts = json.loads(response.read())["forecasts"]
+        with urllib.request.urlopen(f"{url}/models") as response:
+            models = json.loads(response.read())
+    finally:
+        server.shutdown()
+        server.server_close()
+    # Each request gets its forecast, or an error message
+    assert len(forecasts[0]["yhat"]) == 3
+    assert forecasts[1]["ds"] == ["2021-03-03 00:00:00"]
+    assert forecasts[1]["yhat"] == pytest.approx(forecasts[0]["yhat"][1:2])
+    assert "error" in forecasts[2]
+    # Requests received together are predicted in a single batch
+    assert models["models"] == ["experiment/future"]
+    assert models["batches"] == {"requests": 2, "batches": 1}
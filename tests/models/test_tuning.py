@@ -0,0 +1,122 @@
+import pytest
+from streamlit_prophet.lib.dataprep.split import get_train_set
+from streamlit_prophet.lib.models.tuning import (
+    _prune_candidates,
+    get_candidates,
+    get_rungs,
+    set_candidate_params,
+    set_tuned_defaults,
+    tune_params,
+)
+from streamlit_prophet.lib.utils.load import load_config
+from tests.samples.df import df_test
+from tests.samples.dict import make_dates_test, make_params_test, make_resampling_test
+
+config, _, _ = load_config(
+    "config_streamlit.toml", "config_instructions.toml", "config_readme.toml"
+)
+
+
+@pytest.mark.parametrize(
+    "method, n_candidates, expected",
+    [
+        ("Grid", 2, 12),
+        ("Random", 5, 5),
+        ("Successive halving", 20, 12),
+    ],
+)
+def test_get_candidates(method, n_candidates, expected):
+    search_space = {
+        "changepoint_prior_scale": [0.01, 0.1, 0.5],
+        "seasonality_prior_scale": [1, 10],
+        "yearly_fourier_order": [5, 10],
+    }
+    candidates = get_candidates(search_space, method, n_candidates, seed=42)
+    # Number of candidates is the grid size, or the number of sampled candidates if smaller
+    assert len(candidates) == expected
+    # Candidates are distinct
+    assert len({tuple(sorted(c.items())) for c in candidates}) == expected
+    # Candidates sampling is deterministic for a given seed
+    assert candidates == get_candidates(search_space, method, n_candidates, seed=42)
+
+
+@pytest.mark.parametrize(
+    "n_folds, method, expected",
+    [
+        (5, "Successive halving", [1, 2, 4, 5]),
+        (4, "Successive halving", [1, 2, 4]),
+        (1, "Successive halving", [1]),
+        (5, "Grid", [1, 5]),
+        (1, "Random", [1]),
+    ],
+)
+def test_get_rungs(n_folds, method, expected):
+    # Rungs are increasing numbers of folds ending with the total number of folds
+    assert get_rungs(n_folds, method) == expected
+
+
+def test_set_candidate_params():
+    params = make_params_test()
+    params["seasonalities"]["monthly"] = {"prophet_param": False}
+    params["seasonalities"]["custom"] = {
+        "prophet_param": False,
+        "custom_param": {"fourier_order": 3},
+    }
+    candidate = {
+        "changepoint_prior_scale": 0.5,
+        "yearly_fourier_order": 10,
+        "monthly_fourier_order": 5,
+        "custom_fourier_order": 7,
+    }
+    new_params = set_candidate_params(params, candidate)
+    # Prior scales are updated
+    assert new_params["prior_scale"]["changepoint_prior_scale"] == 0.5
+    # Fourier orders are updated for enabled seasonalities only
+    assert new_params["seasonalities"]["yearly"]["prophet_param"] == 10
+    assert new_params["seasonalities"]["monthly"]["prophet_param"] is False
+    assert new_params["seasonalities"]["custom"]["custom_param"]["fourier_order"] == 7
+    # Input parameters are left untouched
+    assert params["seasonalities"]["yearly"]["prophet_param"] == "auto"
+    # Tuned values become sidebar defaults
+    tuned_config = set_tuned_defaults(config, candidate)
+    assert tuned_config["model"]["changepoint_prior_scale"] == 0.5
+    assert tuned_config["model"]["fourier_order"]["yearly"] == 10
+    assert "fourier_order" not in config["model"]
+
+
+@pytest.mark.parametrize("method", ["Successive halving", "Grid"])
+def test_tune_params(method):
+    df = df_test[20]
+    params = make_params_test()
+    dates = make_dates_test(n_folds=2, folds_horizon=30)
+    train = get_train_set(df, dates, dict())["train"]
+    tuning = {
+        "method": method,
+        "n_candidates": 3,
+        "metric": "MAE",
+        "search_space": {"changepoint_prior_scale": [0.01, 0.5], "yearly_fourier_order": [3]},
+        "pruning_ratio": 1.5,
+        "n_jobs": 2,
+    }
+    results, best = tune_params(params, tuning, config, dates, make_resampling_test(), train)
+    # Results contain one row per candidate, the best one first
+    assert len(results) == 2
+    assert results.loc[0, "Folds evaluated"] == 2
+    # Best candidate contains a value for each tuned parameter
+    assert set(best.keys()) == set(tuning["search_space"].keys())
+    assert best["changepoint_prior_scale"] in [0.01, 0.5]
+
+
+@pytest.mark.parametrize(
+    "scores, expected",
+    [
+        ({0: [1.0], 1: [1.4], 2: [1.6]}, [0, 1]),
+        ({0: [0.0], 1: [0.0], 2: [0.5]}, [0, 1]),
+        ({0: [0.0, 0.0], 1: [1e-10, 0.0], 2: [1e-3, 0.0]}, [0, 1]),
+    ],
+)
+def test_prune_candidates(scores, expected):
+    tuning = {"method": "Grid", "pruning_ratio": 1.5}
+    # Candidates whose error is above pruning ratio times the best error are pruned,
+    # and candidates as good as a perfect fit are kept
+    assert _prune_candidates(list(scores.keys()), scores, tuning) == expected
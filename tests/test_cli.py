@@ -0,0 +1,32 @@
+import pytest
+import streamlit_prophet.app
+from streamlit_prophet.cli import deploy
+from streamlit_prophet.cli.__main__ import app
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_version():
+    result = runner.invoke(app, ["--version"])
+    # Version is printed without running any command
+    assert result.exit_code == 0
+    assert "streamlit_prophet version" in result.output
+
+
+@pytest.mark.parametrize("options, expected_warm_up", [([], True), (["--no-warm-up"], False)])
+def test_deploy_dashboard(monkeypatch, options, expected_warm_up):
+    calls = []
+    monkeypatch.setattr(deploy, "run_warm_up", lambda: calls.append("warm_up"))
+    monkeypatch.setattr(streamlit_prophet.app, "deploy_streamlit", lambda: calls.append("deploy"))
+    result = runner.invoke(app, ["deploy", "dashboard"] + options)
+    # Dashboard is deployed, after the warm-up unless it is disabled
+    assert result.exit_code == 0
+    assert calls == (["warm_up"] if expected_warm_up else []) + ["deploy"]
+
+
+def test_serve_help():
+    result = runner.invoke(app, ["serve", "--help"])
+    # Serve command options are documented
+    assert result.exit_code == 0
+    assert all(option in result.output for option in ["--zip", "--store", "--host", "--port"])
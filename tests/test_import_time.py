@@ -0,0 +1,52 @@
+from typing import Dict
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["prophet", "cmdstanpy", "plotly", "holidays", "vacances_scolaires_france"]
+
+
+def get_import_times(module: str) -> Dict[str, int]:
+    """Imports a module in a new interpreter and returns the cumulative import time
+    in microseconds of each imported module, parsed from python -X importtime output."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = dict()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "streamlit_prophet.lib.inputs.dataset",
+        "streamlit_prophet.lib.inputs.dataprep",
+        "streamlit_prophet.lib.inputs.params",
+        "streamlit_prophet.lib.inputs.dates",
+        "streamlit_prophet.lib.dataprep.format",
+        "streamlit_prophet.lib.models.tuning",
+        "streamlit_prophet.lib.exposition.experiments",
+    ],
+)
+def test_inputs_import_time(module):
+    import_times = get_import_times(module)
+    # Modules used before the forecast is launched don't import modelling and plotting libraries
+    assert module in import_times
+    assert [m for m in HEAVY_MODULES if m in import_times] == []
+
+
+def test_cli_import_time():
+    import_times = get_import_times("streamlit_prophet.cli.__main__")
+    # Cli doesn't import streamlit or modelling libraries, so that commands like --version are fast
+    assert [m for m in ["streamlit"] + HEAVY_MODULES if m in import_times] == []
+    assert import_times["streamlit_prophet.cli.__main__"] < 2_000_000
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+from streamlit_prophet.lib.utils.cache import SharedCache, get_object_size, shared_cache
+
+
+def test_shared_cache_hits_and_misses():
+    cache = SharedCache(max_memory_mb=1)
+    calls = []
+    for _ in range(3):
+        value = cache.get_or_compute("ns", "key", lambda: calls.append(1) or "value")
+    stats = cache.get_stats().set_index("namespace").loc["ns"]
+    # Value is computed once and then read from cache
+    assert value == "value"
+    assert len(calls) == 1
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+
+@pytest.mark.parametrize(
+    "max_memory_mb, n_entries, expected_entries",
+    [
+        (1, 3, 3),
+        (0.8, 3, 2),
+        (0.1, 3, 0),
+    ],
+)
+def test_shared_cache_eviction(max_memory_mb, n_entries, expected_entries):
+    cache = SharedCache(max_memory_mb=max_memory_mb)
+    for i in range(n_entries):
+        # Each value uses 0.3 MB
+        cache.get_or_compute("ns", str(i), lambda: np.zeros(int(0.3 * 1024**2 / 8)))
+    stats = cache.get_stats().set_index("namespace").loc["ns"]
+    # Least recently used entries are evicted to respect the memory budget
+    assert stats["entries"] == expected_entries
+    assert cache.memory <= cache.max_memory
+    if 0 < expected_entries < n_entries:
+        assert f"ns:{n_entries - 1}" in cache.entries
+        assert stats["evictions"] == n_entries - expected_entries
+
+
+def test_shared_cache_decorator():
+    calls = []
+
+    @shared_cache("test_decorator", ignore=["progress"])
+    def make_df(n, progress=None):
+        calls.append(n)
+        return {"df": pd.DataFrame({"a": range(n)})}
+
+    first = make_df(3, progress=1)
+    first["df"]["a"] = 0
+    second = make_df(3, progress=2)
+    # Ignored keyword arguments are not part of the cache key
+    assert calls == [3]
+    # Cached dataframes are copied, so that modifying an output does not modify the cache
+    assert list(second["df"]["a"]) == [0, 1, 2]
+    make_df(4)
+    assert calls == [3, 4]
+
+
+@pytest.mark.parametrize(
+    "obj, min_size",
+    [
+        (np.zeros(1000), 8000),
+        (pd.DataFrame({"a": np.zeros(1000)}), 8000),
+        ({"a": np.zeros(1000), "b": [np.zeros(1000)]}, 16000),
+    ],
+)
+def test_get_object_size(obj, min_size):
+    # Size includes the size of arrays and dataframes contained in the object
+    assert get_object_size(obj) >= min_size
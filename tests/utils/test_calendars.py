@@ -0,0 +1,136 @@
+import pandas as pd
+import pytest
+from streamlit_prophet.lib.utils.calendars import (
+    CalendarRegistry,
+    HolidayCalendar,
+    get_calendar_registry,
+    get_holidays_df,
+    get_holidays_years,
+)
+from tests.samples.dict import make_dates_test
+
+
+@pytest.mark.parametrize(
+    "country, public_holidays, school_holidays, lockdown_events, expected_names",
+    [
+        ("FR", True, True, [], ["School holiday: Noël"]),
+        ("FR", False, True, [0], ["School holiday: Noël", "Lockdown 1"]),
+        ("FR", True, False, [0, 1], ["Lockdown 1", "Lockdown 2"]),
+    ],
+)
+def test_get_holidays_df(
+    country, public_holidays, school_holidays, lockdown_events, expected_names
+):
+    holidays_params = {
+        "country": country,
+        "public_holidays": public_holidays,
+        "school_holidays": school_holidays,
+        "lockdown_events": lockdown_events,
+    }
+    dates = make_dates_test()
+    holidays_df = get_holidays_df(holidays_params, dates)
+    # Holidays dataframe has Prophet format and contains the selected holidays
+    assert {"ds", "holiday", "lower_window", "upper_window"} == set(holidays_df.columns)
+    assert set(expected_names).issubset(set(holidays_df["holiday"]))
+    # Public holidays are added by Prophet instead, for any predicted year
+    assert "Christmas Day" not in set(holidays_df["holiday"])
+    # Holidays dataframe is built once and shared by all models with the same parameters
+    assert get_holidays_df(dict(holidays_params), make_dates_test()) is holidays_df
+
+
+def test_get_holidays_df_empty():
+    holidays_params = {
+        "country": "US",
+        "public_holidays": True,
+        "school_holidays": False,
+        "lockdown_events": [],
+    }
+    # No holidays dataframe is returned if no holiday other than public holidays is selected
+    assert get_holidays_df(holidays_params, make_dates_test()) is None
+
+
+def test_get_holidays_years():
+    dates = make_dates_test(train_start="2012-03-01", forecast_end="2021-01-31")
+    dates["early_stopping"] = {"metric": "MAPE"}
+    # Years range covers all dates, other keys are ignored
+    assert get_holidays_years(dates) == (2012, 2021)
+
+
+def make_calendar_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ds": ["2021-05-01", "2019-12-26", "2020-05-01", "2019-05-01", "2020-12-26"],
+            "holiday": ["Fair", "Boxing day", "Fair", "Fair", "Boxing day"],
+            "upper_window": [2, 0, 2, 2, 0],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "start, end, holidays, expected_dates",
+    [
+        (
+            "2019-01-01",
+            "2022-01-01",
+            None,
+            ["2019-05-01", "2019-12-26", "2020-05-01", "2020-12-26", "2021-05-01"],
+        ),
+        ("2020-01-01", "2021-01-01", None, ["2020-05-01", "2020-12-26"]),
+        ("2019-01-01", "2022-01-01", ["Fair"], ["2019-05-01", "2020-05-01", "2021-05-01"]),
+        ("2022-01-01", "2023-01-01", None, []),
+    ],
+)
+def test_holiday_calendar(start, end, holidays, expected_dates):
+    calendar = HolidayCalendar("Test", make_calendar_df)
+    holidays_df = calendar.get_holidays_df(start, end, holidays)
+    # Holidays of the date range are returned sorted by date
+    assert list(holidays_df["ds"]) == list(pd.to_datetime(expected_dates))
+    # Holidays names and windows are kept
+    assert list(holidays_df.columns) == ["ds", "holiday", "lower_window", "upper_window"]
+    assert all(holidays_df.loc[holidays_df["holiday"] == "Fair", "upper_window"] == 2)
+    assert all(holidays_df["lower_window"] == 0)
+    # Calendar names are sorted
+    assert calendar.holidays == ["Boxing day", "Fair"]
+
+
+def test_calendar_registry():
+    registry = CalendarRegistry()
+    registry.register("UK", "events", "Events", make_calendar_df)
+    # Calendars are registered by country
+    assert list(registry.get_calendars("UK").keys()) == ["events"]
+    assert registry.get_calendars("US") == dict()
+    # An error is raised if a calendar is not registered for a country
+    with pytest.raises(KeyError):
+        registry.get_calendar("US", "events")
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet"])
+def test_get_holidays_df_custom_calendar(tmp_path, extension):
+    path = tmp_path / f"calendar.{extension}"
+    if extension == "csv":
+        make_calendar_df().to_csv(path, index=False)
+    else:
+        make_calendar_df().assign(ds=lambda x: pd.to_datetime(x["ds"])).to_parquet(path)
+    calendar_id = f"test_{extension}"
+    config = {"calendars": {calendar_id: {"name": "Events", "country": "PL", "path": str(path)}}}
+    registry = get_calendar_registry(config)
+    # Custom calendar of the config is registered for its country
+    assert registry.get_calendar("PL", calendar_id).name == "Events"
+    holidays_params = {
+        "country": "PL",
+        "public_holidays": False,
+        "school_holidays": False,
+        "lockdown_events": [],
+        "calendars": [calendar_id],
+    }
+    dates = make_dates_test(
+        train_start="2020-01-01",
+        train_end="2020-03-31",
+        val_start="2020-04-01",
+        val_end="2020-06-30",
+        forecast_start="2020-07-01",
+        forecast_end="2020-12-31",
+    )
+    holidays_df = get_holidays_df(holidays_params, dates)
+    # Holidays of the custom calendar are included for the years of the dates only
+    assert list(holidays_df["ds"]) == list(pd.to_datetime(["2020-05-01", "2020-12-26"]))
@@ -0,0 +1,199 @@
+import io
+import json
+from zipfile import ZipFile
+
+import pytest
+import streamlit as st
+from streamlit.runtime.scriptrunner import StopException
+from streamlit_prophet.lib.dataprep.split import get_train_set, get_train_val_sets
+from streamlit_prophet.lib.evaluation.metrics import get_global_metrics
+from streamlit_prophet.lib.evaluation.preparation import get_evaluation_df
+from streamlit_prophet.lib.exposition.export import get_experiment_specs
+from streamlit_prophet.lib.models.prophet import forecast_workflow
+from streamlit_prophet.lib.utils.experiments import (
+    delete_experiment,
+    load_experiment,
+    load_experiment_zip,
+    load_experiments_index,
+    save_experiment,
+    write_experiment_to_zip,
+)
+from streamlit_prophet.lib.utils.load import load_config, load_experiment_file
+from tests.samples.df import df_test
+from tests.samples.dict import (
+    make_cleaning_test,
+    make_dates_test,
+    make_dimensions_test,
+    make_eval_test,
+    make_params_test,
+    make_resampling_test,
+)
+
+config, _, _ = load_config(
+    "config_streamlit.toml", "config_instructions.toml", "config_readme.toml"
+)
+
+
+@pytest.mark.parametrize("use_cv, make_future_forecast", [(True, False), (False, True)])
+def test_save_and_load_experiment(tmp_path, use_cv, make_future_forecast):
+    df = df_test[20]
+    params = make_params_test()
+    dates = make_dates_test()
+    cleaning = make_cleaning_test()
+    resampling = make_resampling_test()
+    dimensions = make_dimensions_test(df, frac=1)
+    eval = {**make_eval_test(), "set": "Validation"}
+    datasets = (
+        get_train_set(df, dates, dict())
+        if use_cv
+        else get_train_val_sets(df, dates, config, dict())
+    )
+    datasets, models, forecasts = forecast_workflow(
+        config,
+        use_cv,
+        make_future_forecast,
+        True,
+        cleaning,
+        resampling,
+        params,
+        dates,
+        datasets,
+        df,
+        "ds",
+        "y",
+        dimensions,
+        {"date_format": "%Y-%m-%d"},
+    )
+    specs = get_experiment_specs(
+        use_cv,
+        make_future_forecast,
+        True,
+        cleaning,
+        resampling,
+        params,
+        dates,
+        "ds",
+        "y",
+        dimensions,
+    )
+    specs["evaluation"] = eval
+    evaluation_df = get_evaluation_df(datasets, forecasts, dates, eval, use_cv)
+    metrics = get_global_metrics(evaluation_df, eval, dates, resampling, use_cv, config)
+    experiment_id = save_experiment(
+        tmp_path, specs, metrics, {"training_and_forecast": 1.0}, datasets, models, forecasts, df
+    )
+    index = load_experiments_index(tmp_path)
+    # The experiment is listed in the index with its metrics and timings
+    assert list(index["id"]) == [experiment_id]
+    assert index.loc[0, "RMSE"] == pytest.approx(metrics["RMSE"])
+    assert index.loc[0, "training_and_forecast (s)"] == 1.0
+    experiment = load_experiment(tmp_path, experiment_id)
+    # Stored models and forecasts are restored
+    assert set(experiment["models"]) == set(models)
+    assert all(experiment["forecasts"][k].equals(forecasts[k]) for k in forecasts)
+    # Metrics computed on restored artifacts are the same as the original ones
+    restored_evaluation_df = get_evaluation_df(
+        experiment["datasets"],
+        experiment["forecasts"],
+        experiment["specs"]["dates"],
+        experiment["specs"]["evaluation"],
+        use_cv,
+    )
+    restored_metrics = get_global_metrics(
+        restored_evaluation_df,
+        experiment["specs"]["evaluation"],
+        experiment["specs"]["dates"],
+        experiment["specs"]["resampling"],
+        use_cv,
+        config,
+    )
+    assert restored_metrics == pytest.approx(metrics)
+    # Restored models make the same predictions as the original ones
+    for name, model in models.items():
+        future = model.history[["ds"]].tail(10)
+        assert experiment["models"][name].predict(future)["yhat"].values == pytest.approx(
+            model.predict(future)["yhat"].values
+        )
+    delete_experiment(tmp_path, experiment_id)
+    # Deleted experiments are removed from the index
+    assert len(load_experiments_index(tmp_path)) == 0
+
+
+@pytest.mark.parametrize("tampered", [None, "model", "data"])
+def test_write_and_load_experiment_zip(tmp_path, monkeypatch, tampered):
+    df = df_test[20]
+    dates = make_dates_test()
+    datasets, models, forecasts = forecast_workflow(
+        config,
+        False,
+        True,
+        True,
+        make_cleaning_test(),
+        make_resampling_test(),
+        make_params_test(),
+        dates,
+        get_train_val_sets(df, dates, config, dict()),
+        df,
+        "ds",
+        "y",
+        make_dimensions_test(df, frac=1),
+        {"date_format": "%Y-%m-%d"},
+    )
+    specs = {"dates": dates, "evaluation": make_eval_test()}
+    zip_path = tmp_path / "report.zip"
+    with ZipFile(zip_path, "w") as zip_file:
+        write_experiment_to_zip(
+            zip_file,
+            "report",
+            {
+                "specs": specs,
+                "models": models,
+                "datasets": datasets,
+                "forecasts": forecasts,
+                "df": df,
+            },
+        )
+    if tampered is not None:
+        tamper_zip_file(zip_path, tampered, df)
+        # Models or data that don't match the fingerprint are rejected
+        with pytest.raises(ValueError, match="fingerprint"):
+            load_experiment_zip(zip_path)
+        # An error is displayed in the app instead of a crash
+        errors = []
+        monkeypatch.setattr(st, "error", errors.append)
+        with pytest.raises(StopException):
+            load_experiment_file.__wrapped__(zip_path)
+        assert len(errors) == 1 and "can't be loaded" in errors[0]
+        return
+    experiment = load_experiment_zip(zip_path)
+    # Specs, datasets and forecasts are restored
+    assert experiment["specs"]["evaluation"] == specs["evaluation"]
+    assert experiment["specs"]["dates"]["train_start_date"] == dates["train_start_date"]
+    assert set(experiment["datasets"]) == set(datasets) - {"uploaded"}
+    assert all(experiment["forecasts"][k].equals(forecasts[k]) for k in forecasts)
+    assert experiment["df"].equals(df)
+    # Restored models make the same predictions as the original ones
+    for name, model in models.items():
+        future = model.history[["ds"]].tail(10)
+        assert experiment["models"][name].predict(future)["yhat"].values == pytest.approx(
+            model.predict(future)["yhat"].values
+        )
+
+
+def tamper_zip_file(zip_path, tampered, df):
+    """Replaces the content of the first model or of the model input data of an experiment zip file."""
+    with ZipFile(zip_path) as zip_file:
+        contents = {name: zip_file.read(name) for name in zip_file.namelist()}
+    if tampered == "model":
+        name = sorted(n for n in contents if "/experiment/models/" in n)[0]
+        model_json = json.loads(contents[name])
+        model_json["params"]["k"][0][0] += 1
+        contents[name] = json.dumps(model_json).encode()
+    else:
+        name = [n for n in contents if n.endswith("/experiment/model_input_data.parquet")][0]
+        buffer = io.BytesIO()
+        df.assign(y=df["y"] + 1).to_parquet(buffer)
+        contents[name] = buffer.getvalue()
+    with ZipFile(zip_path, "w") as zip_file:
+        for name, content in contents.items():
+            zip_file.writestr(name, content)
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+import streamlit as st
+from streamlit_prophet.lib.utils.jobs import DONE, FAILED, JobRunner
+
+
+def _wait_and_add(event, x, y, progress=None):
+    if progress is not None:
+        progress(0.5, "Half done")
+    event.wait(10)
+    return x + y
+
+
+def _fail():
+    raise ValueError("Bad input")
+
+
+def test_job_runner_dedupe():
+    runner = JobRunner(max_workers=2)
+    event = threading.Event()
+    job = runner.submit("key", "add", _wait_and_add, event, 1, 2, report_progress=True)
+    same_job = runner.submit("key", "add", _wait_and_add, event, 1, 2, report_progress=True)
+    # A job submitted twice with the same key is run only once
+    assert job is same_job
+    assert len(runner.list_jobs()) == 1
+    event.set()
+    job.future.result(10)
+    # Job result and status are stored in the job
+    assert job.status == DONE
+    assert job.result == 3
+    assert job.progress == 1
+    assert job.duration >= 0
+
+
+def test_job_runner_failure():
+    runner = JobRunner(max_workers=1)
+    job = runner.submit("key", "fail", _fail)
+    job.future.result(10)
+    # Exceptions raised by the job are stored as an error message
+    assert job.status == FAILED
+    assert "Bad input" in job.error
+    # A failed job is returned as is when submitted again, so that its error can be displayed
+    assert runner.submit("key", "fail", _fail) is job
+    runner.discard("key")
+    # A discarded job is run again when submitted again
+    assert runner.submit("key", "fail", _fail) is not job
+
+
+def _stop():
+    st.stop()
+
+
+def test_job_runner_stop():
+    runner = JobRunner(max_workers=1)
+    job = runner.submit("key", "stop", _stop)
+    job.future.result(10)
+    # Jobs stopped by st.stop are marked as failed instead of staying running
+    assert job.status == FAILED
+    assert job.is_finished
+
+
+@pytest.mark.parametrize("max_finished_jobs", [0, 2])
+def test_job_runner_eviction(max_finished_jobs):
+    runner = JobRunner(max_workers=1, max_finished_jobs=max_finished_jobs)
+    event = threading.Event()
+    event.set()
+    for i in range(4):
+        runner.submit(str(i), "add", _wait_and_add, event, i, i).future.result(10)
+    runner.submit("last", "add", _wait_and_add, event, 0, 0).future.result(10)
+    # Only the most recent finished jobs are kept, in addition to the last submitted one
+    assert len(runner.list_jobs()) == max_finished_jobs + 1
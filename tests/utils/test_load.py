@@ -1,6 +1,12 @@
 import pandas as pd
 import pytest
-from streamlit_prophet.lib.utils.load import download_toy_dataset, load_config
+import requests
+from streamlit_prophet.lib.utils.load import (
+    download_toy_dataset,
+    get_bundled_dataset_path,
+    load_config,
+    load_local_dataset,
+)
 
 config, _, _ = load_config(
     "config_streamlit.toml", "config_instructions.toml", "config_readme.toml"
@@ -18,9 +24,81 @@ config, _, _ = load_config(
         for dataset in config["datasets"].keys()
     ],
 )
-def test_download_toy_dataset(url, date, target):
-    output = download_toy_dataset(url)
+def test_download_toy_dataset(url, date, target, tmp_path):
+    output = download_toy_dataset(url, str(tmp_path))
     # The output is a pandas dataframe
     assert isinstance(output, pd.DataFrame)
     # Date and target columns are in the output dataframe columns
     assert all([x in output.columns for x in [date, target]])
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or dict()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+def test_download_toy_dataset_cache(tmp_path, monkeypatch):
+    url = "https://example.com/data/sales.csv"
+    calls = []
+
+    def fake_get(url, headers, timeout):
+        calls.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, b"date,sales\n2021-01-01,1\n2021-01-02,2\n", {"ETag": '"v1"'})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    download = download_toy_dataset.__wrapped__
+    first = download(url, str(tmp_path), 1, 3600)
+    second = download(url, str(tmp_path), 1, 3600)
+    # Dataset is stored on disk and read again without network access
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    # Stored dataset is revalidated with its ETag once it is too old
+    third = download(url, str(tmp_path), 1, 0)
+    assert calls[-1] == {"If-None-Match": '"v1"'}
+    pd.testing.assert_frame_equal(first, third)
+
+    def failing_get(url, headers, timeout):
+        raise requests.ConnectionError("Network is unreachable")
+
+    monkeypatch.setattr(requests, "get", failing_get)
+    # Stored dataset is used when the server can't be reached
+    pd.testing.assert_frame_equal(first, download(url, str(tmp_path), 1, 0))
+    # An error is raised when the server can't be reached and the dataset was never downloaded
+    with pytest.raises(requests.ConnectionError):
+        download("https://example.com/data/other.csv", str(tmp_path), 1, 0)
+    # Bundled sample is used when the server can't be reached and a toy dataset was never downloaded
+    toy_url = config["datasets"]["Retail"]["url"]
+    pd.testing.assert_frame_equal(
+        download(toy_url, str(tmp_path), 1, 0), pd.read_csv(get_bundled_dataset_path(toy_url))
+    )
+
+
+@pytest.mark.parametrize("dataset", list(config["datasets"].keys()))
+def test_get_bundled_dataset_path(dataset):
+    path = get_bundled_dataset_path(config["datasets"][dataset]["url"])
+    # Every toy dataset has a bundled sample, with its date and target columns
+    assert path.exists()
+    columns = pd.read_csv(path, nrows=0).columns
+    assert {config["datasets"][dataset]["date"], config["datasets"][dataset]["target"]} <= set(
+        columns
+    )
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "feather"])
+def test_load_local_dataset(tmp_path, extension):
+    df = pd.DataFrame({"date": ["2021-01-01", "2021-01-02"], "sales": [1, 2]})
+    path = tmp_path / f"dataset.{extension}"
+    if extension == "csv":
+        df.to_csv(path, index=False)
+    else:
+        getattr(df, f"to_{extension}")(path)
+    # Local datasets are loaded whatever their format
+    pd.testing.assert_frame_equal(load_local_dataset(str(path)), df)
@@ -0,0 +1,83 @@
+import logging
+import threading
+
+import pytest
+from streamlit_prophet.lib.utils.logging import FitReports, capture_fit_logs, get_stan_iterations
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_capture_fit_logs_threads():
+    logger = logging.getLogger("cmdstanpy")
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    captured, started, logged = [], threading.Event(), threading.Event()
+
+    def fit():
+        with capture_fit_logs() as logs:
+            started.set()
+            logger.info("fit thread message")
+            logged.wait(10)
+        captured.extend(logs.messages)
+
+    thread = threading.Thread(target=fit)
+    thread.start()
+    started.wait(10)
+    logger.info("other thread message")
+    logged.set()
+    thread.join(10)
+    logger.removeHandler(handler)
+    # Logs of the capturing thread are captured instead of being sent to the logger handlers
+    assert captured == ["cmdstanpy - INFO - fit thread message"]
+    # Logs of other threads are still sent to the handlers during the capture
+    assert handler.messages == ["other thread message"]
+
+
+def test_capture_fit_logs_nested():
+    logger = logging.getLogger("prophet")
+    with capture_fit_logs() as outer:
+        with capture_fit_logs() as inner:
+            logger.info("inner message")
+        logger.info("outer message")
+    # Logs are captured by the innermost capture only
+    assert inner.messages == ["prophet - INFO - inner message"]
+    assert outer.messages == ["prophet - INFO - outer message"]
+
+
+@pytest.mark.parametrize(
+    "stan_output, expected",
+    [
+        (
+            "Initial log joint probability = -22.5\n"
+            "    Iter      log prob        ||dx||      ||grad||\n"
+            "      99       145.303   2.60485e-06       69.9642\n"
+            "     154       145.324   8.45475e-09        57.972\n"
+            "Optimization terminated normally:",
+            154,
+        ),
+        (
+            "Iteration 1. Log joint probability =    10.2. Improved by 10.2.\n"
+            "Iteration 12. Log joint probability =    17.6. Improved by 2.5e-09.",
+            12,
+        ),
+        ("", None),
+    ],
+)
+def test_get_stan_iterations(stan_output, expected):
+    # Number of iterations is read from LBFGS and Newton optimization outputs
+    assert get_stan_iterations(stan_output) == expected
+
+
+def test_fit_reports():
+    reports = FitReports(max_reports=2)
+    for i in range(3):
+        reports.add({"model": f"model_{i}"})
+    # Only the most recent reports are kept, the most recent first
+    assert [r["model"] for r in reports.list_reports()] == ["model_2", "model_1"]
@@ -1,5 +1,13 @@
+import datetime
+
+import pandas as pd
 import pytest
-from streamlit_prophet.lib.utils.misc import reverse_list
+from streamlit_prophet.lib.utils.misc import (
+    format_dates,
+    get_content_hash,
+    reverse_list,
+    to_plotly_dates,
+)
 
 
 @pytest.mark.parametrize(
@@ -13,3 +21,55 @@ from streamlit_prophet.lib.utils.misc import reverse_list
 def test_reverse_list(L, N, expected):
     # The output list has the expected elements in the right order
     assert reverse_list(L, N) == expected
+
+
+@pytest.mark.parametrize(
+    "dates, date_format, expected",
+    [
+        (pd.Series(pd.date_range("2021-01-01", periods=2, freq="H")), "%H:%M", ["00:00", "01:00"]),
+        (
+            [datetime.date(2021, 1, 1), datetime.date(2021, 3, 4)],
+            "%Y/%m/%d",
+            ["2021/01/01", "2021/03/04"],
+        ),
+        (
+            pd.date_range("2021-12-31", periods=2, freq="D"),
+            "%A %b %d %Y",
+            ["Friday Dec 31 2021", "Saturday Jan 01 2022"],
+        ),
+    ],
+)
+def test_format_dates(dates, date_format, expected):
+    # Dates are formatted like with a strftime on each element
+    assert list(format_dates(dates, date_format)) == expected
+
+
+@pytest.mark.parametrize(
+    "dates, expected",
+    [
+        (pd.Series(pd.to_datetime(["2021-01-01 10:30:00"])), ["2021-01-01T10:30:00"]),
+        (
+            [datetime.date(2021, 1, 1), datetime.date(2021, 3, 4)],
+            ["2021-01-01T00:00:00", "2021-03-04T00:00:00"],
+        ),
+    ],
+)
+def test_to_plotly_dates(dates, expected):
+    # Dates are converted into ISO strings
+    assert list(to_plotly_dates(dates)) == expected
+
+
+@pytest.mark.parametrize(
+    "obj, same_obj, other_obj",
+    [
+        (pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 3]})),
+        (pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"b": [1, 2]})),
+        ({"x": 1, "y": [1, 2]}, {"y": [1, 2], "x": 1}, {"x": 1, "y": [2, 1]}),
+        ({"df": pd.Series([1.0])}, {"df": pd.Series([1.0])}, {"df": pd.Series([2.0])}),
+    ],
+)
+def test_get_content_hash(obj, same_obj, other_obj):
+    # Objects with the same content have the same hash
+    assert get_content_hash(obj) == get_content_hash(same_obj)
+    # Objects with a different content have different hashes
+    assert get_content_hash(obj) != get_content_hash(other_obj)
@@ -0,0 +1,18 @@
+import sys
+
+from streamlit_prophet.lib.utils.warmup import preload_modules, warm_up_stan_backend
+
+
+def test_preload_modules():
+    timings = preload_modules(["json", "plotly.graph_objects"])
+    # Modules are imported and their import duration is returned
+    assert "plotly.graph_objects" in sys.modules
+    assert list(timings.keys()) == ["import json", "import plotly.graph_objects"]
+    assert all(duration >= 0 for duration in timings.values())
+
+
+def test_warm_up_stan_backend():
+    timings = warm_up_stan_backend(n_points=20)
+    # Backend loading, fit and prediction are timed
+    assert list(timings.keys()) == ["load Stan backend", "warm-up fit", "warm-up predict"]
+    assert all(duration >= 0 for duration in timings.values())